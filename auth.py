@@ -8,8 +8,9 @@ import os
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 import jwt
+import orjson
 
 
 # Session expiry: 24 hours
@@ -77,23 +78,26 @@ def get_token_from_request(request) -> Optional[str]:
     return None
 
 
-def require_auth(request) -> Optional[JSONResponse]:
+# 401 bodies, encoded once (every API handler's auth check can return one)
+_AUTH_REQUIRED_BODY = orjson.dumps(
+    {"success": False, "error": {"message": "Authentication required", "code": "UNAUTHORIZED"}}
+)
+_INVALID_TOKEN_BODY = orjson.dumps(
+    {"success": False, "error": {"message": "Invalid or expired token", "code": "UNAUTHORIZED"}}
+)
+
+
+def require_auth(request) -> Optional[Response]:
     """
     Check if request is authenticated.
-    Returns None if authenticated, or a 401 JSONResponse if not.
+    Returns None if authenticated, or a 401 JSON response if not.
     """
     token = get_token_from_request(request)
 
     if not token:
-        return JSONResponse(
-            {"success": False, "error": {"message": "Authentication required", "code": "UNAUTHORIZED"}},
-            status_code=401
-        )
+        return Response(_AUTH_REQUIRED_BODY, status_code=401, media_type="application/json")
 
     if not validate_session(token):
-        return JSONResponse(
-            {"success": False, "error": {"message": "Invalid or expired token", "code": "UNAUTHORIZED"}},
-            status_code=401
-        )
+        return Response(_INVALID_TOKEN_BODY, status_code=401, media_type="application/json")
 
     return None
@@ -30,12 +30,29 @@ from db import (
     validate_person_type,
     validate_person_side,
     DATABASE_URL,
+    DB_POOL_MAX,
     _NOT_PROVIDED,
     serialize_value,
     serialize_row,
     serialize_rows,
+    like_pattern,
+    warm_pool,
+    ping,
+    schema_lock,
+    start_change_listener,
     get_connection,
     get_cursor,
+    server_cursor,
+    execute_prepared,
+    warm_statement,
+    update_changed,
+    transaction,
+    cached,
+    data_version,
+    bump_data_version,
+    cache_stats,
+    READ_CACHE_TTL,
+    LOOKUP_CACHE_TTL,
     drop_all_tables,
     migrate_db,
     init_db,
@@ -51,6 +68,9 @@ from db import (
     delete_jurisdiction,
     get_all_cases,
     get_case_by_id,
+    get_cases_full,
+    get_cases_by_ids,
+    iter_cases_full,
     get_case_by_name,
     get_case_summary,
     get_all_case_names,
@@ -89,11 +109,14 @@ from db import (
     search_events,
     get_calendar,
     add_activity,
+    add_activities,
     get_all_activities,
     get_activities,
+    get_activity_summary,
     update_activity,
     delete_activity,
     add_note,
+    add_notes,
     update_note,
     delete_note,
     get_notes,
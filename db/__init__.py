@@ -32,12 +32,23 @@ from .validation import (
 # Connection and database management
 from .connection import (
     DATABASE_URL,
+    DB_POOL_MAX,
     _NOT_PROVIDED,
     serialize_value,
     serialize_row,
     serialize_rows,
+    like_pattern,
+    warm_pool,
+    ping,
+    schema_lock,
+    start_change_listener,
     get_connection,
     get_cursor,
+    server_cursor,
+    execute_prepared,
+    warm_statement,
+    update_changed,
+    transaction,
     drop_all_tables,
     migrate_db,
     init_db,
@@ -47,6 +58,16 @@ from .connection import (
     seed_db,
 )
 
+# Read cache
+from .cache import (
+    cached,
+    data_version,
+    bump_data_version,
+    cache_stats,
+    READ_CACHE_TTL,
+    LOOKUP_CACHE_TTL,
+)
+
 # Jurisdiction operations
 from .jurisdictions import (
     get_jurisdictions,
@@ -61,6 +82,9 @@ from .jurisdictions import (
 from .cases import (
     get_all_cases,
     get_case_by_id,
+    get_cases_full,
+    get_cases_by_ids,
+    iter_cases_full,
     get_case_by_name,
     get_case_summary,
     get_all_case_names,
@@ -115,8 +139,10 @@ from .events import (
 # Activity operations
 from .activities import (
     add_activity,
+    add_activities,
     get_all_activities,
     get_activities,
+    get_activity_summary,
     update_activity,
     delete_activity,
 )
@@ -124,6 +150,7 @@ from .activities import (
 # Note operations
 from .notes import (
     add_note,
+    add_notes,
     update_note,
     delete_note,
     get_notes,
@@ -160,15 +187,18 @@ from .proceedings import (
 # Webhook operations
 from .webhooks import (
     create_webhook_log,
+    create_webhook_logs_bulk,
+    copy_webhook_logs,
     get_webhook_log_by_id,
     get_webhook_log_by_idempotency_key,
     get_webhook_logs,
+    iter_webhook_logs,
     get_pending_webhook_logs,
     update_webhook_log,
+    update_webhook_logs_bulk,
     mark_webhook_processing,
     mark_webhook_completed,
     mark_webhook_failed,
-    idempotency_key_exists,
     delete_webhook_log,
 )
 
@@ -194,12 +224,23 @@ __all__ = [
     "validate_case_person_role",
     # Connection
     "DATABASE_URL",
+    "DB_POOL_MAX",
     "_NOT_PROVIDED",
     "serialize_value",
     "serialize_row",
     "serialize_rows",
+    "like_pattern",
+    "warm_pool",
+    "ping",
+    "schema_lock",
+    "start_change_listener",
     "get_connection",
     "get_cursor",
+    "server_cursor",
+    "execute_prepared",
+    "warm_statement",
+    "update_changed",
+    "transaction",
     "drop_all_tables",
     "migrate_db",
     "init_db",
@@ -207,6 +248,13 @@ __all__ = [
     "seed_expertise_types",
     "seed_person_types",
     "seed_db",
+    # Cache
+    "cached",
+    "data_version",
+    "bump_data_version",
+    "cache_stats",
+    "READ_CACHE_TTL",
+    "LOOKUP_CACHE_TTL",
     # Jurisdictions
     "get_jurisdictions",
     "get_jurisdiction_by_id",
@@ -217,6 +265,9 @@ __all__ = [
     # Cases
     "get_all_cases",
     "get_case_by_id",
+    "get_cases_full",
+    "get_cases_by_ids",
+    "iter_cases_full",
     "get_case_by_name",
     "get_case_summary",
     "get_all_case_names",
@@ -259,12 +310,15 @@ __all__ = [
     "get_calendar",
     # Activities
     "add_activity",
+    "add_activities",
     "get_all_activities",
     "get_activities",
+    "get_activity_summary",
     "update_activity",
     "delete_activity",
     # Notes
     "add_note",
+    "add_notes",
     "update_note",
     "delete_note",
     "get_notes",
@@ -292,14 +346,17 @@ __all__ = [
     "update_proceeding_judge",
     # Webhooks
     "create_webhook_log",
+    "create_webhook_logs_bulk",
+    "copy_webhook_logs",
     "get_webhook_log_by_id",
     "get_webhook_log_by_idempotency_key",
     "get_webhook_logs",
+    "iter_webhook_logs",
     "get_pending_webhook_logs",
     "update_webhook_log",
+    "update_webhook_logs_bulk",
     "mark_webhook_processing",
     "mark_webhook_completed",
     "mark_webhook_failed",
-    "idempotency_key_exists",
     "delete_webhook_log",
 ]
@@ -4,7 +4,9 @@ Activity/time tracking functions.
 
 from typing import Optional, List
 
-from .connection import get_cursor, serialize_row, serialize_rows
+from psycopg2.extras import execute_values
+
+from .connection import get_cursor, execute_prepared, update_changed, serialize_row, serialize_rows
 from .validation import validate_date_format
 
 
@@ -14,14 +16,36 @@ def add_activity(case_id: int, description: str, activity_type: str,
     validate_date_format(date, "date")
 
     with get_cursor() as cur:
-        cur.execute("""
+        execute_prepared(cur, "activity_insert", """
             INSERT INTO activities (case_id, description, type, date, minutes)
-            VALUES (%s, %s, %s, %s, %s)
+            VALUES ($1, $2, $3, $4, $5)
             RETURNING id, case_id, description, type, date, minutes, created_at
         """, (case_id, description, activity_type, date, minutes))
         return serialize_row(dict(cur.fetchone()))
 
 
+def add_activities(activities: List[tuple]) -> List[dict]:
+    """Add several (case_id, description, activity_type, date, minutes) activities in one INSERT.
+
+    Results are in input order: rows are inserted by an ordinal column, so
+    their serial ids ascend in input order, and the results are sorted by id
+    (RETURNING order itself isn't guaranteed).
+    """
+    for activity in activities:
+        validate_date_format(activity[3], "date")
+
+    with get_cursor() as cur:
+        rows = execute_values(cur, """
+            INSERT INTO activities (case_id, description, type, date, minutes)
+            SELECT v.case_id, v.description, v.type, v.date::date, v.minutes::integer
+            FROM (VALUES %s) AS v(ord, case_id, description, type, date, minutes)
+            ORDER BY v.ord
+            RETURNING id, case_id, description, type, date, minutes, created_at
+        """, [(i, *activity) for i, activity in enumerate(activities)],
+            page_size=len(activities), fetch=True)
+        return serialize_rows(sorted((dict(row) for row in rows), key=lambda row: row["id"]))
+
+
 def get_all_activities(case_id: int = None) -> List[dict]:
     """Get all activities, optionally filtered by case."""
     with get_cursor() as cur:
@@ -68,41 +92,58 @@ def get_activities(case_id: int = None) -> dict:
         return {"activities": serialize_rows([dict(row) for row in cur.fetchall()]), "total": total}
 
 
+def get_activity_summary(case_id: int = None) -> dict:
+    """Get activity counts and total minutes per case, aggregated in SQL."""
+    where_clause = "WHERE case_id = %s" if case_id else ""
+    params = [case_id] if case_id else []
+
+    with get_cursor() as cur:
+        cur.execute(f"""
+            SELECT a.case_id, c.case_name, c.short_name, a.activity_count, a.total_minutes
+            FROM (
+                SELECT case_id, COUNT(*) AS activity_count,
+                       COALESCE(SUM(minutes), 0) AS total_minutes
+                FROM activities
+                {where_clause}
+                GROUP BY case_id
+            ) a
+            JOIN cases c ON a.case_id = c.id
+            ORDER BY c.case_name
+        """, params)
+        cases = [dict(row) for row in cur.fetchall()]
+
+    return {"cases": cases, "total_minutes": sum(c["total_minutes"] for c in cases)}
+
+
 def update_activity(activity_id: int, date: str = None, description: str = None,
                     activity_type: str = None, minutes: int = None) -> Optional[dict]:
     """Update an activity."""
-    updates = []
+    columns = []
     params = []
 
     if date is not None:
         validate_date_format(date, "date")
-        updates.append("date = %s")
+        columns.append("date")
         params.append(date)
 
     if description is not None:
-        updates.append("description = %s")
+        columns.append("description")
         params.append(description)
 
     if activity_type is not None:
-        updates.append("type = %s")
+        columns.append("type")
         params.append(activity_type)
 
     if minutes is not None:
-        updates.append("minutes = %s")
+        columns.append("minutes")
         params.append(minutes)
 
-    if not updates:
+    if not columns:
         return None
 
-    params.append(activity_id)
-
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE activities SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, case_id, description, type, date, minutes
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "activities", activity_id, columns, params,
+                             returning="id, case_id, description, type, date, minutes")
         return serialize_row(dict(row)) if row else None
 
 
@@ -0,0 +1,155 @@
+"""
+In-process read cache for hot dashboard queries.
+
+Cached results are tagged with a data version that db.connection bumps after
+every committed transaction that wrote rows, so a write made through this
+process invalidates every entry immediately. Writes made by other worker
+processes arrive as Postgres notifications (see
+db.connection.start_change_listener); the TTL bounds staleness if that
+listener is not running or has lost its connection.
+"""
+
+import time
+import threading
+from functools import wraps
+
+_lock = threading.Lock()
+_version = 0
+
+# Per-thread flag: the open transaction has written rows not yet committed
+_pending = threading.local()
+
+# Default TTL for cached list/search reads
+READ_CACHE_TTL = 30
+
+# TTL for small lookup tables (person types, jurisdictions) that rarely change
+LOOKUP_CACHE_TTL = 300
+
+# Hit/miss counters of every cached function, by qualified name
+_stats = {}
+
+
+def data_version() -> int:
+    """Return the current data version (increases after every committed write)."""
+    return _version
+
+
+def bump_data_version():
+    """Invalidate all cached reads. Called after a transaction that wrote rows commits."""
+    global _version
+    with _lock:
+        _version += 1
+
+
+def note_write():
+    """Record that the current thread's open transaction wrote rows."""
+    _pending.wrote = True
+
+
+def reset_writes():
+    """Forget uncommitted writes (new transaction or rollback)."""
+    _pending.wrote = False
+
+
+def has_pending_writes() -> bool:
+    """Whether the current thread's open transaction has written rows."""
+    return getattr(_pending, "wrote", False)
+
+
+def commit_writes():
+    """Bump the data version if the transaction that just committed wrote rows."""
+    if getattr(_pending, "wrote", False):
+        _pending.wrote = False
+        bump_data_version()
+
+
+def cache_stats() -> dict:
+    """Return hits, misses, shared (waited on another thread's query) and size per cached function."""
+    return {name: dict(counts) for name, counts in _stats.items()}
+
+
+def cached(ttl: float, maxsize: int = 128):
+    """Cache a db read function's result per argument tuple.
+
+    An entry is reused while it is younger than `ttl` seconds and no write has
+    committed since it was computed. At most `maxsize` argument tuples are
+    kept (oldest evicted first); the first store after a write drops every
+    entry from before it, so stale results don't hold memory or crowd out
+    live ones. Inside a transaction that has uncommitted writes the cache is
+    bypassed. Callers must not mutate the result.
+
+    Concurrent misses for the same arguments run the query once: the first
+    caller computes it and the others wait for its result (if it raises, each
+    waiter runs the query itself).
+    """
+    def decorator(fn):
+        entries = {}
+        # Data version every stored entry was computed at
+        generation = [None]
+        # key -> (version, done event, [result]) for queries in progress
+        inflight = {}
+        entries_lock = threading.Lock()
+        counts = _stats.setdefault(
+            f"{fn.__module__}.{fn.__qualname__}",
+            {"hits": 0, "misses": 0, "shared": 0, "size": 0}
+        )
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if getattr(_pending, "wrote", False):
+                return fn(*args, **kwargs)
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            now = time.monotonic()
+            # Read the version before running the query so a write that lands
+            # mid-query leaves the entry already stale
+            version = _version
+            entry = entries.get(key)
+            if entry is not None and entry[0] == version and entry[1] > now:
+                counts["hits"] += 1
+                return entry[2]
+
+            with entries_lock:
+                flight = inflight.get(key)
+                leader = flight is None or flight[0] != version
+                if leader:
+                    flight = (version, threading.Event(), [])
+                    inflight[key] = flight
+                    counts["misses"] += 1
+                else:
+                    counts["shared"] += 1
+            if not leader:
+                flight[1].wait()
+                if flight[2]:
+                    return flight[2][0]
+                return fn(*args, **kwargs)
+
+            try:
+                value = fn(*args, **kwargs)
+                flight[2].append(value)
+                with entries_lock:
+                    # A result from before the latest write could never be hit
+                    if version == _version:
+                        if version != generation[0]:
+                            entries.clear()
+                            generation[0] = version
+                        elif key not in entries and len(entries) >= maxsize:
+                            del entries[next(iter(entries))]
+                        entries[key] = (version, now + ttl, value)
+                        counts["size"] = len(entries)
+                return value
+            finally:
+                with entries_lock:
+                    if inflight.get(key) is flight:
+                        del inflight[key]
+                flight[1].set()
+
+        def cache_clear():
+            with entries_lock:
+                entries.clear()
+                generation[0] = None
+                counts["size"] = 0
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
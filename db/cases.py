@@ -3,84 +3,305 @@ Case CRUD operations.
 """
 
 import json
-from typing import Optional, List
+from collections import defaultdict
+from typing import Iterator, Optional, List
 
-from .connection import get_cursor, serialize_row, serialize_rows
+from .connection import (
+    get_cursor, execute_prepared, warm_statement, like_pattern, transaction, update_changed,
+    serialize_row, decode_cursor, keyset_page
+)
 from .validation import validate_case_status, validate_date_format
+from .cache import cached, READ_CACHE_TTL
+
+# Dashboard stats are polled on every dashboard load; a write through this
+# process invalidates them immediately, other workers' writes within this TTL
+DASHBOARD_STATS_TTL = 10
+
+# Columns update_case may write
+CASE_UPDATE_FIELDS = frozenset({
+    "case_name", "short_name", "status", "print_code",
+    "case_summary", "result", "date_of_injury", "case_numbers"
+})
+
+
+# Case list rows. The judge and client/defendant counts come from one pass
+# over the case's case_persons rows instead of three separate subqueries.
+_CASE_LIST_SQL = """
+    SELECT c.id, c.case_name, c.short_name, c.status, c.print_code,
+           cps.judge, cps.client_count, cps.defendant_count,
+           (SELECT COUNT(*) FROM tasks t WHERE t.case_id = c.id AND t.status = 'Pending') as pending_task_count,
+           (SELECT COUNT(*) FROM events e WHERE e.case_id = c.id AND e.date >= CURRENT_DATE) as upcoming_event_count
+    FROM cases c
+    CROSS JOIN LATERAL (
+        SELECT (array_agg(p.name) FILTER (WHERE cp.role = 'Judge'))[1] as judge,
+               COUNT(*) FILTER (WHERE cp.role = 'Client') as client_count,
+               COUNT(*) FILTER (WHERE cp.role = 'Defendant') as defendant_count
+        FROM case_persons cp
+        JOIN persons p ON cp.person_id = p.id
+        WHERE cp.case_id = c.id
+    ) cps
+    {where}
+    ORDER BY c.case_name, c.id
+    LIMIT {limit} OFFSET {offset}
+"""
 
+# First-page list queries behind the dashboard and case list, prepared on
+# every pooled connection at startup
+_CASE_COUNT_SQL = warm_statement("case_count", "SELECT COUNT(*) as total FROM cases c")
+_CASE_COUNT_BY_STATUS_SQL = warm_statement(
+    "case_count_by_status", "SELECT COUNT(*) as total FROM cases c WHERE c.status = $1")
+_CASE_LIST_PAGE_SQL = warm_statement(
+    "case_list", _CASE_LIST_SQL.format(where="", limit="$1", offset="$2"))
+_CASE_LIST_BY_STATUS_PAGE_SQL = warm_statement(
+    "case_list_by_status", _CASE_LIST_SQL.format(where="WHERE c.status = $1", limit="$2", offset="$3"))
 
-def get_all_cases(status_filter: Optional[str] = None, limit: int = None,
-                  offset: int = None) -> dict:
-    """Get all cases with optional status filter."""
-    conditions = []
-    params = []
-
-    if status_filter:
-        validate_case_status(status_filter)
-        conditions.append("c.status = %s")
-        params.append(status_filter)
+# Keyset condition: rows after the cursor's (case_name, id); NULL cursor = first page
+_CASE_AFTER = "({name}::text IS NULL OR (c.case_name, c.id) > ({name}, {id}::int))"
 
-    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
+@cached(ttl=READ_CACHE_TTL)
+def get_all_cases(status_filter: Optional[str] = None, limit: int = None,
+                  offset: int = None, count_only: bool = False, after: str = None,
+                  include_total: bool = True) -> dict:
+    """Get all cases with optional status filter.
+
+    The two query shapes (with and without a status filter) run as prepared
+    statements; LIMIT/OFFSET are parameters (NULL means no limit / no offset)
+    so paging doesn't create new shapes. With count_only, only the count
+    query runs and {"total": n} is returned. With include_total=False the
+    count is skipped and {"cases": [...], "has_more": bool} is returned.
+
+    Passing `after` (a cursor from a previous page's next_cursor, or "" for
+    the first page) switches to keyset pagination: offset is ignored, no
+    count runs, and {"cases": [...], "next_cursor": str | None} is returned.
+    """
+    if after is not None and not count_only:
+        return _get_cases_after(status_filter, limit, after)
+    with_total = include_total or count_only
+    # Without a count, one extra row tells whether another page exists
+    fetch = limit + 1 if limit and not with_total else limit
     with get_cursor() as cur:
-        # Get total count
-        cur.execute(f"SELECT COUNT(*) as total FROM cases c {where_clause}", params)
-        total = cur.fetchone()["total"]
+        if status_filter:
+            validate_case_status(status_filter)
+            if with_total:
+                execute_prepared(cur, "case_count_by_status", _CASE_COUNT_BY_STATUS_SQL,
+                                 (status_filter,))
+                total = cur.fetchone()["total"]
+                if count_only:
+                    return {"total": total}
+            execute_prepared(cur, "case_list_by_status", _CASE_LIST_BY_STATUS_PAGE_SQL,
+                             (status_filter, fetch or None, offset or None))
+        else:
+            if with_total:
+                execute_prepared(cur, "case_count", _CASE_COUNT_SQL)
+                total = cur.fetchone()["total"]
+                if count_only:
+                    return {"total": total}
+            execute_prepared(cur, "case_list", _CASE_LIST_PAGE_SQL,
+                             (fetch or None, offset or None))
+        cases = [dict(row) for row in cur.fetchall()]
 
-        # Build query with joins for counts and assigned judge
-        query = f"""
-            SELECT c.id, c.case_name, c.short_name, c.status, c.print_code,
-                   (SELECT p.name FROM case_persons cp
-                    JOIN persons p ON cp.person_id = p.id
-                    WHERE cp.case_id = c.id AND cp.role = 'Judge'
-                    LIMIT 1) as judge,
-                   (SELECT COUNT(*) FROM case_persons cp WHERE cp.case_id = c.id AND cp.role = 'Client') as client_count,
-                   (SELECT COUNT(*) FROM case_persons cp WHERE cp.case_id = c.id AND cp.role = 'Defendant') as defendant_count,
-                   (SELECT COUNT(*) FROM tasks t WHERE t.case_id = c.id AND t.status = 'Pending') as pending_task_count,
-                   (SELECT COUNT(*) FROM events e WHERE e.case_id = c.id AND e.date >= CURRENT_DATE) as upcoming_event_count
-            FROM cases c
-            {where_clause}
-            ORDER BY c.case_name
-        """
+    if with_total:
+        return {"cases": cases, "total": total}
+    has_more = bool(limit) and len(cases) > limit
+    return {"cases": cases[:limit] if has_more else cases, "has_more": has_more}
 
-        if limit:
-            query += f" LIMIT {limit}"
-        if offset:
-            query += f" OFFSET {offset}"
 
-        cur.execute(query, params)
-        cases = [dict(row) for row in cur.fetchall()]
+def _get_cases_after(status_filter: Optional[str], limit: Optional[int], after: str) -> dict:
+    """Keyset-paginated case list (see get_all_cases)."""
+    name, case_id = decode_cursor(after, str)
+    fetch = limit + 1 if limit else None
+    with get_cursor() as cur:
+        if status_filter:
+            validate_case_status(status_filter)
+            execute_prepared(cur, "case_page_by_status",
+                             _CASE_LIST_SQL.format(where="WHERE c.status = $1 AND " + _CASE_AFTER.format(name="$2", id="$3"),
+                                                   limit="$4", offset="0"),
+                             (status_filter, name, case_id, fetch))
+        else:
+            execute_prepared(cur, "case_page",
+                             _CASE_LIST_SQL.format(where="WHERE " + _CASE_AFTER.format(name="$1", id="$2"),
+                                                   limit="$3", offset="0"),
+                             (name, case_id, fetch))
+        cases, next_cursor = keyset_page([dict(row) for row in cur.fetchall()], limit, "case_name")
+
+    return {"cases": cases, "next_cursor": next_cursor}
+
+
+def _ts_json(col: str) -> str:
+    """SQL rendering a TIMESTAMP exactly as serialize_value() does (datetime.isoformat)."""
+    return (f"to_char({col}, 'YYYY-MM-DD\"T\"HH24:MI:SS') || CASE "
+            f"WHEN date_trunc('second', {col}) = {col} THEN '' "
+            f"ELSE to_char({col}, '.US') END")
+
+
+def _time_json(col: str) -> str:
+    """SQL rendering a TIME exactly as serialize_value() does (HH:MM)."""
+    return f"to_char({col}, 'HH24:MI')"
+
+
+# The case row plus every child collection as a JSON array, in one round trip.
+# Child values are rendered in SQL the same way serialize_row() would render
+# them in Python, so the result needs no per-row post-processing.
+_CASE_FULL_SELECT = f"""
+    SELECT c.*,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', p.id, 'person_type', p.person_type, 'name', p.name,
+                    'phones', p.phones, 'emails', p.emails, 'organization', p.organization,
+                    'attributes', p.attributes, 'person_notes', p.notes,
+                    'assignment_id', cp.id, 'role', cp.role, 'side', cp.side,
+                    'case_attributes', cp.case_attributes, 'case_notes', cp.case_notes,
+                    'is_primary', cp.is_primary, 'contact_via_person_id', cp.contact_via_person_id,
+                    'assigned_date', cp.assigned_date, 'assigned_at', {_ts_json("cp.created_at")},
+                    'contact_via_name', via.name)
+                ORDER BY CASE cp.role WHEN 'Client' THEN 1 WHEN 'Defendant' THEN 2 ELSE 3 END,
+                         p.name), '[]'::json)
+         FROM persons p
+         JOIN case_persons cp ON p.id = cp.person_id
+         LEFT JOIN persons via ON cp.contact_via_person_id = via.id
+         WHERE cp.case_id = c.id) AS _persons,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', a.id, 'date', a.date, 'description', a.description,
+                    'type', a.type, 'minutes', a.minutes)
+                ORDER BY a.date DESC), '[]'::json)
+         FROM activities a WHERE a.case_id = c.id) AS _activities,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', e.id, 'date', e.date, 'time', {_time_json("e.time")},
+                    'location', e.location, 'description', e.description,
+                    'document_link', e.document_link, 'calculation_note', e.calculation_note,
+                    'starred', e.starred)
+                ORDER BY e.date), '[]'::json)
+         FROM events e WHERE e.case_id = c.id) AS _events,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', t.id, 'due_date', t.due_date, 'completion_date', t.completion_date,
+                    'description', t.description, 'status', t.status, 'urgency', t.urgency,
+                    'event_id', t.event_id, 'sort_order', t.sort_order,
+                    'event_description', e.description)
+                ORDER BY t.sort_order ASC), '[]'::json)
+         FROM tasks t
+         LEFT JOIN events e ON t.event_id = e.id
+         WHERE t.case_id = c.id) AS _tasks,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', n.id, 'content', n.content,
+                    'created_at', {_ts_json("n.created_at")},
+                    'updated_at', {_ts_json("n.updated_at")})
+                ORDER BY n.created_at DESC), '[]'::json)
+         FROM notes n WHERE n.case_id = c.id) AS _notes,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', pr.id, 'case_id', pr.case_id, 'case_number', pr.case_number,
+                    'jurisdiction_id', pr.jurisdiction_id, 'sort_order', pr.sort_order,
+                    'is_primary', pr.is_primary, 'notes', pr.notes,
+                    'created_at', {_ts_json("pr.created_at")},
+                    'updated_at', {_ts_json("pr.updated_at")},
+                    'jurisdiction_name', j.name, 'local_rules_link', j.local_rules_link,
+                    'judges', (SELECT COALESCE(json_agg(json_build_object(
+                                       'person_id', pj.person_id, 'name', per.name,
+                                       'role', pj.role, 'sort_order', pj.sort_order)
+                                   ORDER BY pj.sort_order, pj.id), '[]'::json)
+                               FROM judges pj
+                               JOIN persons per ON pj.person_id = per.id
+                               WHERE pj.proceeding_id = pr.id))
+                ORDER BY pr.sort_order, pr.id), '[]'::json)
+         FROM proceedings pr
+         LEFT JOIN jurisdictions j ON pr.jurisdiction_id = j.id
+         WHERE pr.case_id = c.id) AS _proceedings
+    FROM cases c
+"""
+_CASE_FULL_SQL = warm_statement("case_full", _CASE_FULL_SELECT + "    WHERE c.id = $1\n")
+_CASE_FULL_BY_NAME_SQL = _CASE_FULL_SELECT + "    WHERE c.case_name = $1\n    LIMIT 1\n"
 
-    return {"cases": cases, "total": total}
+_CASE_CHILD_COLLECTIONS = ("persons", "activities", "events", "tasks", "notes", "proceedings")
 
 
 def get_case_by_id(case_id: int) -> Optional[dict]:
-    """Get full case details by ID with all related data."""
+    """Get full case details by ID with all related data.
+
+    The case and all of its child collections come back in a single query
+    (one JSON array per collection) instead of one query per child table.
+    It runs as a prepared statement, so its sizeable plan is built once per
+    connection.
+    """
     with get_cursor() as cur:
-        cur.execute("""
-            SELECT c.*
-            FROM cases c
-            WHERE c.id = %s
-        """, (case_id,))
-        case = cur.fetchone()
-        if not case:
-            return None
+        execute_prepared(cur, "case_full", _CASE_FULL_SQL, (case_id,))
+        row = cur.fetchone()
+    return _full_case(row) if row else None
+
 
-        result = serialize_row(dict(case))
+def get_cases_by_ids(case_ids: List[int]) -> List[dict]:
+    """Get several cases, each in the same shape as get_case_by_id(), in one query.
 
-        # Parse case_numbers JSONB
-        if result.get("case_numbers"):
-            case_nums = result["case_numbers"]
-            if isinstance(case_nums, str):
-                case_nums = json.loads(case_nums)
-            result["case_numbers"] = case_nums
+    Missing ids are skipped; cases come back ordered by name.
+    """
+    with get_cursor() as cur:
+        cur.execute(_CASE_FULL_SELECT + "    WHERE c.id = ANY(%s)\n    ORDER BY c.case_name\n",
+                    (list(case_ids),))
+        return [_full_case(row) for row in cur.fetchall()]
+
+
+def _full_case(row) -> dict:
+    """Turn a _CASE_FULL_SELECT row into the get_case_by_id() result."""
+    row = dict(row)
+    children = {key: row.pop(f"_{key}") for key in _CASE_CHILD_COLLECTIONS}
+    result = serialize_row(row)
+
+    # Parse case_numbers JSONB
+    if result.get("case_numbers"):
+        case_nums = result["case_numbers"]
+        if isinstance(case_nums, str):
+            case_nums = json.loads(case_nums)
+        result["case_numbers"] = case_nums
+    else:
+        result["case_numbers"] = []
+
+    # For backwards compatibility, expose each proceeding's first judge
+    for p in children["proceedings"]:
+        first_judge = p["judges"][0] if p["judges"] else None
+        p["judge_name"] = first_judge["name"] if first_judge else None
+        p["judge_id"] = first_judge["person_id"] if first_judge else None
+
+    result.update(children)
+    return result
+
+
+def get_cases_full(case_ids: List[int] = None) -> List[dict]:
+    """
+    Get cases with their complete related data (all cases if case_ids is None).
+
+    Each child table is fetched once for the whole batch with ANY(ids) and
+    grouped by case_id in Python, so the query count is fixed (~8) however
+    many cases are loaded, instead of one get_case_by_id() round of queries
+    per case.
+    """
+    with get_cursor() as cur:
+        # 1. Get the cases
+        if case_ids is None:
+            cur.execute("""
+                SELECT id, case_name, short_name, status, print_code, case_summary,
+                       result, date_of_injury, case_numbers, created_at, updated_at
+                FROM cases
+                ORDER BY case_name
+            """)
         else:
-            result["case_numbers"] = []
+            cur.execute("""
+                SELECT id, case_name, short_name, status, print_code, case_summary,
+                       result, date_of_injury, case_numbers, created_at, updated_at
+                FROM cases
+                WHERE id = ANY(%s)
+                ORDER BY case_name
+            """, (list(case_ids),))
+        cases = [dict(row) for row in cur.fetchall()]
+
+        if not cases:
+            return []
+
+        case_ids = [c["id"] for c in cases]
 
-        # Get persons assigned to this case
+        # 2. Batch fetch all persons for all cases
         cur.execute("""
-            SELECT p.id, p.person_type, p.name, p.phones, p.emails, p.organization,
-                   p.attributes, p.notes as person_notes,
+            SELECT cp.case_id,
+                   p.id as person_id, p.person_type, p.name, p.phones, p.emails,
+                   p.address, p.organization, p.attributes, p.notes as person_notes,
+                   p.archived,
                    cp.id as assignment_id, cp.role, cp.side, cp.case_attributes,
                    cp.case_notes, cp.is_primary, cp.contact_via_person_id,
                    cp.assigned_date, cp.created_at as assigned_at,
@@ -88,109 +309,163 @@ def get_case_by_id(case_id: int) -> Optional[dict]:
             FROM persons p
             JOIN case_persons cp ON p.id = cp.person_id
             LEFT JOIN persons via ON cp.contact_via_person_id = via.id
-            WHERE cp.case_id = %s
-            ORDER BY
+            WHERE cp.case_id = ANY(%s)
+            ORDER BY cp.case_id,
                 CASE cp.role
                     WHEN 'Client' THEN 1
                     WHEN 'Defendant' THEN 2
                     ELSE 3
                 END,
                 p.name
-        """, (case_id,))
-        result["persons"] = serialize_rows([dict(row) for row in cur.fetchall()])
+        """, (case_ids,))
+        persons_by_case = defaultdict(list)
+        for row in cur.fetchall():
+            row_dict = dict(row)
+            case_id = row_dict.pop("case_id")
+            persons_by_case[case_id].append(serialize_row(row_dict))
 
-        # Get activities
+        # 3. Batch fetch all tasks for all cases
         cur.execute("""
-            SELECT id, date, description, type, minutes
-            FROM activities WHERE case_id = %s ORDER BY date DESC
-        """, (case_id,))
-        result["activities"] = serialize_rows([dict(row) for row in cur.fetchall()])
+            SELECT case_id, id, due_date, completion_date, description, status, urgency,
+                   event_id, sort_order, created_at
+            FROM tasks
+            WHERE case_id = ANY(%s)
+            ORDER BY case_id, sort_order ASC
+        """, (case_ids,))
+        tasks_by_case = defaultdict(list)
+        for row in cur.fetchall():
+            row_dict = dict(row)
+            case_id = row_dict.pop("case_id")
+            tasks_by_case[case_id].append(serialize_row(row_dict))
 
-        # Get events (calendar events: hearings, depositions, filing deadlines, etc.)
+        # 4. Batch fetch all events for all cases
         cur.execute("""
-            SELECT id, date, time, location, description, document_link, calculation_note, starred
-            FROM events WHERE case_id = %s ORDER BY date
-        """, (case_id,))
-        result["events"] = serialize_rows([dict(row) for row in cur.fetchall()])
+            SELECT case_id, id, date, time, location, description, document_link,
+                   calculation_note, starred, created_at
+            FROM events
+            WHERE case_id = ANY(%s)
+            ORDER BY case_id, date
+        """, (case_ids,))
+        events_by_case = defaultdict(list)
+        for row in cur.fetchall():
+            row_dict = dict(row)
+            case_id = row_dict.pop("case_id")
+            events_by_case[case_id].append(serialize_row(row_dict))
 
-        # Get tasks
+        # 5. Batch fetch all notes for all cases
         cur.execute("""
-            SELECT t.id, t.due_date, t.completion_date, t.description, t.status, t.urgency, t.event_id, t.sort_order,
-                   e.description as event_description
-            FROM tasks t
-            LEFT JOIN events e ON t.event_id = e.id
-            WHERE t.case_id = %s ORDER BY t.sort_order ASC
-        """, (case_id,))
-        result["tasks"] = serialize_rows([dict(row) for row in cur.fetchall()])
+            SELECT case_id, id, content, created_at, updated_at
+            FROM notes
+            WHERE case_id = ANY(%s)
+            ORDER BY case_id, created_at DESC
+        """, (case_ids,))
+        notes_by_case = defaultdict(list)
+        for row in cur.fetchall():
+            row_dict = dict(row)
+            case_id = row_dict.pop("case_id")
+            notes_by_case[case_id].append(serialize_row(row_dict))
 
-        # Get notes
+        # 6. Batch fetch all activities for all cases
         cur.execute("""
-            SELECT id, content, created_at, updated_at
-            FROM notes WHERE case_id = %s ORDER BY created_at DESC
-        """, (case_id,))
-        result["notes"] = serialize_rows([dict(row) for row in cur.fetchall()])
+            SELECT case_id, id, date, description, type, minutes, created_at
+            FROM activities
+            WHERE case_id = ANY(%s)
+            ORDER BY case_id, date DESC
+        """, (case_ids,))
+        activities_by_case = defaultdict(list)
+        for row in cur.fetchall():
+            row_dict = dict(row)
+            case_id = row_dict.pop("case_id")
+            activities_by_case[case_id].append(serialize_row(row_dict))
 
-        # Get proceedings
+        # 7. Batch fetch all proceedings for all cases (with jurisdiction join)
         cur.execute("""
-            SELECT p.id, p.case_id, p.case_number, p.jurisdiction_id,
-                   p.sort_order, p.is_primary, p.notes, p.created_at, p.updated_at,
+            SELECT p.case_id, p.id, p.case_number, p.jurisdiction_id, p.sort_order,
+                   p.is_primary, p.notes, p.created_at, p.updated_at,
                    j.name as jurisdiction_name, j.local_rules_link
             FROM proceedings p
             LEFT JOIN jurisdictions j ON p.jurisdiction_id = j.id
-            WHERE p.case_id = %s
-            ORDER BY p.sort_order, p.id
-        """, (case_id,))
-        proceedings = [dict(row) for row in cur.fetchall()]
-
-        # Fetch judges for all proceedings in one query
-        if proceedings:
-            proceeding_ids = [p["id"] for p in proceedings]
+            WHERE p.case_id = ANY(%s)
+            ORDER BY p.case_id, p.sort_order, p.id
+        """, (case_ids,))
+        proceedings_by_case = defaultdict(list)
+        all_proceeding_ids = []
+        for row in cur.fetchall():
+            row_dict = dict(row)
+            case_id = row_dict.pop("case_id")
+            all_proceeding_ids.append(row_dict["id"])
+            proceedings_by_case[case_id].append(row_dict)
+
+        # 8. Batch fetch all judges for all proceedings
+        judges_by_proceeding = defaultdict(list)
+        if all_proceeding_ids:
             cur.execute("""
                 SELECT pj.proceeding_id, pj.person_id, pj.role, pj.sort_order,
-                       per.name as judge_name
+                       pj.created_at, per.name as judge_name
                 FROM judges pj
                 JOIN persons per ON pj.person_id = per.id
                 WHERE pj.proceeding_id = ANY(%s)
-                ORDER BY pj.sort_order, pj.id
-            """, (proceeding_ids,))
-
-            # Group judges by proceeding_id
-            judges_by_proceeding = {}
+                ORDER BY pj.proceeding_id, pj.sort_order, pj.id
+            """, (all_proceeding_ids,))
             for row in cur.fetchall():
                 pid = row["proceeding_id"]
-                if pid not in judges_by_proceeding:
-                    judges_by_proceeding[pid] = []
-                judges_by_proceeding[pid].append({
+                judges_by_proceeding[pid].append(serialize_row({
                     "person_id": row["person_id"],
                     "name": row["judge_name"],
                     "role": row["role"],
-                    "sort_order": row["sort_order"]
-                })
-
-            # Attach judges to proceedings
+                    "sort_order": row["sort_order"],
+                    "created_at": row["created_at"]
+                }))
+
+        # Assemble the results
+        result = []
+        for case_row in cases:
+            case_id = case_row["id"]
+            case_data = serialize_row(case_row)
+
+            # Parse case_numbers JSONB if it's a string
+            if case_data.get("case_numbers") and isinstance(case_data["case_numbers"], str):
+                case_data["case_numbers"] = json.loads(case_data["case_numbers"])
+
+            case_data["persons"] = persons_by_case.get(case_id, [])
+            case_data["tasks"] = tasks_by_case.get(case_id, [])
+            case_data["events"] = events_by_case.get(case_id, [])
+            case_data["notes"] = notes_by_case.get(case_id, [])
+            case_data["activities"] = activities_by_case.get(case_id, [])
+
+            # Add judges to proceedings
+            proceedings = proceedings_by_case.get(case_id, [])
             for p in proceedings:
                 p["judges"] = judges_by_proceeding.get(p["id"], [])
-                # For backwards compatibility, set judge_name from first judge
-                if p["judges"]:
-                    p["judge_name"] = p["judges"][0]["name"]
-                    p["judge_id"] = p["judges"][0]["person_id"]
-                else:
-                    p["judge_name"] = None
-                    p["judge_id"] = None
+            case_data["proceedings"] = [serialize_row(p) for p in proceedings]
 
-        result["proceedings"] = serialize_rows(proceedings)
+            result.append(case_data)
 
         return result
 
 
+def iter_cases_full(batch_size: int = 200) -> Iterator[dict]:
+    """
+    Stream all cases with their complete related data, batch by batch.
+
+    The case ids are read up front (and the connection returned), then each
+    batch of `batch_size` is loaded with get_cases_full(), so memory stays
+    bounded by one batch instead of the whole firm's data. No connection is
+    held while the next one is checked out (see _BlockingPool).
+    """
+    with get_cursor(dict_cursor=False) as cur:
+        cur.execute("SELECT id FROM cases ORDER BY case_name")
+        case_ids = [row[0] for row in cur.fetchall()]
+    for start in range(0, len(case_ids), batch_size):
+        yield from get_cases_full(case_ids[start:start + batch_size])
+
+
 def get_case_by_name(case_name: str) -> Optional[dict]:
-    """Get case by name."""
+    """Get case by name, with the same single-query full details as get_case_by_id()."""
     with get_cursor() as cur:
-        cur.execute("SELECT id FROM cases WHERE case_name = %s", (case_name,))
-        case = cur.fetchone()
-        if not case:
-            return None
-        return get_case_by_id(case["id"])
+        execute_prepared(cur, "case_full_by_name", _CASE_FULL_BY_NAME_SQL, (case_name,))
+        row = cur.fetchone()
+    return _full_case(row) if row else None
 
 
 def get_all_case_names() -> List[str]:
@@ -213,29 +488,25 @@ def create_case(case_name: str, status: str = "Signing Up",
     if short_name is None:
         short_name = case_name.split()[0] if case_name else None
 
-    with get_cursor() as cur:
-        cur.execute("""
-            INSERT INTO cases (case_name, short_name, status, print_code, case_summary, result, date_of_injury, case_numbers)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """, (case_name, short_name, status, print_code, case_summary, result, date_of_injury, case_numbers_json))
-        case_id = cur.fetchone()["id"]
+    with transaction():
+        with get_cursor() as cur:
+            cur.execute("""
+                INSERT INTO cases (case_name, short_name, status, print_code, case_summary, result, date_of_injury, case_numbers)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                RETURNING id
+            """, (case_name, short_name, status, print_code, case_summary, result, date_of_injury, case_numbers_json))
+            case_id = cur.fetchone()["id"]
 
-    return get_case_by_id(case_id)
+        return get_case_by_id(case_id)
 
 
 def update_case(case_id: int, **kwargs) -> Optional[dict]:
     """Update case fields."""
-    allowed_fields = [
-        "case_name", "short_name", "status", "print_code",
-        "case_summary", "result", "date_of_injury", "case_numbers"
-    ]
-
-    updates = []
+    columns = []
     params = []
 
     for field, value in kwargs.items():
-        if field not in allowed_fields:
+        if field not in CASE_UPDATE_FIELDS:
             continue
         if value is None:
             continue
@@ -247,26 +518,20 @@ def update_case(case_id: int, **kwargs) -> Optional[dict]:
         elif field == "case_numbers":
             value = json.dumps(value) if isinstance(value, list) else value
 
-        updates.append(f"{field} = %s")
+        columns.append(field)
         params.append(value)
 
-    if not updates:
+    if not columns:
         return get_case_by_id(case_id)
 
-    updates.append("updated_at = CURRENT_TIMESTAMP")
-    params.append(case_id)
+    with transaction():
+        with get_cursor() as cur:
+            row = update_changed(cur, "cases", case_id, columns, params,
+                                 extra_sets=("updated_at = CURRENT_TIMESTAMP",))
+            if not row:
+                return None
 
-    with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE cases SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id
-        """, params)
-        row = cur.fetchone()
-        if not row:
-            return None
-
-    return get_case_by_id(case_id)
+        return get_case_by_id(case_id)
 
 
 def delete_case(case_id: int) -> bool:
@@ -276,6 +541,7 @@ def delete_case(case_id: int) -> bool:
         return cur.rowcount > 0
 
 
+@cached(ttl=READ_CACHE_TTL)
 def search_cases(query: str = None, case_number: str = None, person_name: str = None,
                  status: str = None, limit: int = 50) -> List[dict]:
     """Search cases by various criteria."""
@@ -284,11 +550,12 @@ def search_cases(query: str = None, case_number: str = None, person_name: str =
 
     if query:
         conditions.append("(c.case_name ILIKE %s OR c.case_summary ILIKE %s)")
-        params.extend([f"%{query}%", f"%{query}%"])
+        pattern = like_pattern(query)
+        params.extend([pattern, pattern])
 
     if case_number:
         conditions.append("c.case_numbers::text ILIKE %s")
-        params.append(f"%{case_number}%")
+        params.append(like_pattern(case_number))
 
     if person_name:
         conditions.append("""
@@ -298,7 +565,7 @@ def search_cases(query: str = None, case_number: str = None, person_name: str =
                 WHERE cp.case_id = c.id AND p.name ILIKE %s
             )
         """)
-        params.append(f"%{person_name}%")
+        params.append(like_pattern(person_name))
 
     if status:
         validate_case_status(status)
@@ -349,42 +616,28 @@ def get_case_summary(case_id: int) -> Optional[dict]:
         return serialize_row(dict(row))
 
 
+@cached(ttl=DASHBOARD_STATS_TTL)
 def get_dashboard_stats() -> dict:
     """Get dashboard statistics."""
     with get_cursor() as cur:
-        # Total cases
-        cur.execute("SELECT COUNT(*) as total FROM cases")
-        total_cases = cur.fetchone()["total"]
-
-        # Active cases (not Closed or Settl. Pend.)
-        cur.execute("""
-            SELECT COUNT(*) as active FROM cases
-            WHERE status NOT IN ('Closed', 'Settl. Pend.')
-        """)
-        active_cases = cur.fetchone()["active"]
-
-        # Pending tasks
-        cur.execute("SELECT COUNT(*) as pending FROM tasks WHERE status = 'Pending'")
-        pending_tasks = cur.fetchone()["pending"]
-
-        # Upcoming events (next 30 days)
+        # One round trip: the case totals are derived from the per-status
+        # counts, the task and event counts are scalar subqueries
         cur.execute("""
-            SELECT COUNT(*) as upcoming FROM events
-            WHERE date >= CURRENT_DATE AND date <= CURRENT_DATE + 30
+            SELECT
+                (SELECT COALESCE(json_object_agg(status, count ORDER BY count DESC), '{}'::json)
+                 FROM (SELECT status, COUNT(*) AS count FROM cases GROUP BY status) s) AS cases_by_status,
+                (SELECT COUNT(*) FROM tasks WHERE status = 'Pending') AS pending_tasks,
+                (SELECT COUNT(*) FROM events
+                 WHERE date >= CURRENT_DATE AND date <= CURRENT_DATE + 30) AS upcoming_events
         """)
-        upcoming_events = cur.fetchone()["upcoming"]
-
-        # Cases by status
-        cur.execute("""
-            SELECT status, COUNT(*) as count FROM cases
-            GROUP BY status ORDER BY count DESC
-        """)
-        cases_by_status = {row["status"]: row["count"] for row in cur.fetchall()}
+        row = cur.fetchone()
+        cases_by_status = row["cases_by_status"]
+        inactive = ("Closed", "Settl. Pend.")
 
         return {
-            "total_cases": total_cases,
-            "active_cases": active_cases,
-            "pending_tasks": pending_tasks,
-            "upcoming_events": upcoming_events,
+            "total_cases": sum(cases_by_status.values()),
+            "active_cases": sum(n for s, n in cases_by_status.items() if s not in inactive),
+            "pending_tasks": row["pending_tasks"],
+            "upcoming_events": row["upcoming_events"],
             "cases_by_status": cases_by_status
         }
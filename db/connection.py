@@ -3,42 +3,219 @@ Database connection pooling, initialization, and migrations.
 """
 
 import os
+import re
+import json
+import base64
+import time as _time
 import atexit
+import select
+import threading
+import weakref
 import psycopg2
-from psycopg2.pool import ThreadedConnectionPool
-from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool, PoolError
+from psycopg2.extras import RealDictCursor, execute_values
 from contextlib import contextmanager
 from datetime import datetime, date, time
 
 from .validation import (
-    DEFAULT_JURISDICTIONS, DEFAULT_EXPERTISE_TYPES, DEFAULT_PERSON_TYPES
+    DEFAULT_JURISDICTIONS, DEFAULT_EXPERTISE_TYPES, DEFAULT_PERSON_TYPES, ValidationError
 )
+from .cache import note_write, reset_writes, has_pending_writes, commit_writes, bump_data_version
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
 # Connection pool configuration
 DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", 2))
 DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", 10))
+# Seconds to wait for a free pooled connection before giving up
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 5))
 
 # Global connection pool
 _pool: ThreadedConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+# Connection held by an active transaction() block on this thread
+_local = threading.local()
+
+# Names of server-side prepared statements created on each pooled connection
+_prepared_statements = weakref.WeakKeyDictionary()
+
+# Hot prepared statements (name -> sql) that warm_pool prepares up front
+_warm_statements = {}
+
+# Channel on which committed writes are announced to other worker processes;
+# the payload is the writer's pid so a process can ignore its own writes
+CHANGE_CHANNEL = "galipo_data_changed"
+_PID = str(os.getpid())
+_listener_thread: threading.Thread | None = None
+
+# Runs of whitespace in user-supplied search terms
+_WS_RE = re.compile(r"\s+")
+
+# Command tags that mean a statement changed data (invalidates db.cache)
+_WRITE_COMMANDS = frozenset({"INSERT", "UPDATE", "DELETE", "COPY", "TRUNCATE"})
+
+# A WITH query whose CTE writes reports its final SELECT as the status
+_MODIFYING_CTE = re.compile(r"^\s*WITH\b.*\b(?:INSERT|UPDATE|DELETE)\b", re.IGNORECASE | re.DOTALL)
+
+
+class _WriteTrackingMixin:
+    """Flag the current thread's transaction as dirty when a statement writes rows."""
+
+    def execute(self, query, vars=None):
+        result = super().execute(query, vars)
+        status = self.statusmessage
+        if status and status.split(" ", 1)[0] in _WRITE_COMMANDS:
+            note_write()
+        elif isinstance(query, str) and _MODIFYING_CTE.match(query):
+            note_write()
+        return result
+
+
+class _TrackingCursor(_WriteTrackingMixin, psycopg2.extensions.cursor):
+    pass
+
+
+class _TrackingDictCursor(_WriteTrackingMixin, RealDictCursor):
+    pass
+
+
+def _commit(conn):
+    """Commit and, if the transaction wrote rows, invalidate cached reads.
+
+    A transaction that wrote also queues a notification on CHANGE_CHANNEL;
+    Postgres delivers it at commit, so other worker processes drop their
+    cached reads too.
+    """
+    if has_pending_writes():
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_notify(%s, %s)", (CHANGE_CHANNEL, _PID))
+    conn.commit()
+    commit_writes()
+
 
 # Sentinel value to distinguish "not provided" from "explicitly set to None/null"
 _NOT_PROVIDED = object()
 
 
+class _BlockingPool(ThreadedConnectionPool):
+    """ThreadedConnectionPool that waits for a free connection instead of failing.
+
+    psycopg2's pool raises PoolError the moment maxconn connections are
+    checked out, so a burst of requests turns into errors. Here getconn()
+    waits up to DB_POOL_TIMEOUT seconds for one to be returned first.
+
+    Code holding a pooled connection must not check out a second one (e.g.
+    call a db function from inside a server_cursor() block): enough such
+    callers at once would each wait on the other's connection until the
+    timeout. Run nested calls inside transaction() so they reuse the held
+    connection, or finish with the first connection before the next call.
+    """
+
+    def __init__(self, minconn, maxconn, *args, **kwargs):
+        self._slots = threading.BoundedSemaphore(maxconn)
+        super().__init__(minconn, maxconn, *args, **kwargs)
+
+    def getconn(self, key=None):
+        if not self._slots.acquire(timeout=DB_POOL_TIMEOUT):
+            raise PoolError(f"No database connection free after {DB_POOL_TIMEOUT}s")
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+
 def get_pool() -> ThreadedConnectionPool:
     """Get or create the database connection pool."""
     global _pool
     if _pool is None:
-        _pool = ThreadedConnectionPool(
-            minconn=DB_POOL_MIN,
-            maxconn=DB_POOL_MAX,
-            dsn=DATABASE_URL
-        )
+        # Double-checked so concurrent first requests don't each build a pool
+        with _pool_lock:
+            if _pool is None:
+                _pool = _BlockingPool(
+                    minconn=DB_POOL_MIN,
+                    maxconn=DB_POOL_MAX,
+                    dsn=DATABASE_URL
+                )
     return _pool
 
 
+def warm_pool():
+    """Open DB_POOL_MIN connections ahead of the first request.
+
+    Each connection is checked with a round trip (so a bad DATABASE_URL fails
+    startup rather than the first request) and gets every statement
+    registered with warm_statement() PREPAREd, so the first hot reads on it
+    skip parse and plan. A statement that fails to prepare (e.g. the schema
+    isn't what it expects yet) is skipped; execute_prepared() prepares it on
+    first use instead.
+    """
+    pool = get_pool()
+    # Check out all of them at once so each is a distinct connection
+    conns = [pool.getconn() for _ in range(DB_POOL_MIN)]
+    try:
+        for conn in conns:
+            prepared = _prepared_statements.setdefault(conn, set())
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                conn.commit()
+                for name, sql in _warm_statements.items():
+                    if name in prepared:
+                        continue
+                    try:
+                        cur.execute(f"PREPARE {name} AS {sql}")
+                        conn.commit()
+                    except psycopg2.Error as e:
+                        conn.rollback()
+                        print(f"Could not prepare {name} at startup (will prepare on first use): {e}")
+                    else:
+                        prepared.add(name)
+    finally:
+        for conn in conns:
+            pool.putconn(conn)
+
+
+def ping() -> bool:
+    """Round-trip a trivial query through the pool (readiness check)."""
+    with get_cursor(dict_cursor=False) as cur:
+        cur.execute("SELECT 1")
+        return cur.fetchone()[0] == 1
+
+
+# Arbitrary app-wide key for the schema-initialization advisory lock
+SCHEMA_LOCK_KEY = 4242
+
+
+@contextmanager
+def schema_lock():
+    """Hold a Postgres advisory lock while migrating/seeding the schema.
+
+    Serializes schema initialization across processes that don't share a
+    filesystem (e.g. several containers on one database): the second one
+    waits, then runs the idempotent migrations against the finished schema.
+    Uses its own connection so the lock is independent of pooled work.
+    """
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_lock(%s)", (SCHEMA_LOCK_KEY,))
+        try:
+            yield
+        finally:
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_unlock(%s)", (SCHEMA_LOCK_KEY,))
+    finally:
+        conn.close()
+
+
 def close_pool():
     """Close the connection pool. Called on process shutdown."""
     global _pool
@@ -51,6 +228,50 @@ def close_pool():
 atexit.register(close_pool)
 
 
+def _listen_for_changes():
+    """Invalidate cached reads whenever another process commits a write."""
+    while True:
+        try:
+            conn = psycopg2.connect(DATABASE_URL)
+        except psycopg2.Error as e:
+            print(f"Change listener could not connect: {e}")
+            _time.sleep(5)
+            continue
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {CHANGE_CHANNEL}")
+            # Notifications sent while disconnected were missed
+            bump_data_version()
+            while True:
+                if select.select([conn], [], [], 60) == ([], [], []):
+                    continue
+                conn.poll()
+                if any(n.payload != _PID for n in conn.notifies):
+                    bump_data_version()
+                conn.notifies.clear()
+        except psycopg2.Error as e:
+            print(f"Change listener lost its connection: {e}")
+            _time.sleep(5)
+        finally:
+            conn.close()
+
+
+def start_change_listener():
+    """Start the background thread that listens on CHANGE_CHANNEL (idempotent).
+
+    Uses its own connection outside the pool, since LISTEN needs a session
+    that stays open and idle.
+    """
+    global _listener_thread
+    with _pool_lock:
+        if _listener_thread is None:
+            _listener_thread = threading.Thread(
+                target=_listen_for_changes, name="db-change-listener", daemon=True
+            )
+            _listener_thread.start()
+
+
 def serialize_value(val):
     """Convert datetime/date/time objects to ISO format strings for JSON serialization."""
     if isinstance(val, datetime):
@@ -74,18 +295,96 @@ def serialize_rows(rows: list) -> list:
     return [serialize_row(row) for row in rows]
 
 
+def like_pattern(term: str) -> str:
+    """Build an ILIKE substring pattern, collapsing whitespace in the term in one pass."""
+    return f"%{_WS_RE.sub(' ', term).strip()}%"
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    """Build an opaque keyset-pagination cursor pointing just past (sort_value, row_id)."""
+    raw = json.dumps([serialize_value(sort_value), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_type=(str, int)) -> tuple:
+    """Return the (sort_value, row_id) of a cursor, or (None, None) for an empty one.
+
+    sort_value must be None or an instance of sort_type, so a tampered cursor
+    is rejected here rather than failing as a query parameter.
+    """
+    if not cursor:
+        return None, None
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid pagination cursor")
+    if not isinstance(row_id, int) or isinstance(row_id, bool):
+        raise ValidationError("Invalid pagination cursor")
+    if sort_value is not None and (not isinstance(sort_value, sort_type) or isinstance(sort_value, bool)):
+        raise ValidationError("Invalid pagination cursor")
+    return sort_value, row_id
+
+
+def keyset_page(rows: list, limit: int, sort_key: str) -> tuple:
+    """Trim a page fetched with limit + 1 rows; return (rows, next_cursor or None)."""
+    if not limit or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1][sort_key], rows[-1]["id"])
+
+
 @contextmanager
 def get_connection():
-    """Context manager for database connections from the pool."""
+    """Context manager for database connections from the pool.
+
+    Inside a transaction() block the block's connection is reused and the
+    commit/rollback is left to the enclosing transaction.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        yield conn
+        return
+
     pool = get_pool()
     conn = pool.getconn()
+    reset_writes()
     try:
         yield conn
-        conn.commit()
+        _commit(conn)
+    except Exception:
+        conn.rollback()
+        reset_writes()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+@contextmanager
+def transaction():
+    """Run several db calls on one pooled connection and commit them once.
+
+    Nested get_cursor()/get_connection() calls (including those made by other
+    db functions) join this transaction instead of checking out their own
+    connection, so a write followed by its read-back costs one checkout and
+    one COMMIT. Nested transaction() blocks join the outermost one.
+    """
+    if getattr(_local, "conn", None) is not None:
+        yield
+        return
+
+    pool = get_pool()
+    conn = pool.getconn()
+    _local.conn = conn
+    reset_writes()
+    try:
+        yield
+        _commit(conn)
     except Exception:
         conn.rollback()
+        reset_writes()
         raise
     finally:
+        _local.conn = None
         pool.putconn(conn)
 
 
@@ -93,7 +392,7 @@ def get_connection():
 def get_cursor(dict_cursor=True):
     """Context manager for database cursors."""
     with get_connection() as conn:
-        cursor_factory = RealDictCursor if dict_cursor else None
+        cursor_factory = _TrackingDictCursor if dict_cursor else _TrackingCursor
         cursor = conn.cursor(cursor_factory=cursor_factory)
         try:
             yield cursor
@@ -101,6 +400,77 @@ def get_cursor(dict_cursor=True):
             cursor.close()
 
 
+@contextmanager
+def server_cursor(name: str, itersize: int = 500):
+    """Context manager for a named (server-side) dict cursor.
+
+    The result set stays on the server and is pulled `itersize` rows per
+    round trip when iterated (or via fetchmany), so large reads run in
+    constant memory. The pooled connection is held until the block exits,
+    so don't call other db functions inside the block (see _BlockingPool).
+    """
+    with get_connection() as conn:
+        with conn.cursor(name=name, cursor_factory=RealDictCursor) as cur:
+            cur.itersize = itersize
+            yield cur
+
+
+def warm_statement(name: str, sql: str) -> str:
+    """Register a hot execute_prepared() statement for warm_pool to prepare.
+
+    Returns `sql` so modules can register and keep the statement in one step.
+    """
+    _warm_statements[name] = sql
+    return sql
+
+
+def execute_prepared(cur, name: str, sql: str, params: tuple = ()):
+    """Execute a fixed-shape query as a server-side prepared statement.
+
+    `sql` uses $1..$n placeholders. The statement is PREPAREd the first time
+    `name` is used on the cursor's connection and EXECUTEd thereafter, so
+    Postgres skips parsing and planning on repeat calls. Prepared statements
+    live as long as the pooled connection.
+    """
+    prepared = _prepared_statements.setdefault(cur.connection, set())
+    if name not in prepared:
+        cur.execute(f"PREPARE {name} AS {sql}")
+        prepared.add(name)
+    if params:
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
+
+
+def update_changed(cur, table: str, row_id: int, columns: list, values: list,
+                   returning: str = "id", extra_sets: tuple = ()) -> dict:
+    """Update one row by id, skipping the write when no value would change.
+
+    `columns` must be trusted column names (callers check them against a
+    whitelist). `extra_sets` are additional SET expressions (e.g. bumping
+    updated_at) applied only when the row is actually written. Returns the
+    `returning` columns of the row whether or not it was written, or None if
+    no row has `row_id`. Unchanged rows cost no new row version, WAL or index
+    maintenance.
+    """
+    # Column names are quoted so ones that are also type names (date, time)
+    # parse as column references
+    sets = ", ".join([f'"{col}" = %s' for col in columns] + list(extra_sets))
+    changed = " OR ".join(f'"{col}" IS DISTINCT FROM %s' for col in columns)
+    cur.execute(f"""
+        WITH upd AS (
+            UPDATE {table} SET {sets}
+            WHERE id = %s AND ({changed})
+            RETURNING {returning}
+        )
+        SELECT * FROM upd
+        UNION ALL
+        SELECT {returning} FROM {table}
+        WHERE id = %s AND NOT EXISTS (SELECT 1 FROM upd)
+    """, [*values, row_id, *values, row_id])
+    return cur.fetchone()
+
+
 def drop_all_tables():
     """Drop all existing tables for clean reset."""
     with get_cursor(dict_cursor=False) as cur:
@@ -168,20 +538,18 @@ def migrate_db():
                 )
             """)
             if cur.fetchone()[0]:
-                # Get unique court values from cases and create jurisdictions
-                cur.execute("SELECT DISTINCT court FROM cases WHERE court IS NOT NULL AND court != ''")
-                courts = [row[0] for row in cur.fetchall()]
-                for court_name in courts:
-                    cur.execute(
-                        "INSERT INTO jurisdictions (name) VALUES (%s) ON CONFLICT (name) DO NOTHING",
-                        (court_name,)
-                    )
+                # Create a jurisdiction for every unique court value in cases
+                cur.execute("""
+                    INSERT INTO jurisdictions (name)
+                    SELECT DISTINCT court FROM cases WHERE court IS NOT NULL AND court != ''
+                    ON CONFLICT (name) DO NOTHING
+                """)
             # Also add default jurisdictions
-            for j in DEFAULT_JURISDICTIONS:
-                cur.execute(
-                    "INSERT INTO jurisdictions (name, local_rules_link) VALUES (%s, %s) ON CONFLICT (name) DO NOTHING",
-                    (j["name"], j.get("local_rules_link"))
-                )
+            execute_values(cur, """
+                INSERT INTO jurisdictions (name, local_rules_link)
+                VALUES %s
+                ON CONFLICT (name) DO NOTHING
+            """, [(j["name"], j.get("local_rules_link")) for j in DEFAULT_JURISDICTIONS])
 
         # 3. Remove court_id column from cases (court is now only through proceedings)
         cur.execute("""
@@ -683,8 +1051,10 @@ def migrate_db():
                 UNIQUE(proceeding_id, person_id)
             )
         """)
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_judges_proceeding_id ON judges(proceeding_id)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_judges_person_id ON judges(person_id)")
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_judges_proceeding_id ON judges(proceeding_id);
+            CREATE INDEX IF NOT EXISTS idx_judges_person_id ON judges(person_id);
+        """)
         print("  - Created judges table (if not exists)")
 
         # Migrate existing judge_id data from proceedings to judges
@@ -757,13 +1127,38 @@ def migrate_db():
                 processed_at TIMESTAMP
             )
         """)
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_source ON webhook_logs(source)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_status ON webhook_logs(processing_status)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_created_at ON webhook_logs(created_at)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_proceeding_id ON webhook_logs(proceeding_id)")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_idempotency_key ON webhook_logs(idempotency_key)")
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_source ON webhook_logs(source);
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_status ON webhook_logs(processing_status);
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_created_at ON webhook_logs(created_at);
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_proceeding_id ON webhook_logs(proceeding_id);
+        """)
         print("  - Created webhook_logs table (if not exists)")
 
+        # 29-32 are unconditional index changes, sent as one batch (one round trip)
+        cur.execute("""
+            -- 29. Webhook log indexes shaped for the list/poll queries
+            -- (the UNIQUE constraint on idempotency_key already provides its index)
+            DROP INDEX IF EXISTS idx_webhook_logs_idempotency_key;
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_pending
+            ON webhook_logs(created_at DESC) WHERE processing_status = 'pending';
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_source_status_created
+            ON webhook_logs(source, processing_status, created_at DESC);
+
+            -- 30. idx_activities_case_id is superseded by the covering
+            -- idx_activities_case_minutes created in init_db()
+            DROP INDEX IF EXISTS idx_activities_case_id;
+
+            -- 31. Per-case task/event counts use composite indexes created in
+            -- init_db(), which also cover the plain case_id lookups
+            DROP INDEX IF EXISTS idx_tasks_case_id;
+            DROP INDEX IF EXISTS idx_events_case_id;
+
+            -- 32. idx_events_date is superseded by idx_events_date_id created in
+            -- init_db(), which also serves the calendar's (date, id) ordering
+            DROP INDEX IF EXISTS idx_events_date;
+        """)
+
         print("Database migration complete.")
 
 
@@ -962,6 +1357,7 @@ def init_db():
         # Create indexes for better query performance
         cur.execute("""
             CREATE INDEX IF NOT EXISTS idx_cases_status ON cases(status);
+            CREATE INDEX IF NOT EXISTS idx_cases_name_id ON cases(case_name, id);
             CREATE INDEX IF NOT EXISTS idx_persons_name ON persons(name);
             CREATE INDEX IF NOT EXISTS idx_persons_type ON persons(person_type);
             CREATE INDEX IF NOT EXISTS idx_persons_archived ON persons(archived);
@@ -969,12 +1365,12 @@ def init_db():
             CREATE INDEX IF NOT EXISTS idx_case_persons_case_id ON case_persons(case_id);
             CREATE INDEX IF NOT EXISTS idx_case_persons_person_id ON case_persons(person_id);
             CREATE INDEX IF NOT EXISTS idx_case_persons_role ON case_persons(role);
-            CREATE INDEX IF NOT EXISTS idx_tasks_case_id ON tasks(case_id);
+            CREATE INDEX IF NOT EXISTS idx_tasks_case_status ON tasks(case_id, status);
             CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
             CREATE INDEX IF NOT EXISTS idx_tasks_sort_order ON tasks(sort_order);
-            CREATE INDEX IF NOT EXISTS idx_events_case_id ON events(case_id);
-            CREATE INDEX IF NOT EXISTS idx_events_date ON events(date);
-            CREATE INDEX IF NOT EXISTS idx_activities_case_id ON activities(case_id);
+            CREATE INDEX IF NOT EXISTS idx_events_case_date ON events(case_id, date);
+            CREATE INDEX IF NOT EXISTS idx_events_date_id ON events(date, id);
+            CREATE INDEX IF NOT EXISTS idx_activities_case_minutes ON activities(case_id) INCLUDE (minutes);
             CREATE INDEX IF NOT EXISTS idx_notes_case_id ON notes(case_id);
             CREATE INDEX IF NOT EXISTS idx_proceedings_case_id ON proceedings(case_id);
             CREATE INDEX IF NOT EXISTS idx_judges_proceeding_id ON judges(proceeding_id);
@@ -983,7 +1379,22 @@ def init_db():
             CREATE INDEX IF NOT EXISTS idx_webhook_logs_status ON webhook_logs(processing_status);
             CREATE INDEX IF NOT EXISTS idx_webhook_logs_created_at ON webhook_logs(created_at);
             CREATE INDEX IF NOT EXISTS idx_webhook_logs_proceeding_id ON webhook_logs(proceeding_id);
-            CREATE INDEX IF NOT EXISTS idx_webhook_logs_idempotency_key ON webhook_logs(idempotency_key);
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_pending ON webhook_logs(created_at DESC) WHERE processing_status = 'pending';
+            CREATE INDEX IF NOT EXISTS idx_webhook_logs_source_status_created ON webhook_logs(source, processing_status, created_at DESC);
+        """)
+
+        # Trigram indexes so ILIKE '%term%' searches use an index scan
+        cur.execute("""
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+            CREATE INDEX IF NOT EXISTS idx_cases_case_name_trgm ON cases USING GIN (case_name gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_cases_case_summary_trgm ON cases USING GIN (case_summary gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_cases_case_numbers_trgm ON cases USING GIN ((case_numbers::text) gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_persons_name_trgm ON persons USING GIN (name gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_persons_organization_trgm ON persons USING GIN (organization gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_persons_emails_trgm ON persons USING GIN ((emails::text) gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_persons_phones_trgm ON persons USING GIN ((phones::text) gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_events_description_trgm ON events USING GIN (description gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_tasks_description_trgm ON tasks USING GIN (description gin_trgm_ops);
         """)
 
     print("Database tables initialized.")
@@ -996,12 +1407,11 @@ def seed_jurisdictions():
         if cur.fetchone()["count"] > 0:
             return  # Already seeded
 
-        for j in DEFAULT_JURISDICTIONS:
-            cur.execute("""
-                INSERT INTO jurisdictions (name, local_rules_link)
-                VALUES (%s, %s)
-                ON CONFLICT (name) DO NOTHING
-            """, (j["name"], j.get("local_rules_link")))
+        execute_values(cur, """
+            INSERT INTO jurisdictions (name, local_rules_link)
+            VALUES %s
+            ON CONFLICT (name) DO NOTHING
+        """, [(j["name"], j.get("local_rules_link")) for j in DEFAULT_JURISDICTIONS])
     print(f"Seeded {len(DEFAULT_JURISDICTIONS)} jurisdictions.")
 
 
@@ -1012,12 +1422,11 @@ def seed_expertise_types():
         if cur.fetchone()["count"] > 0:
             return  # Already seeded
 
-        for name in DEFAULT_EXPERTISE_TYPES:
-            cur.execute("""
-                INSERT INTO expertise_types (name)
-                VALUES (%s)
-                ON CONFLICT (name) DO NOTHING
-            """, (name,))
+        execute_values(cur, """
+            INSERT INTO expertise_types (name)
+            VALUES %s
+            ON CONFLICT (name) DO NOTHING
+        """, [(name,) for name in DEFAULT_EXPERTISE_TYPES])
     print(f"Seeded {len(DEFAULT_EXPERTISE_TYPES)} expertise types.")
 
 
@@ -1028,18 +1437,18 @@ def seed_person_types():
         if cur.fetchone()["count"] > 0:
             return  # Already seeded
 
-        for name in DEFAULT_PERSON_TYPES:
-            cur.execute("""
-                INSERT INTO person_types (name)
-                VALUES (%s)
-                ON CONFLICT (name) DO NOTHING
-            """, (name,))
+        execute_values(cur, """
+            INSERT INTO person_types (name)
+            VALUES %s
+            ON CONFLICT (name) DO NOTHING
+        """, [(name,) for name in DEFAULT_PERSON_TYPES])
     print(f"Seeded {len(DEFAULT_PERSON_TYPES)} person types.")
 
 
 def seed_db():
-    """Seed all lookup tables."""
-    seed_jurisdictions()
-    seed_expertise_types()
-    seed_person_types()
+    """Seed all lookup tables in a single transaction (one connection, one COMMIT)."""
+    with transaction():
+        seed_jurisdictions()
+        seed_expertise_types()
+        seed_person_types()
     print("Database seeded with lookup data.")
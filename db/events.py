@@ -2,10 +2,18 @@
 Event/calendar management functions.
 """
 
+from datetime import date
 from typing import Optional, List
 
-from .connection import get_cursor, serialize_row, serialize_rows, _NOT_PROVIDED
-from .validation import validate_date_format, validate_time_format
+from .connection import (
+    get_cursor, execute_prepared, like_pattern, update_changed, serialize_row, serialize_rows,
+    decode_cursor, keyset_page, _NOT_PROVIDED
+)
+from .validation import ValidationError, validate_date_format, validate_time_format
+from .cache import cached, READ_CACHE_TTL
+
+# Columns returned by event updates
+_EVENT_COLUMNS = "id, case_id, date, time, location, description, document_link, calculation_note, starred"
 
 
 def add_event(case_id: int, date: str, description: str,
@@ -16,15 +24,17 @@ def add_event(case_id: int, date: str, description: str,
     validate_time_format(time, "time")
 
     with get_cursor() as cur:
-        cur.execute("""
+        execute_prepared(cur, "event_insert", """
             INSERT INTO events (case_id, date, time, location, description, document_link, calculation_note, starred)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
             RETURNING id, case_id, date, time, location, description, document_link, calculation_note, starred, created_at
         """, (case_id, date, time, location, description, document_link, calculation_note, starred))
         return serialize_row(dict(cur.fetchone()))
 
 
-def get_upcoming_events(limit: int = None, offset: int = None, include_past: bool = False, past_days: int = 14) -> dict:
+@cached(ttl=READ_CACHE_TTL)
+def get_upcoming_events(limit: int = None, offset: int = None, include_past: bool = False, past_days: int = 14,
+                        count_only: bool = False, after: str = None, include_total: bool = True) -> dict:
     """Get events (hearings, depositions, filing deadlines, etc.).
 
     Args:
@@ -32,23 +42,45 @@ def get_upcoming_events(limit: int = None, offset: int = None, include_past: boo
         offset: Pagination offset
         include_past: If True, return past events instead of upcoming
         past_days: When include_past is True, how many days back to include (default 14)
+        count_only: If True, skip the rows and return only {"total": n}
+        include_total: If False, skip the count and return {"events": [...],
+            "has_more": bool} instead of a total
+        after: Keyset cursor (a previous page's next_cursor, or "" for the
+            first page). Offset is then ignored, no count runs, and
+            {"events": [...], "next_cursor": str | None} is returned.
     """
     params = []
 
     if include_past:
         # Past events: from N days ago up to (but not including) today
         conditions = [f"e.date >= CURRENT_DATE - {past_days}", "e.date < CURRENT_DATE"]
-        order = "ORDER BY e.date DESC"  # Most recent first
+        order = "ORDER BY e.date DESC, e.id DESC"  # Most recent first
     else:
         # Upcoming events: today and future
         conditions = ["e.date >= CURRENT_DATE"]
-        order = "ORDER BY e.date ASC"
+        order = "ORDER BY e.date ASC, e.id ASC"
+
+    keyset = after is not None and not count_only
+    if keyset:
+        event_date, event_id = decode_cursor(after, str)
+        try:
+            event_date = date.fromisoformat(event_date) if event_date is not None else None
+        except ValueError:
+            raise ValidationError("Invalid pagination cursor")
+        if event_id is not None:
+            conditions.append(f"(e.date, e.id) {'<' if include_past else '>'} (%s, %s)")
+            params.extend([event_date, event_id])
 
     where_clause = f"WHERE {' AND '.join(conditions)}"
 
+    with_total = not keyset and (include_total or count_only)
+
     with get_cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) as total FROM events e {where_clause}", params)
-        total = cur.fetchone()["total"]
+        if with_total:
+            cur.execute(f"SELECT COUNT(*) as total FROM events e {where_clause}", params)
+            total = cur.fetchone()["total"]
+            if count_only:
+                return {"total": total}
 
         query = f"""
             SELECT e.id, e.case_id, c.case_name, c.short_name, e.date, e.time, e.location,
@@ -58,13 +90,26 @@ def get_upcoming_events(limit: int = None, offset: int = None, include_past: boo
             {where_clause}
             {order}
         """
+        if keyset:
+            if limit:
+                query += f" LIMIT {int(limit) + 1}"
+            cur.execute(query, params)
+            events, next_cursor = keyset_page(serialize_rows([dict(row) for row in cur.fetchall()]),
+                                              limit, "date")
+            return {"events": events, "next_cursor": next_cursor}
+
         if limit:
-            query += f" LIMIT {limit}"
+            # Without a count, one extra row tells whether another page exists
+            query += f" LIMIT {limit if with_total else int(limit) + 1}"
         if offset:
             query += f" OFFSET {offset}"
 
         cur.execute(query, params)
-        return {"events": serialize_rows([dict(row) for row in cur.fetchall()]), "total": total}
+        events = serialize_rows([dict(row) for row in cur.fetchall()])
+        if with_total:
+            return {"events": events, "total": total}
+        has_more = bool(limit) and len(events) > limit
+        return {"events": events[:limit] if has_more else events, "has_more": has_more}
 
 
 def get_events(case_id: int = None) -> dict:
@@ -95,25 +140,18 @@ def get_events(case_id: int = None) -> dict:
 
 def update_event(event_id: int, starred: bool = None) -> Optional[dict]:
     """Update event starred status."""
-    updates = []
+    columns = []
     params = []
 
     if starred is not None:
-        updates.append("starred = %s")
+        columns.append("starred")
         params.append(starred)
 
-    if not updates:
+    if not columns:
         return None
 
-    params.append(event_id)
-
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE events SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, case_id, date, time, location, description, document_link, calculation_note, starred
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "events", event_id, columns, params, returning=_EVENT_COLUMNS)
         return serialize_row(dict(row)) if row else None
 
 
@@ -122,53 +160,46 @@ def update_event_full(event_id: int, date: str = _NOT_PROVIDED, description: str
                       time: str = _NOT_PROVIDED, location: str = _NOT_PROVIDED,
                       starred: bool = _NOT_PROVIDED) -> Optional[dict]:
     """Update all event fields."""
-    updates = []
+    columns = []
     params = []
 
     if date is not _NOT_PROVIDED:
         if date is not None:
             validate_date_format(date, "date")
-        updates.append("date = %s")
+        columns.append("date")
         params.append(date)
 
     if time is not _NOT_PROVIDED:
         if time is not None and time != "":
             validate_time_format(time, "time")
-        updates.append("time = %s")
+        columns.append("time")
         params.append(time if time else None)
 
     if location is not _NOT_PROVIDED:
-        updates.append("location = %s")
+        columns.append("location")
         params.append(location if location else None)
 
     if description is not _NOT_PROVIDED:
-        updates.append("description = %s")
+        columns.append("description")
         params.append(description)
 
     if document_link is not _NOT_PROVIDED:
-        updates.append("document_link = %s")
+        columns.append("document_link")
         params.append(document_link if document_link else None)
 
     if calculation_note is not _NOT_PROVIDED:
-        updates.append("calculation_note = %s")
+        columns.append("calculation_note")
         params.append(calculation_note if calculation_note else None)
 
     if starred is not _NOT_PROVIDED:
-        updates.append("starred = %s")
+        columns.append("starred")
         params.append(starred)
 
-    if not updates:
+    if not columns:
         return None
 
-    params.append(event_id)
-
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE events SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, case_id, date, time, location, description, document_link, calculation_note, starred
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "events", event_id, columns, params, returning=_EVENT_COLUMNS)
         return serialize_row(dict(row)) if row else None
 
 
@@ -179,6 +210,7 @@ def delete_event(event_id: int) -> bool:
         return cur.rowcount > 0
 
 
+@cached(ttl=READ_CACHE_TTL)
 def search_events(query: str = None, case_id: int = None,
                   limit: int = 50) -> List[dict]:
     """Search events by various criteria."""
@@ -187,7 +219,7 @@ def search_events(query: str = None, case_id: int = None,
 
     if query:
         conditions.append("e.description ILIKE %s")
-        params.append(f"%{query}%")
+        params.append(like_pattern(query))
 
     if case_id:
         conditions.append("e.case_id = %s")
@@ -4,9 +4,11 @@ Jurisdiction CRUD operations.
 
 from typing import Optional, List
 
-from .connection import get_cursor
+from .connection import get_cursor, update_changed
+from .cache import cached, LOOKUP_CACHE_TTL
 
 
+@cached(ttl=LOOKUP_CACHE_TTL)
 def get_jurisdictions() -> List[dict]:
     """Get all jurisdictions."""
     with get_cursor() as cur:
@@ -43,29 +45,24 @@ def create_jurisdiction(name: str, local_rules_link: str = None, notes: str = No
 
 def update_jurisdiction(jurisdiction_id: int, name: str = None, local_rules_link: str = None, notes: str = None) -> Optional[dict]:
     """Update a jurisdiction."""
-    updates = []
+    columns = []
     params = []
     if name is not None:
-        updates.append("name = %s")
+        columns.append("name")
         params.append(name)
     if local_rules_link is not None:
-        updates.append("local_rules_link = %s")
+        columns.append("local_rules_link")
         params.append(local_rules_link)
     if notes is not None:
-        updates.append("notes = %s")
+        columns.append("notes")
         params.append(notes)
 
-    if not updates:
+    if not columns:
         return get_jurisdiction_by_id(jurisdiction_id)
 
-    params.append(jurisdiction_id)
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE jurisdictions SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, name, local_rules_link, notes
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "jurisdictions", jurisdiction_id, columns, params,
+                             returning="id, name, local_rules_link, notes")
         return dict(row) if row else None
 
 
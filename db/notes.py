@@ -2,22 +2,42 @@
 Note management functions.
 """
 
-from typing import Optional
+from typing import Optional, List
 
-from .connection import get_cursor, serialize_row, serialize_rows
+from psycopg2.extras import execute_values
+
+from .connection import get_cursor, execute_prepared, serialize_row, serialize_rows
 
 
 def add_note(case_id: int, content: str) -> dict:
     """Add a note to a case."""
     with get_cursor() as cur:
-        cur.execute("""
+        execute_prepared(cur, "note_insert", """
             INSERT INTO notes (case_id, content)
-            VALUES (%s, %s)
+            VALUES ($1, $2)
             RETURNING id, case_id, content, created_at, updated_at
         """, (case_id, content))
         return serialize_row(dict(cur.fetchone()))
 
 
+def add_notes(notes: List[tuple]) -> List[dict]:
+    """Add several (case_id, content) notes in one INSERT; results are in input order.
+
+    Rows are inserted in input order (by an ordinal column), so their serial
+    ids ascend in that order; RETURNING order itself isn't guaranteed, so
+    the results are sorted by id.
+    """
+    with get_cursor() as cur:
+        rows = execute_values(cur, """
+            INSERT INTO notes (case_id, content)
+            SELECT v.case_id, v.content
+            FROM (VALUES %s) AS v(ord, case_id, content)
+            ORDER BY v.ord
+            RETURNING id, case_id, content, created_at, updated_at
+        """, [(i, *note) for i, note in enumerate(notes)], page_size=len(notes), fetch=True)
+        return serialize_rows(sorted((dict(row) for row in rows), key=lambda row: row["id"]))
+
+
 def update_note(note_id: int, content: str) -> Optional[dict]:
     """Update a note's content."""
     with get_cursor() as cur:
@@ -5,11 +5,18 @@ Person/contact management functions.
 import json
 from typing import Optional, List
 
-from .connection import get_cursor, serialize_row, serialize_rows
+from .connection import get_cursor, execute_prepared, like_pattern, transaction, update_changed, serialize_row, serialize_rows
 from .validation import (
     validate_person_type, validate_person_side, validate_date_format,
     validate_case_person_role
 )
+from .cache import cached, READ_CACHE_TTL
+
+# Columns update_person may write
+PERSON_UPDATE_FIELDS = frozenset({
+    "name", "person_type", "phones", "emails", "address",
+    "organization", "attributes", "notes", "archived"
+})
 
 
 def create_person(person_type: str, name: str, phones: List[dict] = None,
@@ -64,13 +71,11 @@ def get_person_by_id(person_id: int) -> Optional[dict]:
 
 def update_person(person_id: int, **kwargs) -> Optional[dict]:
     """Update person fields."""
-    allowed_fields = ["name", "person_type", "phones", "emails", "address",
-                      "organization", "attributes", "notes", "archived"]
-    updates = []
+    columns = []
     params = []
 
     for field, value in kwargs.items():
-        if field not in allowed_fields:
+        if field not in PERSON_UPDATE_FIELDS:
             continue
         if value is None:
             continue
@@ -80,28 +85,23 @@ def update_person(person_id: int, **kwargs) -> Optional[dict]:
         elif field in ["phones", "emails", "attributes"]:
             value = json.dumps(value) if isinstance(value, (list, dict)) else value
 
-        updates.append(f"{field} = %s")
+        columns.append(field)
         params.append(value)
 
-    if not updates:
+    if not columns:
         return get_person_by_id(person_id)
 
-    updates.append("updated_at = CURRENT_TIMESTAMP")
-    params.append(person_id)
+    with transaction():
+        with get_cursor() as cur:
+            row = update_changed(cur, "persons", person_id, columns, params,
+                                 extra_sets=("updated_at = CURRENT_TIMESTAMP",))
+            if not row:
+                return None
 
-    with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE persons SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id
-        """, params)
-        row = cur.fetchone()
-        if not row:
-            return None
-
-    return get_person_by_id(person_id)
+        return get_person_by_id(person_id)
 
 
+@cached(ttl=READ_CACHE_TTL)
 def search_persons(name: str = None, person_type: str = None, organization: str = None,
                    email: str = None, phone: str = None, case_id: int = None,
                    archived: bool = False, limit: int = 50, offset: int = 0) -> dict:
@@ -111,7 +111,7 @@ def search_persons(name: str = None, person_type: str = None, organization: str
 
     if name:
         conditions.append("p.name ILIKE %s")
-        params.append(f"%{name}%")
+        params.append(like_pattern(name))
 
     if person_type:
         validate_person_type(person_type)
@@ -120,15 +120,15 @@ def search_persons(name: str = None, person_type: str = None, organization: str
 
     if organization:
         conditions.append("p.organization ILIKE %s")
-        params.append(f"%{organization}%")
+        params.append(like_pattern(organization))
 
     if email:
         conditions.append("p.emails::text ILIKE %s")
-        params.append(f"%{email}%")
+        params.append(like_pattern(email))
 
     if phone:
         conditions.append("p.phones::text ILIKE %s")
-        params.append(f"%{phone}%")
+        params.append(like_pattern(phone))
 
     if case_id:
         conditions.append("EXISTS (SELECT 1 FROM case_persons cp WHERE cp.person_id = p.id AND cp.case_id = %s)")
@@ -166,6 +166,21 @@ def delete_person(person_id: int) -> bool:
 
 # ===== CASE-PERSON OPERATIONS =====
 
+# Full assignment details, selected from a data-modifying CTE named `cp` so the
+# write and the read-back share one round trip
+_ASSIGNMENT_SELECT = """
+            SELECT p.id, p.person_type, p.name, p.phones, p.emails, p.organization,
+                   p.attributes, p.notes as person_notes,
+                   cp.id as assignment_id, cp.role, cp.side, cp.case_attributes,
+                   cp.case_notes, cp.is_primary, cp.contact_via_person_id,
+                   cp.assigned_date, cp.created_at as assigned_at,
+                   via.name as contact_via_name
+            FROM cp
+            JOIN persons p ON p.id = cp.person_id
+            LEFT JOIN persons via ON cp.contact_via_person_id = via.id
+"""
+
+
 def assign_person_to_case(case_id: int, person_id: int, role: str, side: str = None,
                           case_attributes: dict = None, case_notes: str = None,
                           is_primary: bool = False, contact_via_person_id: int = None,
@@ -179,35 +194,23 @@ def assign_person_to_case(case_id: int, person_id: int, role: str, side: str = N
     case_attrs_json = json.dumps(case_attributes) if case_attributes else '{}'
 
     with get_cursor() as cur:
-        cur.execute("""
-            INSERT INTO case_persons (case_id, person_id, role, side, case_attributes,
-                                      case_notes, is_primary, contact_via_person_id, assigned_date)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (case_id, person_id, role) DO UPDATE SET
-                side = EXCLUDED.side,
-                case_attributes = EXCLUDED.case_attributes,
-                case_notes = EXCLUDED.case_notes,
-                is_primary = EXCLUDED.is_primary,
-                contact_via_person_id = EXCLUDED.contact_via_person_id,
-                assigned_date = EXCLUDED.assigned_date
-            RETURNING id
+        cur.execute(f"""
+            WITH cp AS (
+                INSERT INTO case_persons (case_id, person_id, role, side, case_attributes,
+                                          case_notes, is_primary, contact_via_person_id, assigned_date)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (case_id, person_id, role) DO UPDATE SET
+                    side = EXCLUDED.side,
+                    case_attributes = EXCLUDED.case_attributes,
+                    case_notes = EXCLUDED.case_notes,
+                    is_primary = EXCLUDED.is_primary,
+                    contact_via_person_id = EXCLUDED.contact_via_person_id,
+                    assigned_date = EXCLUDED.assigned_date
+                RETURNING *
+            )
+            {_ASSIGNMENT_SELECT}
         """, (case_id, person_id, role, side, case_attrs_json, case_notes,
               is_primary, contact_via_person_id, assigned_date))
-        assignment_id = cur.fetchone()["id"]
-
-        # Return full assignment details
-        cur.execute("""
-            SELECT p.id, p.person_type, p.name, p.phones, p.emails, p.organization,
-                   p.attributes, p.notes as person_notes,
-                   cp.id as assignment_id, cp.role, cp.side, cp.case_attributes,
-                   cp.case_notes, cp.is_primary, cp.contact_via_person_id,
-                   cp.assigned_date, cp.created_at as assigned_at,
-                   via.name as contact_via_name
-            FROM persons p
-            JOIN case_persons cp ON p.id = cp.person_id
-            LEFT JOIN persons via ON cp.contact_via_person_id = via.id
-            WHERE cp.id = %s
-        """, (assignment_id,))
         return serialize_row(dict(cur.fetchone()))
 
 
@@ -239,43 +242,29 @@ def update_case_assignment(case_id: int, person_id: int, role: str, **kwargs) ->
 
     with get_cursor() as cur:
         cur.execute(f"""
-            UPDATE case_persons SET {', '.join(updates)}
-            WHERE case_id = %s AND person_id = %s AND role = %s
-            RETURNING id
+            WITH cp AS (
+                UPDATE case_persons SET {', '.join(updates)}
+                WHERE case_id = %s AND person_id = %s AND role = %s
+                RETURNING *
+            )
+            {_ASSIGNMENT_SELECT}
         """, params)
         row = cur.fetchone()
-        if not row:
-            return None
-
-        assignment_id = row["id"]
-        cur.execute("""
-            SELECT p.id, p.person_type, p.name, p.phones, p.emails, p.organization,
-                   p.attributes, p.notes as person_notes,
-                   cp.id as assignment_id, cp.role, cp.side, cp.case_attributes,
-                   cp.case_notes, cp.is_primary, cp.contact_via_person_id,
-                   cp.assigned_date, cp.created_at as assigned_at,
-                   via.name as contact_via_name
-            FROM persons p
-            JOIN case_persons cp ON p.id = cp.person_id
-            LEFT JOIN persons via ON cp.contact_via_person_id = via.id
-            WHERE cp.id = %s
-        """, (assignment_id,))
-        return serialize_row(dict(cur.fetchone()))
+        return serialize_row(dict(row)) if row else None
 
 
 def remove_person_from_case(case_id: int, person_id: int, role: str = None) -> bool:
-    """Remove a person from a case."""
+    """Remove a person from a case (only the given role's assignment if role is set).
+
+    The DELETE's row count is the existence check, and both the all-roles and
+    single-role variants share one prepared statement (a NULL role matches
+    any role).
+    """
     with get_cursor() as cur:
-        if role:
-            cur.execute("""
-                DELETE FROM case_persons
-                WHERE case_id = %s AND person_id = %s AND role = %s
-            """, (case_id, person_id, role))
-        else:
-            cur.execute("""
-                DELETE FROM case_persons
-                WHERE case_id = %s AND person_id = %s
-            """, (case_id, person_id))
+        execute_prepared(cur, "case_person_delete", """
+            DELETE FROM case_persons
+            WHERE case_id = $1 AND person_id = $2 AND ($3::text IS NULL OR role = $3)
+        """, (case_id, person_id, role or None))
         return cur.rowcount > 0
 
 
@@ -10,7 +10,7 @@ via the judges table.
 
 from typing import Optional, List
 
-from .connection import get_cursor, serialize_row, serialize_rows, _NOT_PROVIDED
+from .connection import get_cursor, transaction, serialize_row, serialize_rows, _NOT_PROVIDED
 
 
 def add_proceeding(case_id: int, case_number: str, jurisdiction_id: int = None,
@@ -191,28 +191,29 @@ def update_proceeding(proceeding_id: int, case_number: str = _NOT_PROVIDED,
     updates.append("updated_at = CURRENT_TIMESTAMP")
     params.append(proceeding_id)
 
-    with get_cursor() as cur:
-        # If setting as primary, unmark others first
-        if is_primary is not _NOT_PROVIDED and is_primary:
-            cur.execute("""
-                SELECT case_id FROM proceedings WHERE id = %s
-            """, (proceeding_id,))
-            row = cur.fetchone()
-            if row:
+    with transaction():
+        with get_cursor() as cur:
+            # If setting as primary, unmark others first
+            if is_primary is not _NOT_PROVIDED and is_primary:
                 cur.execute("""
-                    UPDATE proceedings SET is_primary = FALSE WHERE case_id = %s AND id != %s
-                """, (row["case_id"], proceeding_id))
-
-        cur.execute(f"""
-            UPDATE proceedings SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id
-        """, params)
-        row = cur.fetchone()
-        if not row:
-            return None
+                    SELECT case_id FROM proceedings WHERE id = %s
+                """, (proceeding_id,))
+                row = cur.fetchone()
+                if row:
+                    cur.execute("""
+                        UPDATE proceedings SET is_primary = FALSE WHERE case_id = %s AND id != %s
+                    """, (row["case_id"], proceeding_id))
+
+            cur.execute(f"""
+                UPDATE proceedings SET {', '.join(updates)}
+                WHERE id = %s
+                RETURNING id
+            """, params)
+            row = cur.fetchone()
+            if not row:
+                return None
 
-    return get_proceeding_by_id(proceeding_id)
+        return get_proceeding_by_id(proceeding_id)
 
 
 def delete_proceeding(proceeding_id: int) -> bool:
@@ -4,14 +4,22 @@ Task management functions.
 
 from typing import Optional, List
 
-from .connection import get_cursor, serialize_row, serialize_rows, _NOT_PROVIDED
+from .connection import (
+    get_cursor, execute_prepared, like_pattern, update_changed, serialize_row, serialize_rows,
+    decode_cursor, keyset_page, _NOT_PROVIDED
+)
 from .validation import (
     validate_task_status, validate_urgency, validate_date_format
 )
+from .cache import cached, READ_CACHE_TTL
 
 
 VALID_DOCKET_CATEGORIES = ['today', 'tomorrow', 'backburner', None]
 
+# Columns returned by task updates
+_TASK_COLUMNS = ("id, case_id, description, due_date, completion_date, status, urgency, event_id, "
+                 "sort_order, docket_category, docket_order, created_at")
+
 
 def validate_docket_category(category: str) -> None:
     """Validate that docket_category is a valid value."""
@@ -27,23 +35,31 @@ def add_task(case_id: int, description: str, due_date: str = None,
     validate_date_format(due_date, "due_date")
 
     with get_cursor() as cur:
-        # Get max sort_order and add 1000 for new task
-        cur.execute("SELECT COALESCE(MAX(sort_order), 0) + 1000 AS next_sort_order FROM tasks")
-        new_sort_order = cur.fetchone()["next_sort_order"]
-
-        cur.execute("""
+        # New tasks sort after all existing ones (max sort_order + 1000)
+        execute_prepared(cur, "task_insert", """
             INSERT INTO tasks (case_id, description, due_date, status, urgency, event_id, sort_order)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            VALUES ($1, $2, $3, $4, $5, $6,
+                    (SELECT COALESCE(MAX(sort_order), 0) + 1000 FROM tasks))
             RETURNING id, case_id, description, due_date, completion_date, status, urgency, event_id, sort_order, docket_category, docket_order, created_at
-        """, (case_id, description, due_date, status, urgency, event_id, new_sort_order))
+        """, (case_id, description, due_date, status, urgency, event_id))
         return serialize_row(dict(cur.fetchone()))
 
 
+@cached(ttl=READ_CACHE_TTL)
 def get_tasks(case_id: int = None, status_filter: str = None, exclude_status: str = None,
               urgency_filter: int = None, due_date_from: str = None, due_date_to: str = None,
-              docket_category: str = _NOT_PROVIDED, limit: int = None, offset: int = None) -> dict:
+              docket_category: str = _NOT_PROVIDED, limit: int = None, offset: int = None,
+              count_only: bool = False, after: str = None, include_total: bool = True) -> dict:
     """Get tasks with optional filters.
 
+    With count_only, only the count query runs and {"total": n} is returned.
+    With include_total=False the count is skipped and {"tasks": [...],
+    "has_more": bool} is returned.
+
+    Passing `after` (a previous page's next_cursor, or "" for the first page)
+    switches to keyset pagination on (sort_order, id): offset is ignored, no
+    count runs, and {"tasks": [...], "next_cursor": str | None} is returned.
+
     Note: docket_category uses _NOT_PROVIDED sentinel to distinguish between:
     - Not filtering by docket_category at all (default)
     - Filtering for tasks WITH a specific category (e.g., 'today')
@@ -89,11 +105,28 @@ def get_tasks(case_id: int = None, status_filter: str = None, exclude_status: st
             conditions.append("t.docket_category = %s")
             params.append(docket_category)
 
+    keyset = after is not None and not count_only
+    if keyset:
+        sort_order, task_id = decode_cursor(after, int)
+        # sort_order is nullable and NULLs sort last, so a row comparison
+        # alone would skip them
+        if task_id is not None and sort_order is None:
+            conditions.append("(t.sort_order IS NULL AND t.id > %s)")
+            params.append(task_id)
+        elif task_id is not None:
+            conditions.append("(t.sort_order > %s OR (t.sort_order = %s AND t.id > %s) OR t.sort_order IS NULL)")
+            params.extend([sort_order, sort_order, task_id])
+
     where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
+    with_total = not keyset and (include_total or count_only)
+
     with get_cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) as total FROM tasks t {where_clause}", params)
-        total = cur.fetchone()["total"]
+        if with_total:
+            cur.execute(f"SELECT COUNT(*) as total FROM tasks t {where_clause}", params)
+            total = cur.fetchone()["total"]
+            if count_only:
+                return {"total": total}
 
         query = f"""
             SELECT t.id, t.case_id, c.case_name, c.short_name, t.description,
@@ -102,47 +135,55 @@ def get_tasks(case_id: int = None, status_filter: str = None, exclude_status: st
             FROM tasks t
             JOIN cases c ON t.case_id = c.id
             {where_clause}
-            ORDER BY t.sort_order ASC
+            ORDER BY t.sort_order ASC, t.id ASC
         """
+        if keyset:
+            if limit:
+                query += f" LIMIT {int(limit) + 1}"
+            cur.execute(query, params)
+            tasks, next_cursor = keyset_page(serialize_rows([dict(row) for row in cur.fetchall()]),
+                                             limit, "sort_order")
+            return {"tasks": tasks, "next_cursor": next_cursor}
+
         if limit:
-            query += f" LIMIT {limit}"
+            # Without a count, one extra row tells whether another page exists
+            query += f" LIMIT {limit if with_total else int(limit) + 1}"
         if offset:
             query += f" OFFSET {offset}"
 
         cur.execute(query, params)
-        return {"tasks": serialize_rows([dict(row) for row in cur.fetchall()]), "total": total}
+        tasks = serialize_rows([dict(row) for row in cur.fetchall()])
+        if with_total:
+            return {"tasks": tasks, "total": total}
+        has_more = bool(limit) and len(tasks) > limit
+        return {"tasks": tasks[:limit] if has_more else tasks, "has_more": has_more}
 
 
 def update_task(task_id: int, status: str = None, urgency: int = None) -> Optional[dict]:
     """Update task status and/or urgency."""
-    updates = []
+    columns = []
     params = []
+    extra_sets = ()
 
     if status:
         validate_task_status(status)
-        updates.append("status = %s")
+        columns.append("status")
         params.append(status)
         # Auto-set completion_date when marking as Done
         if status == "Done":
-            updates.append("completion_date = CURRENT_DATE")
+            extra_sets = ("completion_date = CURRENT_DATE",)
 
     if urgency:
         validate_urgency(urgency)
-        updates.append("urgency = %s")
+        columns.append("urgency")
         params.append(urgency)
 
-    if not updates:
+    if not columns:
         return None
 
-    params.append(task_id)
-
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE tasks SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, case_id, description, due_date, completion_date, status, urgency, event_id, sort_order, docket_category, docket_order, created_at
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "tasks", task_id, columns, params,
+                             returning=_TASK_COLUMNS, extra_sets=extra_sets)
         return serialize_row(dict(row)) if row else None
 
 
@@ -151,59 +192,52 @@ def update_task_full(task_id: int, description: str = _NOT_PROVIDED, due_date: s
                      urgency: int = _NOT_PROVIDED, docket_category: str = _NOT_PROVIDED,
                      docket_order: int = _NOT_PROVIDED) -> Optional[dict]:
     """Update all task fields."""
-    updates = []
+    columns = []
     params = []
 
     if description is not _NOT_PROVIDED:
-        updates.append("description = %s")
+        columns.append("description")
         params.append(description)
 
     if due_date is not _NOT_PROVIDED:
         if due_date is not None and due_date != "":
             validate_date_format(due_date, "due_date")
-        updates.append("due_date = %s")
+        columns.append("due_date")
         params.append(due_date if due_date else None)
 
     if completion_date is not _NOT_PROVIDED:
         if completion_date is not None and completion_date != "":
             validate_date_format(completion_date, "completion_date")
-        updates.append("completion_date = %s")
+        columns.append("completion_date")
         params.append(completion_date if completion_date else None)
 
     if status is not _NOT_PROVIDED:
         if status is not None:
             validate_task_status(status)
-        updates.append("status = %s")
+        columns.append("status")
         params.append(status)
 
     if urgency is not _NOT_PROVIDED:
         if urgency is not None:
             validate_urgency(urgency)
-        updates.append("urgency = %s")
+        columns.append("urgency")
         params.append(urgency)
 
     if docket_category is not _NOT_PROVIDED:
         if docket_category is not None:
             validate_docket_category(docket_category)
-        updates.append("docket_category = %s")
+        columns.append("docket_category")
         params.append(docket_category)
 
     if docket_order is not _NOT_PROVIDED:
-        updates.append("docket_order = %s")
+        columns.append("docket_order")
         params.append(docket_order)
 
-    if not updates:
+    if not columns:
         return None
 
-    params.append(task_id)
-
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE tasks SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, case_id, description, due_date, completion_date, status, urgency, event_id, sort_order, docket_category, docket_order, created_at
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "tasks", task_id, columns, params, returning=_TASK_COLUMNS)
         return serialize_row(dict(row)) if row else None
 
 
@@ -243,6 +277,7 @@ def bulk_update_tasks_for_case(case_id: int, status: str, current_status: str =
         return {"updated": cur.rowcount}
 
 
+@cached(ttl=READ_CACHE_TTL)
 def search_tasks(query: str = None, case_id: int = None, status: str = None,
                  urgency: int = None, limit: int = 50) -> List[dict]:
     """Search tasks by various criteria."""
@@ -251,7 +286,7 @@ def search_tasks(query: str = None, case_id: int = None, status: str = None,
 
     if query:
         conditions.append("t.description ILIKE %s")
-        params.append(f"%{query}%")
+        params.append(like_pattern(query))
 
     if case_id:
         conditions.append("t.case_id = %s")
@@ -294,23 +329,16 @@ def reorder_task(task_id: int, new_sort_order: int, new_urgency: int = None) ->
     Returns:
         The updated task with new sort_order (and urgency if changed)
     """
-    updates = ["sort_order = %s"]
+    columns = ["sort_order"]
     params = [new_sort_order]
 
     if new_urgency is not None:
         validate_urgency(new_urgency)
-        updates.append("urgency = %s")
+        columns.append("urgency")
         params.append(new_urgency)
 
-    params.append(task_id)
-
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE tasks SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, case_id, description, due_date, completion_date, status, urgency, event_id, sort_order, docket_category, docket_order, created_at
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "tasks", task_id, columns, params, returning=_TASK_COLUMNS)
         return serialize_row(dict(row)) if row else None
 
 
@@ -368,29 +396,22 @@ def update_docket(task_id: int, docket_category: str = _NOT_PROVIDED,
     Returns:
         The updated task
     """
-    updates = []
+    columns = []
     params = []
 
     if docket_category is not _NOT_PROVIDED:
         if docket_category is not None:
             validate_docket_category(docket_category)
-        updates.append("docket_category = %s")
+        columns.append("docket_category")
         params.append(docket_category)
 
     if docket_order is not _NOT_PROVIDED:
-        updates.append("docket_order = %s")
+        columns.append("docket_order")
         params.append(docket_order)
 
-    if not updates:
+    if not columns:
         return None
 
-    params.append(task_id)
-
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE tasks SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, case_id, description, due_date, completion_date, status, urgency, event_id, sort_order, docket_category, docket_order, created_at
-        """, params)
-        row = cur.fetchone()
+        row = update_changed(cur, "tasks", task_id, columns, params, returning=_TASK_COLUMNS)
         return serialize_row(dict(row)) if row else None
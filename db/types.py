@@ -1,127 +1,123 @@
 """
 Expertise types and person types functions.
+
+Both tables share the same (id, name, description) shape, so their CRUD
+operations come from a single _TypeTable whose SQL is built once per table
+at import time rather than per call.
 """
 
 from typing import Optional, List
 
 from .connection import get_cursor
+from .cache import cached, LOOKUP_CACHE_TTL
+
+
+class _TypeTable:
+    """CRUD operations for a simple (id, name, description) lookup table."""
+
+    def __init__(self, table: str):
+        self.table = table
+        self.select_all_sql = f"SELECT id, name, description FROM {table} ORDER BY name"
+        self.select_by_id_sql = f"SELECT id, name, description FROM {table} WHERE id = %s"
+        self.insert_sql = (
+            f"INSERT INTO {table} (name, description) VALUES (%s, %s) "
+            "RETURNING id, name, description"
+        )
+        self.update_sql = {
+            columns: f"UPDATE {table} SET {', '.join(c + ' = %s' for c in columns)} "
+                     "WHERE id = %s RETURNING id, name, description"
+            for columns in (("name",), ("description",), ("name", "description"))
+        }
+        self.delete_sql = f"DELETE FROM {table} WHERE id = %s"
+
+    def get_all(self) -> List[dict]:
+        with get_cursor() as cur:
+            cur.execute(self.select_all_sql)
+            return [dict(row) for row in cur.fetchall()]
+
+    def create(self, name: str, description: str = None) -> dict:
+        with get_cursor() as cur:
+            cur.execute(self.insert_sql, (name, description))
+            return dict(cur.fetchone())
+
+    def get_by_id(self, type_id: int) -> Optional[dict]:
+        with get_cursor() as cur:
+            cur.execute(self.select_by_id_sql, (type_id,))
+            row = cur.fetchone()
+            return dict(row) if row else None
+
+    def update(self, type_id: int, name: str = None, description: str = None) -> Optional[dict]:
+        columns = tuple(c for c, v in (("name", name), ("description", description)) if v is not None)
+        if not columns:
+            return self.get_by_id(type_id)
+
+        params = [v for v in (name, description) if v is not None]
+        params.append(type_id)
+        with get_cursor() as cur:
+            cur.execute(self.update_sql[columns], params)
+            row = cur.fetchone()
+            return dict(row) if row else None
+
+    def delete(self, type_id: int) -> bool:
+        with get_cursor() as cur:
+            cur.execute(self.delete_sql, (type_id,))
+            return cur.rowcount > 0
+
+
+_expertise_types = _TypeTable("expertise_types")
+_person_types = _TypeTable("person_types")
 
 
 # ===== EXPERTISE TYPE OPERATIONS =====
 
 def get_expertise_types() -> List[dict]:
     """Get all expertise types."""
-    with get_cursor() as cur:
-        cur.execute("SELECT id, name, description FROM expertise_types ORDER BY name")
-        return [dict(row) for row in cur.fetchall()]
+    return _expertise_types.get_all()
 
 
 def create_expertise_type(name: str, description: str = None) -> dict:
     """Create a new expertise type."""
-    with get_cursor() as cur:
-        cur.execute("""
-            INSERT INTO expertise_types (name, description)
-            VALUES (%s, %s)
-            RETURNING id, name, description
-        """, (name, description))
-        return dict(cur.fetchone())
+    return _expertise_types.create(name, description)
 
 
 def get_expertise_type_by_id(expertise_type_id: int) -> Optional[dict]:
     """Get an expertise type by ID."""
-    with get_cursor() as cur:
-        cur.execute("SELECT id, name, description FROM expertise_types WHERE id = %s", (expertise_type_id,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+    return _expertise_types.get_by_id(expertise_type_id)
 
 
 def update_expertise_type(expertise_type_id: int, name: str = None, description: str = None) -> Optional[dict]:
     """Update an expertise type."""
-    updates = []
-    params = []
-    if name is not None:
-        updates.append("name = %s")
-        params.append(name)
-    if description is not None:
-        updates.append("description = %s")
-        params.append(description)
-
-    if not updates:
-        return get_expertise_type_by_id(expertise_type_id)
-
-    params.append(expertise_type_id)
-    with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE expertise_types SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, name, description
-        """, params)
-        row = cur.fetchone()
-        return dict(row) if row else None
+    return _expertise_types.update(expertise_type_id, name, description)
 
 
 def delete_expertise_type(expertise_type_id: int) -> bool:
     """Delete an expertise type."""
-    with get_cursor() as cur:
-        cur.execute("DELETE FROM expertise_types WHERE id = %s", (expertise_type_id,))
-        return cur.rowcount > 0
+    return _expertise_types.delete(expertise_type_id)
 
 
 # ===== PERSON TYPE OPERATIONS =====
 
+@cached(ttl=LOOKUP_CACHE_TTL)
 def get_person_types() -> List[dict]:
     """Get all person types."""
-    with get_cursor() as cur:
-        cur.execute("SELECT id, name, description FROM person_types ORDER BY name")
-        return [dict(row) for row in cur.fetchall()]
+    return _person_types.get_all()
 
 
 def create_person_type(name: str, description: str = None) -> dict:
     """Create a new person type."""
-    with get_cursor() as cur:
-        cur.execute("""
-            INSERT INTO person_types (name, description)
-            VALUES (%s, %s)
-            RETURNING id, name, description
-        """, (name, description))
-        return dict(cur.fetchone())
+    return _person_types.create(name, description)
 
 
 def get_person_type_by_id(person_type_id: int) -> Optional[dict]:
     """Get a person type by ID."""
-    with get_cursor() as cur:
-        cur.execute("SELECT id, name, description FROM person_types WHERE id = %s", (person_type_id,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+    return _person_types.get_by_id(person_type_id)
 
 
 def update_person_type(person_type_id: int, name: str = None, description: str = None) -> Optional[dict]:
     """Update a person type."""
-    updates = []
-    params = []
-    if name is not None:
-        updates.append("name = %s")
-        params.append(name)
-    if description is not None:
-        updates.append("description = %s")
-        params.append(description)
-
-    if not updates:
-        return get_person_type_by_id(person_type_id)
-
-    params.append(person_type_id)
-    with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE person_types SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, name, description
-        """, params)
-        row = cur.fetchone()
-        return dict(row) if row else None
+    return _person_types.update(person_type_id, name, description)
 
 
 def delete_person_type(person_type_id: int) -> bool:
     """Delete a person type."""
-    with get_cursor() as cur:
-        cur.execute("DELETE FROM person_types WHERE id = %s", (person_type_id,))
-        return cur.rowcount > 0
+    return _person_types.delete(person_type_id)
@@ -3,6 +3,15 @@ Validation helper functions for database operations.
 """
 
 import re
+from datetime import date
+from functools import lru_cache
+
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_TIME_RE = re.compile(r'\d{2}:\d{2}')
+
+# C-implemented ISO date parser, memoized: bulk imports and repeated edits
+# validate the same handful of dates over and over
+_parse_iso_date = lru_cache(maxsize=4096)(date.fromisoformat)
 
 # Valid statuses and roles
 CASE_STATUSES = [
@@ -55,6 +64,18 @@ DEFAULT_JURISDICTIONS = [
     {"name": "San Bernardino Superior", "local_rules_link": None},
 ]
 
+# Set views of the enumerations above for O(1) membership checks; the lists
+# are kept for ordering in error messages and the constants API.
+CASE_STATUSES_SET = frozenset(CASE_STATUSES)
+TASK_STATUSES_SET = frozenset(TASK_STATUSES)
+PERSON_SIDES_SET = frozenset(PERSON_SIDES)
+JUDGE_ROLES_SET = frozenset(JUDGE_ROLES)
+
+# Allowed-value lists as they appear in error messages
+_CASE_STATUSES_MSG = ', '.join(CASE_STATUSES)
+_TASK_STATUSES_MSG = ', '.join(TASK_STATUSES)
+_PERSON_SIDES_MSG = ', '.join(PERSON_SIDES)
+
 
 class ValidationError(Exception):
     """Raised when input validation fails."""
@@ -63,15 +84,15 @@ class ValidationError(Exception):
 
 def validate_case_status(status: str) -> str:
     """Validate case status against allowed values."""
-    if status not in CASE_STATUSES:
-        raise ValidationError(f"Invalid case status '{status}'. Must be one of: {', '.join(CASE_STATUSES)}")
+    if not isinstance(status, str) or status not in CASE_STATUSES_SET:
+        raise ValidationError(f"Invalid case status '{status}'. Must be one of: {_CASE_STATUSES_MSG}")
     return status
 
 
 def validate_task_status(status: str) -> str:
     """Validate task status against allowed values."""
-    if status not in TASK_STATUSES:
-        raise ValidationError(f"Invalid task status '{status}'. Must be one of: {', '.join(TASK_STATUSES)}")
+    if not isinstance(status, str) or status not in TASK_STATUSES_SET:
+        raise ValidationError(f"Invalid task status '{status}'. Must be one of: {_TASK_STATUSES_MSG}")
     return status
 
 
@@ -86,8 +107,16 @@ def validate_date_format(date_str: str, field_name: str = "date") -> str:
     """Validate date string is in YYYY-MM-DD format."""
     if date_str is None:
         return None
-    if not re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+    # Cheap length/separator check first; the regex only runs on plausible input.
+    # The parse then rejects impossible calendar dates such as 2024-02-30
+    # before they reach Postgres.
+    if (len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-'
+            or not _DATE_RE.fullmatch(date_str)):
         raise ValidationError(f"Invalid {field_name} format '{date_str}'. Must be YYYY-MM-DD.")
+    try:
+        _parse_iso_date(date_str)
+    except ValueError:
+        raise ValidationError(f"Invalid {field_name} '{date_str}'. Not a valid calendar date.")
     return date_str
 
 
@@ -95,7 +124,7 @@ def validate_time_format(time_str: str, field_name: str = "time") -> str:
     """Validate time string is in HH:MM format."""
     if time_str is None:
         return None
-    if not re.match(r'^\d{2}:\d{2}$', time_str):
+    if len(time_str) != 5 or time_str[2] != ':' or not _TIME_RE.fullmatch(time_str):
         raise ValidationError(f"Invalid {field_name} format '{time_str}'. Must be HH:MM.")
     return time_str
 
@@ -109,14 +138,16 @@ def validate_person_type(person_type: str) -> str:
 
 def validate_person_side(side: str) -> str:
     """Validate person side against allowed values."""
-    if side and side not in PERSON_SIDES:
-        raise ValidationError(f"Invalid side '{side}'. Must be one of: {', '.join(PERSON_SIDES)}")
+    if side and (not isinstance(side, str) or side not in PERSON_SIDES_SET):
+        raise ValidationError(f"Invalid side '{side}'. Must be one of: {_PERSON_SIDES_MSG}")
     return side
 
 
 def validate_case_person_role(role: str) -> str:
     """Validate that a case_person role is not a judge role (judges go on proceedings)."""
-    if role in JUDGE_ROLES:
+    if not isinstance(role, str):
+        raise ValidationError(f"Invalid role '{role}'. Must be a string.")
+    if role in JUDGE_ROLES_SET:
         raise ValidationError(
             f"Role '{role}' cannot be assigned directly to a case. "
             "Judges must be assigned to proceedings instead."
@@ -5,11 +5,16 @@ Stores incoming webhook events from external services (e.g., CourtListener)
 for later processing.
 """
 
+import csv
+import io
 import json
-from typing import Optional, List
+from functools import lru_cache
+from typing import Iterator, Optional, List
 from uuid import UUID
 
-from .connection import get_cursor, serialize_row, serialize_rows, _NOT_PROVIDED
+from psycopg2.extras import Json, execute_values
+
+from .connection import get_cursor, server_cursor, execute_prepared, serialize_row, serialize_rows, _NOT_PROVIDED
 
 
 def create_webhook_log(
@@ -26,59 +31,162 @@ def create_webhook_log(
     Returns None if idempotency_key already exists (duplicate webhook).
     """
     with get_cursor() as cur:
-        # Check for duplicate if idempotency_key provided
-        if idempotency_key:
-            cur.execute(
-                "SELECT id FROM webhook_logs WHERE idempotency_key = %s",
-                (idempotency_key,)
-            )
-            if cur.fetchone():
-                return None  # Duplicate webhook
-
-        payload_json = json.dumps(payload) if payload else '{}'
-        headers_json = json.dumps(headers) if headers else '{}'
-
-        cur.execute("""
+        # A duplicate idempotency_key inserts nothing and returns no row
+        execute_prepared(cur, "webhook_log_insert", """
             INSERT INTO webhook_logs (source, event_type, idempotency_key, payload, headers, proceeding_id)
-            VALUES (%s, %s, %s, %s, %s, %s)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            ON CONFLICT (idempotency_key) DO NOTHING
             RETURNING id, source, event_type, idempotency_key, payload, headers, proceeding_id,
                       task_id, event_id, processing_status, processing_error, created_at, processed_at
         """, (
             source,
             event_type,
             idempotency_key,
-            payload_json,
-            headers_json,
+            Json(payload or {}),
+            Json(headers or {}),
             proceeding_id
         ))
         row = cur.fetchone()
-        return serialize_row(dict(row)) if row else None
+        return serialize_row(row) if row else None
+
+
+def create_webhook_logs_bulk(rows: List[dict], page_size: int = 1000) -> List[dict]:
+    """
+    Create many webhook log entries with multi-row INSERTs.
+
+    Each row is a dict with the create_webhook_log() keyword arguments.
+    Rows whose idempotency_key already exists are skipped, so the returned
+    list only contains the entries that were actually inserted.
+    """
+    if not rows:
+        return []
+
+    values = [
+        (
+            row["source"],
+            row.get("event_type"),
+            row.get("idempotency_key"),
+            Json(row.get("payload") or {}),
+            Json(row.get("headers") or {}),
+            row.get("proceeding_id"),
+        )
+        for row in rows
+    ]
+
+    with get_cursor() as cur:
+        inserted = execute_values(cur, """
+            INSERT INTO webhook_logs (source, event_type, idempotency_key, payload, headers, proceeding_id)
+            VALUES %s
+            ON CONFLICT (idempotency_key) DO NOTHING
+            RETURNING id, source, event_type, idempotency_key, payload, headers, proceeding_id,
+                      task_id, event_id, processing_status, processing_error, created_at, processed_at
+        """, values, page_size=page_size, fetch=True)
+        return serialize_rows(inserted)
+
+
+def copy_webhook_logs(rows: List[dict]) -> int:
+    """
+    Backfill webhook logs (e.g. replaying historical events) via COPY.
+
+    Rows are COPYed into a temporary staging table and then moved into
+    webhook_logs with INSERT ... SELECT, because COPY itself cannot skip
+    conflicts. Each row takes the create_webhook_log() keyword arguments plus
+    an optional created_at. Returns the number of rows actually inserted.
+    """
+    if not rows:
+        return 0
+
+    # Empty unquoted CSV fields load as NULL
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow([
+            row["source"],
+            row.get("event_type") or "",
+            row.get("idempotency_key") or "",
+            json.dumps(row.get("payload") or {}),
+            json.dumps(row.get("headers") or {}),
+            row.get("proceeding_id") or "",
+            row.get("created_at") or "",
+        ])
+    buf.seek(0)
+
+    with get_cursor() as cur:
+        cur.execute("""
+            CREATE TEMP TABLE webhook_logs_staging (
+                source VARCHAR(50),
+                event_type VARCHAR(100),
+                idempotency_key UUID,
+                payload JSONB,
+                headers JSONB,
+                proceeding_id INTEGER,
+                created_at TIMESTAMP
+            )
+        """)
+        cur.copy_expert("""
+            COPY webhook_logs_staging (source, event_type, idempotency_key, payload, headers,
+                                       proceeding_id, created_at)
+            FROM STDIN WITH (FORMAT csv)
+        """, buf)
+        cur.execute("""
+            INSERT INTO webhook_logs (source, event_type, idempotency_key, payload, headers,
+                                      proceeding_id, created_at)
+            SELECT source, event_type, idempotency_key, payload, headers,
+                   proceeding_id, COALESCE(created_at, CURRENT_TIMESTAMP)
+            FROM webhook_logs_staging
+            ON CONFLICT (idempotency_key) DO NOTHING
+        """)
+        inserted = cur.rowcount
+        cur.execute("DROP TABLE webhook_logs_staging")
+        return inserted
 
 
 def get_webhook_log_by_id(webhook_id: int) -> Optional[dict]:
     """Get a webhook log entry by ID."""
     with get_cursor() as cur:
-        cur.execute("""
+        execute_prepared(cur, "webhook_log_by_id", """
             SELECT id, source, event_type, idempotency_key, payload, headers, proceeding_id,
                    task_id, event_id, processing_status, processing_error, created_at, processed_at
             FROM webhook_logs
-            WHERE id = %s
+            WHERE id = $1
         """, (webhook_id,))
         row = cur.fetchone()
-        return serialize_row(dict(row)) if row else None
+        return serialize_row(row) if row else None
 
 
 def get_webhook_log_by_idempotency_key(idempotency_key: str) -> Optional[dict]:
     """Get a webhook log entry by idempotency key."""
     with get_cursor() as cur:
-        cur.execute("""
+        execute_prepared(cur, "webhook_log_by_idempotency_key", """
             SELECT id, source, event_type, idempotency_key, payload, headers, proceeding_id,
                    task_id, event_id, processing_status, processing_error, created_at, processed_at
             FROM webhook_logs
-            WHERE idempotency_key = %s
+            WHERE idempotency_key = $1
         """, (idempotency_key,))
         row = cur.fetchone()
-        return serialize_row(dict(row)) if row else None
+        return serialize_row(row) if row else None
+
+
+def _webhook_log_filters(source: str = None, processing_status: str = None,
+                         proceeding_id: int = None) -> tuple:
+    """Build the WHERE clause and params shared by the webhook log listings."""
+    conditions = []
+    params = []
+
+    if source:
+        conditions.append("source = %s")
+        params.append(source)
+
+    if processing_status:
+        conditions.append("processing_status = %s")
+        params.append(processing_status)
+
+    if proceeding_id:
+        conditions.append("proceeding_id = %s")
+        params.append(proceeding_id)
+
+    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    return where_clause, params
 
 
 def get_webhook_logs(
@@ -89,34 +197,46 @@ def get_webhook_logs(
     offset: int = 0,
 ) -> List[dict]:
     """Get webhook logs with optional filtering."""
+    where_clause, params = _webhook_log_filters(source, processing_status, proceeding_id)
+
     with get_cursor() as cur:
-        conditions = []
-        params = []
+        cur.execute(f"""
+            SELECT id, source, event_type, idempotency_key, payload, headers, proceeding_id,
+                   task_id, event_id, processing_status, processing_error, created_at, processed_at
+            FROM webhook_logs
+            {where_clause}
+            ORDER BY created_at DESC
+            LIMIT %s OFFSET %s
+        """, params + [limit, offset])
 
-        if source:
-            conditions.append("source = %s")
-            params.append(source)
+        return serialize_rows(cur.fetchall())
 
-        if processing_status:
-            conditions.append("processing_status = %s")
-            params.append(processing_status)
 
-        if proceeding_id:
-            conditions.append("proceeding_id = %s")
-            params.append(proceeding_id)
+def iter_webhook_logs(
+    source: str = None,
+    processing_status: str = None,
+    proceeding_id: int = None,
+    itersize: int = 500,
+) -> Iterator[dict]:
+    """
+    Stream webhook logs through a server-side cursor.
 
-        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    Rows are fetched from Postgres in batches of `itersize`, so dumping the
+    whole table (large JSONB payloads included) runs in constant memory.
+    The pooled connection is held until the generator is exhausted or closed.
+    """
+    where_clause, params = _webhook_log_filters(source, processing_status, proceeding_id)
 
+    with server_cursor("webhook_logs_stream", itersize) as cur:
         cur.execute(f"""
             SELECT id, source, event_type, idempotency_key, payload, headers, proceeding_id,
                    task_id, event_id, processing_status, processing_error, created_at, processed_at
             FROM webhook_logs
             {where_clause}
             ORDER BY created_at DESC
-            LIMIT %s OFFSET %s
-        """, params + [limit, offset])
-
-        return serialize_rows([dict(row) for row in cur.fetchall()])
+        """, params)
+        for row in cur:
+            yield serialize_row(row)
 
 
 def get_pending_webhook_logs(source: str = None, limit: int = 100) -> List[dict]:
@@ -124,6 +244,27 @@ def get_pending_webhook_logs(source: str = None, limit: int = 100) -> List[dict]
     return get_webhook_logs(source=source, processing_status="pending", limit=limit)
 
 
+# Columns update_webhook_log() can set, in SET-clause order
+_WEBHOOK_UPDATE_FIELDS = ("processing_status", "processing_error", "task_id", "event_id", "proceeding_id")
+
+
+@lru_cache(maxsize=None)
+def _webhook_update_statement(fields: tuple, set_processed_at: bool) -> tuple:
+    """Build (statement name, SQL) for one combination of updated columns."""
+    sets = [f"{field} = ${i}" for i, field in enumerate(fields, 1)]
+    if set_processed_at:
+        sets.append("processed_at = CURRENT_TIMESTAMP")
+    mask = sum(1 << _WEBHOOK_UPDATE_FIELDS.index(field) for field in fields)
+    name = f"webhook_log_update_{mask}{'_done' if set_processed_at else ''}"
+    sql = f"""
+        UPDATE webhook_logs SET {', '.join(sets)}
+        WHERE id = ${len(fields) + 1}
+        RETURNING id, source, event_type, idempotency_key, payload, headers, proceeding_id,
+                  task_id, event_id, processing_status, processing_error, created_at, processed_at
+    """
+    return name, sql
+
+
 def update_webhook_log(
     webhook_id: int,
     processing_status: str = _NOT_PROVIDED,
@@ -133,46 +274,58 @@ def update_webhook_log(
     proceeding_id: int = _NOT_PROVIDED,
 ) -> Optional[dict]:
     """Update a webhook log entry."""
-    updates = []
-    params = []
+    provided = [
+        (field, value)
+        for field, value in zip(
+            _WEBHOOK_UPDATE_FIELDS,
+            (processing_status, processing_error, task_id, event_id, proceeding_id),
+        )
+        if value is not _NOT_PROVIDED
+    ]
 
-    if processing_status is not _NOT_PROVIDED:
-        updates.append("processing_status = %s")
-        params.append(processing_status)
-        # Set processed_at when status changes to completed or failed
-        if processing_status in ("completed", "failed"):
-            updates.append("processed_at = CURRENT_TIMESTAMP")
+    if not provided:
+        return get_webhook_log_by_id(webhook_id)
 
-    if processing_error is not _NOT_PROVIDED:
-        updates.append("processing_error = %s")
-        params.append(processing_error)
+    # Set processed_at when status changes to completed or failed
+    name, sql = _webhook_update_statement(
+        tuple(field for field, _ in provided),
+        processing_status in ("completed", "failed"),
+    )
+    params = [value for _, value in provided]
+    params.append(webhook_id)
 
-    if task_id is not _NOT_PROVIDED:
-        updates.append("task_id = %s")
-        params.append(task_id)
+    with get_cursor() as cur:
+        execute_prepared(cur, name, sql, params)
+        row = cur.fetchone()
+        return serialize_row(row) if row else None
 
-    if event_id is not _NOT_PROVIDED:
-        updates.append("event_id = %s")
-        params.append(event_id)
 
-    if proceeding_id is not _NOT_PROVIDED:
-        updates.append("proceeding_id = %s")
-        params.append(proceeding_id)
+def update_webhook_logs_bulk(updates: List[tuple], page_size: int = 500) -> List[int]:
+    """
+    Apply processing results for many webhook logs in one UPDATE per page.
 
+    Each entry is (webhook_id, processing_status, processing_error, task_id, event_id).
+    None for error/task_id/event_id keeps the existing value, matching
+    mark_webhook_completed()/mark_webhook_failed(). Returns the updated IDs.
+    """
     if not updates:
-        return get_webhook_log_by_id(webhook_id)
-
-    params.append(webhook_id)
+        return []
 
     with get_cursor() as cur:
-        cur.execute(f"""
-            UPDATE webhook_logs SET {', '.join(updates)}
-            WHERE id = %s
-            RETURNING id, source, event_type, idempotency_key, payload, headers, proceeding_id,
-                      task_id, event_id, processing_status, processing_error, created_at, processed_at
-        """, params)
-        row = cur.fetchone()
-        return serialize_row(dict(row)) if row else None
+        rows = execute_values(cur, """
+            UPDATE webhook_logs AS w SET
+                processing_status = v.processing_status,
+                processing_error = COALESCE(v.processing_error, w.processing_error),
+                task_id = COALESCE(v.task_id, w.task_id),
+                event_id = COALESCE(v.event_id, w.event_id),
+                processed_at = CASE WHEN v.processing_status IN ('completed', 'failed')
+                                    THEN CURRENT_TIMESTAMP ELSE w.processed_at END
+            FROM (VALUES %s) AS v(id, processing_status, processing_error, task_id, event_id)
+            WHERE w.id = v.id
+            RETURNING w.id
+        """, updates, template="(%s::int, %s::varchar, %s::text, %s::int, %s::int)",
+            page_size=page_size, fetch=True)
+        return [row["id"] for row in rows]
 
 
 def mark_webhook_processing(webhook_id: int) -> Optional[dict]:
@@ -195,16 +348,6 @@ def mark_webhook_failed(webhook_id: int, error: str) -> Optional[dict]:
     return update_webhook_log(webhook_id, processing_status="failed", processing_error=error)
 
 
-def idempotency_key_exists(idempotency_key: str) -> bool:
-    """Check if an idempotency key already exists."""
-    with get_cursor() as cur:
-        cur.execute(
-            "SELECT 1 FROM webhook_logs WHERE idempotency_key = %s",
-            (idempotency_key,)
-        )
-        return cur.fetchone() is not None
-
-
 def delete_webhook_log(webhook_id: int) -> bool:
     """Delete a webhook log entry. Returns True if deleted, False if not found."""
     with get_cursor() as cur:
@@ -5,7 +5,7 @@ export async function getCases(params?: {
   status?: string;
   limit?: number;
   offset?: number;
-}): Promise<{ cases: CaseSummary[]; total: number }> {
+}): Promise<{ cases: CaseSummary[]; has_more: boolean; total?: number }> {
   const searchParams = new URLSearchParams();
   if (params?.status) searchParams.set('status', params.status);
   if (params?.limit) searchParams.set('limit', String(params.limit));
@@ -6,7 +6,7 @@ export async function getEvents(params?: {
   offset?: number;
   includePast?: boolean;
   pastDays?: number;
-}): Promise<{ events: Event[]; total: number }> {
+}): Promise<{ events: Event[]; has_more: boolean; total?: number }> {
   const searchParams = new URLSearchParams();
   if (params?.limit) searchParams.set('limit', String(params.limit));
   if (params?.offset) searchParams.set('offset', String(params.offset));
@@ -8,6 +8,7 @@ export { ApiError, API_BASE, request } from './common';
 export {
   getStats,
   getConstants,
+  getDashboard,
   getJurisdictions,
   createJurisdiction,
   updateJurisdiction,
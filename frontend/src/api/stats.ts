@@ -1,4 +1,4 @@
-import type { DashboardStats, Constants, Jurisdiction } from '../types';
+import type { DashboardStats, Constants, Jurisdiction, Task, Event } from '../types';
 import { request } from './common';
 
 // Stats & Constants
@@ -10,6 +10,18 @@ export async function getConstants(): Promise<Constants> {
   return request<Constants>('/constants');
 }
 
+// Dashboard first load: stats, open tasks, upcoming events and constants in one request
+export interface DashboardBootstrap {
+  stats: DashboardStats;
+  tasks: { tasks: Task[]; has_more: boolean };
+  events: { events: Event[]; has_more: boolean };
+  constants: Constants;
+}
+
+export async function getDashboard(): Promise<DashboardBootstrap> {
+  return request<DashboardBootstrap>('/dashboard');
+}
+
 // Jurisdictions
 export async function getJurisdictions(): Promise<{ jurisdictions: Jurisdiction[] }> {
   return request('/jurisdictions');
@@ -10,7 +10,7 @@ export async function getTasks(params?: {
   due_date_to?: string;
   limit?: number;
   offset?: number;
-}): Promise<{ tasks: Task[]; total: number }> {
+}): Promise<{ tasks: Task[]; has_more: boolean; total?: number }> {
   const searchParams = new URLSearchParams();
   if (params?.case_id) searchParams.set('case_id', String(params.case_id));
   if (params?.status) searchParams.set('status', params.status);
@@ -17,7 +17,7 @@ import {
 import { DraggableTaskRow } from '../components/tasks';
 import { TaskDropZones } from '../components/docket';
 import { useDragContext } from '../context/DragContext';
-import { getStats, getTasks, getEvents, getConstants, updateTask, deleteTask, updateEvent, deleteEvent, updateDocket } from '../api';
+import { getDashboard, getStats, getTasks, getEvents, getConstants, updateTask, deleteTask, updateEvent, deleteEvent, updateDocket } from '../api';
 import type { Task, Event } from '../types';
 import {
   Briefcase,
@@ -59,28 +59,49 @@ export function Dashboard() {
     })
   );
 
-  const { data: stats, isLoading: statsLoading } = useQuery({
+  // First load fetches stats, tasks, events and constants in one request and
+  // seeds their caches; the queries below take over for refetches and toggles
+  // (and fetch on their own if the bootstrap request fails).
+  const { isPending: bootstrapPending } = useQuery({
+    queryKey: ['dashboard-bootstrap'],
+    queryFn: async () => {
+      const data = await getDashboard();
+      queryClient.setQueryData(['stats'], data.stats);
+      queryClient.setQueryData(['dashboard-tasks', { showDone: false }], data.tasks);
+      queryClient.setQueryData(['dashboard-events', { showPast: false }], data.events);
+      queryClient.setQueryData(['constants'], data.constants);
+      return true;
+    },
+    staleTime: Infinity,
+    retry: false,
+  });
+
+  const { data: stats, isPending: statsLoading } = useQuery({
     queryKey: ['stats'],
     queryFn: getStats,
+    enabled: !bootstrapPending,
   });
 
-  const { data: tasksData, isLoading: tasksLoading } = useQuery({
+  const { data: tasksData, isPending: tasksLoading } = useQuery({
     queryKey: ['dashboard-tasks', { showDone: showDoneTasks }],
     queryFn: () => getTasks(showDoneTasks ? { status: 'Done', limit: 10 } : { exclude_status: 'Done', limit: 10 }),
+    enabled: !bootstrapPending,
   });
 
-  const { data: eventsData, isLoading: eventsLoading } = useQuery({
+  const { data: eventsData, isPending: eventsLoading } = useQuery({
     queryKey: ['dashboard-events', { showPast: showPastEvents }],
     queryFn: () => getEvents({
       limit: 10,
       includePast: showPastEvents,
       pastDays: 14,
     }),
+    enabled: !bootstrapPending,
   });
 
   const { data: constants } = useQuery({
     queryKey: ['constants'],
     queryFn: getConstants,
+    enabled: !bootstrapPending,
   });
 
   const updateTaskMutation = useMutation({
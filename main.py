@@ -6,10 +6,15 @@ Uses PostgreSQL database for persistent storage.
 """
 
 import os
+import sys
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
-import filelock
+import orjson
 from fastmcp import FastMCP
+from starlette.middleware.gzip import GZipMiddleware
 
 import database as db
 from tools import register_tools
@@ -23,23 +28,54 @@ IMPORTANT: Call the get_current_time tool at the start of any session to know th
 This server provides tools to manage cases, tasks, events, contacts, and notes."""
 
 
-def initialize_database():
-    """Initialize database with migrations and seeding.
+INIT_MARKER = "/tmp/galipo_initialized"
+# Seconds between checks while another worker is initializing the database
+INIT_WAIT_INTERVAL = 0.5
+# Give up waiting on a marker whose owner never finished (e.g. it was killed)
+INIT_WAIT_TIMEOUT = 300
 
-    Called once per deployment, protected by file lock for multi-worker safety.
-    """
-    # Use file lock so only one worker initializes the database
-    lock = filelock.FileLock("/tmp/galipo_init.lock", timeout=60)
 
-    with lock:
-        init_marker = "/tmp/galipo_initialized"
+def serialize_tool_result(data) -> str:
+    """Serialize tool results with orjson (compact; dates/UUIDs handled natively)."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Responses smaller than this are sent uncompressed
+GZIP_MINIMUM_SIZE = 1024
+
+# zlib level for dynamic responses. Starlette defaults to 9; on JSON, level 5
+# gets within a few percent of the size at well under half the CPU.
+GZIP_COMPRESS_LEVEL = 5
+
+# Streaming endpoints (MCP transport, chat SSE) must not be buffered by gzip;
+# static assets are served precompressed (or as-is) by routes/static.py
+UNCOMPRESSED_PATH_PREFIXES = (
+    "/mcp", "/sse", "/messages", "/api/v1/chat/stream", "/assets/", "/static/",
+)
+
+
+class CompressionMiddleware:
+    """Gzip HTTP responses, except on streaming endpoints."""
+
+    def __init__(self, app, minimum_size: int = GZIP_MINIMUM_SIZE,
+                 compresslevel: int = GZIP_COMPRESS_LEVEL):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].startswith(UNCOMPRESSED_PATH_PREFIXES):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
 
-        # Check if already initialized in this deployment
-        if os.path.exists(init_marker):
-            print("Database already initialized by another worker, skipping.")
-            return
+def run_schema_setup():
+    """Apply migrations, create missing tables and seed lookup tables.
 
-        # Initialize database on startup
+    Runs under a Postgres advisory lock, so concurrent callers (workers or
+    containers that don't share /tmp) apply the schema one at a time.
+    """
+    with db.schema_lock():
         # Only drop/recreate tables if RESET_DB=true (for development/testing)
         if os.environ.get("RESET_DB", "").lower() == "true":
             print("RESET_DB=true: Dropping and recreating all tables...")
@@ -54,10 +90,70 @@ def initialize_database():
             # Seed lookup tables (idempotent - only inserts if empty)
             db.seed_db()
 
-        # Mark as initialized
-        with open(init_marker, "w") as f:
-            f.write("initialized")
-        print("Database initialization complete.")
+
+def _wait_for_initialization() -> bool:
+    """Block until the worker holding the marker finishes schema setup.
+
+    Returns True once the marker says initialization completed, or False if
+    the marker was removed (that worker failed and the caller should retry).
+    If the marker never completes (its owner died mid-setup), runs the
+    idempotent, lock-serialized setup itself after INIT_WAIT_TIMEOUT.
+    """
+    deadline = time.monotonic() + INIT_WAIT_TIMEOUT
+    while True:
+        # Waits while the initializing worker holds the schema lock
+        with db.schema_lock():
+            pass
+        try:
+            with open(INIT_MARKER, "rb") as f:
+                if f.read() == b"initialized":
+                    return True
+        except FileNotFoundError:
+            return False
+        if time.monotonic() >= deadline:
+            print("Database initialization marker never completed, running setup here.")
+            run_schema_setup()
+            return True
+        # The marker's owner hasn't taken the lock yet
+        time.sleep(INIT_WAIT_INTERVAL)
+
+
+def initialize_database():
+    """Initialize database with migrations and seeding.
+
+    Called once per deployment. The first worker to atomically create the
+    marker file (O_CREAT | O_EXCL) runs the initialization; every other worker
+    gets FileExistsError and waits for it to finish (on the schema advisory
+    lock) before serving, so no worker queries a schema mid-migration.
+
+    Set INIT_DB=false when migrations are applied out of band with
+    `python main.py migrate` (the Docker image does this before starting
+    gunicorn) so serving workers only open their connection pool.
+    """
+    if os.environ.get("INIT_DB", "true").lower() == "false":
+        print("INIT_DB=false: Skipping database initialization.")
+        return
+
+    while True:
+        try:
+            fd = os.open(INIT_MARKER, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            break
+        except FileExistsError:
+            print("Database initialization claimed by another worker, waiting for it.")
+            if _wait_for_initialization():
+                return
+
+    try:
+        run_schema_setup()
+    except Exception:
+        # Release the marker so a waiting worker (or the next restart) retries
+        os.close(fd)
+        os.unlink(INIT_MARKER)
+        raise
+
+    os.write(fd, b"initialized")
+    os.close(fd)
+    print("Database initialization complete.")
 
 
 @asynccontextmanager
@@ -65,19 +161,36 @@ async def lifespan(app):
     """Application lifespan handler.
 
     Initializes database on startup, cleans up on shutdown.
-    Safe for multi-worker deployments (uses file lock).
+    Safe for multi-worker deployments: one worker initializes (atomic marker
+    file) and the others wait for it before warming their pools.
     """
-    # Startup
-    initialize_database()
+    # Route handlers run their sync db calls via asyncio.to_thread. Size that
+    # executor to the connection pool: a thread beyond DB_POOL_MAX could only
+    # fail to check out a connection.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=db.DB_POOL_MAX, thread_name_prefix="db")
+    )
+    # Startup. The blocking DB work runs in a thread so the event loop is
+    # free while migrations run or a schema lock is awaited.
+    await asyncio.to_thread(initialize_database)
+    # Connect and prepare the hot case-list statements before the first request
+    await asyncio.to_thread(db.warm_pool)
+    # Drop cached reads when another worker commits a write
+    db.start_change_listener()
     yield
     # Shutdown - connection pool cleanup is handled by atexit in db/connection.py
 
 
 # Initialize the MCP server with lifespan
-mcp = FastMCP("Legal Case Management", instructions=MCP_INSTRUCTIONS)
+mcp = FastMCP(
+    "Legal Case Management",
+    instructions=MCP_INSTRUCTIONS,
+    tool_serializer=serialize_tool_result,
+)
 
-# Register MCP tools (for AI/Claude integration)
-register_tools(mcp)
+# Register MCP tools (for AI/Claude integration); their sync DB work runs
+# in worker threads so concurrent MCP clients don't block each other
+register_tools(mcp, run_in_thread=True)
 
 # Register HTTP routes (for web UI)
 # Routes are organized in the routes/ package with domain-specific modules:
@@ -95,8 +208,15 @@ register_routes(mcp)
 # Get the FastAPI app and add lifespan
 app = mcp.http_app()
 app.router.lifespan_context = lifespan
+app.add_middleware(CompressionMiddleware)
 
 if __name__ == "__main__":
-    # Run the MCP server with SSE transport for remote access
+    if sys.argv[1:] == ["migrate"]:
+        # One-shot release step: apply the schema and exit without serving
+        run_schema_setup()
+        print("Database migration complete.")
+        sys.exit(0)
+    # Local development: a single process with SSE transport for remote access.
+    # Production runs `app` under gunicorn with WEB_CONCURRENCY workers (see Dockerfile).
     port = int(os.environ.get("PORT", 8000))
     mcp.run(transport="sse", host="0.0.0.0", port=port)
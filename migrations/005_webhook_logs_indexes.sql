@@ -0,0 +1,16 @@
+-- Migration: Index webhook_logs for the list and pending-poll queries
+-- Date: 2026-10-17
+-- Description: get_pending_webhook_logs polls for pending rows ordered by created_at, and
+--              get_webhook_logs filters on source/processing_status ordered by created_at.
+--              The UNIQUE constraint on idempotency_key already provides an index, so the
+--              separate idempotency_key index is redundant.
+
+DROP INDEX IF EXISTS idx_webhook_logs_idempotency_key;
+
+-- Partial index: only unprocessed rows, so the poller stays O(pending)
+CREATE INDEX IF NOT EXISTS idx_webhook_logs_pending
+    ON webhook_logs(created_at DESC) WHERE processing_status = 'pending';
+
+-- Equality columns first, sort column last
+CREATE INDEX IF NOT EXISTS idx_webhook_logs_source_status_created
+    ON webhook_logs(source, processing_status, created_at DESC);
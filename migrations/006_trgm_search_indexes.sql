@@ -0,0 +1,19 @@
+-- Migration: Trigram indexes for substring search
+-- Date: 2026-10-17
+-- Description: search_cases, search_persons, search_events and search_tasks match with
+--              ILIKE '%term%', which a btree index cannot serve, so every search was a
+--              sequential scan. pg_trgm GIN indexes let Postgres answer these with a
+--              bitmap index scan. The JSONB columns are searched as ::text, so their
+--              indexes are on the same expression.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_cases_case_name_trgm ON cases USING GIN (case_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_cases_case_summary_trgm ON cases USING GIN (case_summary gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_cases_case_numbers_trgm ON cases USING GIN ((case_numbers::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_persons_name_trgm ON persons USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_persons_organization_trgm ON persons USING GIN (organization gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_persons_emails_trgm ON persons USING GIN ((emails::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_persons_phones_trgm ON persons USING GIN ((phones::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_events_description_trgm ON events USING GIN (description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_tasks_description_trgm ON tasks USING GIN (description gin_trgm_ops);
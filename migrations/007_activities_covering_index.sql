@@ -0,0 +1,9 @@
+-- Migration: Covering index for per-case activity totals
+-- Date: 2026-10-17
+-- Description: get_activity_summary sums minutes per case. With minutes in the index
+--              leaf, Postgres can answer it with an index-only scan. The new index also
+--              serves every case_id lookup, so idx_activities_case_id is dropped.
+
+CREATE INDEX IF NOT EXISTS idx_activities_case_minutes ON activities(case_id) INCLUDE (minutes);
+
+DROP INDEX IF EXISTS idx_activities_case_id;
@@ -0,0 +1,12 @@
+-- Migration: Composite indexes for per-case task/event counts
+-- Date: 2026-10-17
+-- Description: The case list counts each case's pending tasks (case_id, status) and
+--              upcoming events (case_id, date), and the count_only list endpoints run
+--              the same predicates. Composite indexes make these index-only counts and
+--              still serve plain case_id lookups, so the single-column indexes are dropped.
+
+CREATE INDEX IF NOT EXISTS idx_tasks_case_status ON tasks(case_id, status);
+CREATE INDEX IF NOT EXISTS idx_events_case_date ON events(case_id, date);
+
+DROP INDEX IF EXISTS idx_tasks_case_id;
+DROP INDEX IF EXISTS idx_events_case_id;
@@ -0,0 +1,7 @@
+-- Migration: Index for keyset pagination of the case list
+-- Date: 2026-10-17
+-- Description: The case list is ordered by (case_name, id) and cursor pages seek
+--              with (case_name, id) > (last_name, last_id); a matching btree index
+--              turns each page into an index range scan instead of a sort of all cases.
+
+CREATE INDEX IF NOT EXISTS idx_cases_name_id ON cases(case_name, id);
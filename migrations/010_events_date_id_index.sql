@@ -0,0 +1,11 @@
+-- Migration: Index the calendar's (date, id) ordering
+-- Date: 2026-10-17
+-- Description: Upcoming/past event lists filter on a date range and order by
+--              (date, id), with cursor pages seeking past (last_date, last_id).
+--              A matching btree index returns each page as a pre-sorted range
+--              scan (forward for upcoming, backward for past) that stops at the
+--              LIMIT, instead of sorting every event in the range per request.
+--              It supersedes the single-column date index.
+
+CREATE INDEX IF NOT EXISTS idx_events_date_id ON events(date, id);
+DROP INDEX IF EXISTS idx_events_date;
@@ -22,13 +22,12 @@ def get_connection():
         sys.exit(1)
     return psycopg2.connect(database_url)
 
-def run_migration(migration_file: Path):
-    """Run a single migration file."""
+def run_migration(conn, migration_file: Path):
+    """Run a single migration file in its own transaction on `conn`."""
     print(f"Running migration: {migration_file.name}")
 
     sql = migration_file.read_text()
 
-    conn = get_connection()
     try:
         with conn.cursor() as cur:
             cur.execute(sql)
@@ -38,8 +37,6 @@ def run_migration(migration_file: Path):
         conn.rollback()
         print(f"  ✗ Migration {migration_file.name} failed: {e}")
         raise
-    finally:
-        conn.close()
 
 def main():
     # Load .env if available
@@ -57,17 +54,22 @@ def main():
         if not migration_file.exists():
             print(f"ERROR: Migration file not found: {migration_file}")
             sys.exit(1)
-        run_migration(migration_file)
+        migrations = [migration_file]
     else:
         # Run all SQL migrations in order
         migrations = sorted(migrations_dir.glob("*.sql"))
         if not migrations:
             print("No migrations found")
             return
-
         print(f"Found {len(migrations)} migration(s)")
+
+    # One connection for the whole run instead of a connect + auth per file
+    conn = get_connection()
+    try:
         for migration_file in migrations:
-            run_migration(migration_file)
+            run_migration(conn, migration_file)
+    finally:
+        conn.close()
 
     print("\nAll migrations completed!")
 
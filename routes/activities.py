@@ -5,10 +5,12 @@ Handles activity CRUD operations for cases.
 """
 
 import asyncio
-from fastapi.responses import JSONResponse
 import database as db
 import auth
-from .common import api_error
+from .common import api_error, InsertBatcher, JSONResponse
+
+# Concurrent creates share one INSERT and COMMIT
+_activity_inserts = InsertBatcher(db.add_activities, db.add_activity)
 
 
 def register_activity_routes(mcp):
@@ -38,14 +40,7 @@ def register_activity_routes(mcp):
 
         minutes = data.get("minutes")
 
-        result = await asyncio.to_thread(
-            db.add_activity,
-            case_id,
-            description,
-            activity_type,
-            date,
-            minutes
-        )
+        result = await _activity_inserts.submit(case_id, description, activity_type, date, minutes)
         return JSONResponse({"success": True, "activity": result})
 
     @mcp.custom_route("/api/v1/activities/{activity_id}", methods=["DELETE"])
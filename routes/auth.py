@@ -4,8 +4,8 @@ Authentication routes.
 Handles login, logout, and token verification.
 """
 
-from fastapi.responses import JSONResponse
 import auth
+from .common import JSONResponse
 
 
 def register_auth_routes(mcp):
@@ -5,10 +5,27 @@ Handles case CRUD operations.
 """
 
 import asyncio
-from fastapi.responses import JSONResponse
+from typing import Optional
+from pydantic import BaseModel, Field
 import database as db
 import auth
-from .common import api_error, DEFAULT_PAGE_SIZE
+from .common import (
+    api_error, conditional_json_response, not_modified, parse_query,
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, JSONResponse
+)
+
+# Upper bound on ids accepted by the batch case endpoint
+MAX_BATCH_CASES = 100
+
+
+class CaseListQuery(BaseModel):
+    """Query parameters of GET /api/v1/cases."""
+    status: Optional[str] = None
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(0, ge=0)
+    cursor: Optional[str] = None
+    count_only: bool = False
+    include_total: bool = False
 
 
 def register_case_routes(mcp):
@@ -16,30 +33,63 @@ def register_case_routes(mcp):
 
     @mcp.custom_route("/api/v1/cases", methods=["GET"])
     async def api_list_cases(request):
-        """List all cases with optional filtering and pagination."""
+        """List all cases with optional filtering and pagination.
+
+        Pass ?cursor= (empty for the first page, then each response's
+        next_cursor) for keyset paging; otherwise limit/offset with has_more,
+        plus a total only when ?include_total=1 (it costs a COUNT query).
+        """
+        if err := auth.require_auth(request):
+            return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
+        q, err = parse_query(CaseListQuery, request)
+        if err:
+            return err
+        try:
+            if q.count_only:
+                result = await asyncio.to_thread(db.get_all_cases, q.status, count_only=True)
+            elif q.cursor is not None:
+                result = await asyncio.to_thread(db.get_all_cases, q.status, limit=q.limit, after=q.cursor)
+            else:
+                result = await asyncio.to_thread(db.get_all_cases, q.status, limit=q.limit, offset=q.offset,
+                                                 include_total=q.include_total)
+        except db.ValidationError as e:
+            return api_error(str(e), "VALIDATION_ERROR", 400)
+        return conditional_json_response(request, result, version)
+
+    # Registered before /api/v1/cases/{case_id} so "batch" isn't taken as an ID
+    @mcp.custom_route("/api/v1/cases/batch", methods=["GET"])
+    async def api_get_cases_batch(request):
+        """Get several cases with full details in one call (?ids=1,2,3), each shaped as /cases/{id} returns it."""
         if err := auth.require_auth(request):
             return err
-        status = request.query_params.get("status")
-        limit = request.query_params.get("limit")
-        offset = request.query_params.get("offset", "0")
-        limit = int(limit) if limit else DEFAULT_PAGE_SIZE
-        offset = int(offset)
-        result = await asyncio.to_thread(db.get_all_cases, status, limit=limit, offset=offset)
-        return JSONResponse({
-            "cases": result["cases"],
-            "total": result["total"]
-        })
+        ids = request.query_params.get("ids", "")
+        try:
+            case_ids = [int(i) for i in ids.split(",") if i.strip()]
+        except ValueError:
+            return api_error("ids must be a comma-separated list of integers", "VALIDATION_ERROR", 400)
+        if not case_ids:
+            return api_error("ids is required", "MISSING_FIELD", 400)
+        if len(case_ids) > MAX_BATCH_CASES:
+            return api_error(f"At most {MAX_BATCH_CASES} ids per request", "VALIDATION_ERROR", 400)
+        cases = await asyncio.to_thread(db.get_cases_by_ids, case_ids)
+        return JSONResponse({"cases": cases, "total": len(cases)})
 
     @mcp.custom_route("/api/v1/cases/{case_id}", methods=["GET"])
     async def api_get_case(request):
         """Get a specific case by ID."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         case_id = int(request.path_params["case_id"])
         case = await asyncio.to_thread(db.get_case_by_id, case_id)
         if not case:
             return api_error("Case not found", "NOT_FOUND", 404)
-        return JSONResponse(case)
+        return conditional_json_response(request, case, version)
 
     @mcp.custom_route("/api/v1/cases", methods=["POST"])
     async def api_create_case(request):
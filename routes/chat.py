@@ -13,17 +13,46 @@ import asyncio
 import threading
 from typing import Any, AsyncGenerator
 from pathlib import Path
-from fastapi.responses import JSONResponse
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from starlette.responses import StreamingResponse
 
 import auth
-from .common import api_error
+from .common import api_error, JSONResponse
 
 
 # Rate limiting configuration
 RATE_LIMIT_REQUESTS = 20  # Maximum requests per window
 RATE_LIMIT_WINDOW = 60  # Window size in seconds (1 minute)
 
+# System prompt templates, filled per request with the current Pacific time
+# and the case the user is viewing
+PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+
+SYSTEM_PROMPT_TEMPLATE = """You are an AI assistant for Galipo, a legal case management system for personal injury law firms.
+
+Current date: {current_date}
+Current time: {current_time} (Pacific Time)
+
+You can help users:
+- Query case information, tasks, deadlines, events, contacts
+- Create and update notes, tasks, and events
+- Search for persons and contacts
+
+When dates are mentioned without a year, infer the year from context.
+
+Always be helpful and concise. When you need more information to complete a task, ask clarifying questions."""
+
+CASE_CONTEXT_TEMPLATE = """
+
+The user is currently viewing case ID: {case_id}. When they ask about "this case" or "the case", they mean case ID {case_id}."""
+
+# SSE frame formatters, parsed once. Text deltas are the bulk of the stream, so
+# their frame is prebuilt around the JSON-encoded content (same bytes as
+# json.dumps({"type": "text", "content": content})).
+_SSE_FRAME = "data: {}\n\n".format
+_SSE_TEXT_FRAME = 'data: {{"type": "text", "content": {}}}\n\n'.format
+
 
 class RateLimiter:
     """
@@ -156,6 +185,28 @@ def _tool_results_to_content_blocks(results: list[ToolResult]) -> list[dict[str,
     ]
 
 
+def _sse(payload: dict[str, Any]) -> str:
+    """Format a payload as one SSE data frame."""
+    return _SSE_FRAME(json.dumps(payload))
+
+
+def _sse_text(content: str) -> str:
+    """Format a text delta frame; only the delta itself needs encoding."""
+    return _SSE_TEXT_FRAME(json.dumps(content))
+
+
+def _build_system_prompt(case_context: Any = None) -> str:
+    """Fill the system prompt template with the current date/time and case context."""
+    now_pacific = datetime.now(PACIFIC_TZ)
+    prompt = SYSTEM_PROMPT_TEMPLATE.format(
+        current_date=now_pacific.strftime("%A, %B %d, %Y"),
+        current_time=now_pacific.strftime("%I:%M %p"),
+    )
+    if case_context:
+        prompt += CASE_CONTEXT_TEMPLATE.format(case_id=case_context)
+    return prompt
+
+
 def _get_username_from_request(request) -> str | None:
     """
     Extract the username from the request's JWT token.
@@ -269,32 +320,7 @@ def register_chat_routes(mcp):
         # Get tool definitions
         tools = get_tool_definitions()
 
-        # Build system prompt with current date and optional case context
-        from datetime import datetime
-        from zoneinfo import ZoneInfo
-        pacific = ZoneInfo("America/Los_Angeles")
-        now_pacific = datetime.now(pacific)
-        current_date = now_pacific.strftime("%A, %B %d, %Y")
-        current_time = now_pacific.strftime("%I:%M %p")
-
-        system_prompt = f"""You are an AI assistant for Galipo, a legal case management system for personal injury law firms.
-
-Current date: {current_date}
-Current time: {current_time} (Pacific Time)
-
-You can help users:
-- Query case information, tasks, deadlines, events, contacts
-- Create and update notes, tasks, and events
-- Search for persons and contacts
-
-When dates are mentioned without a year, infer the year from context.
-
-Always be helpful and concise. When you need more information to complete a task, ask clarifying questions."""
-
-        if case_context:
-            system_prompt += f"""
-
-The user is currently viewing case ID: {case_context}. When they ask about "this case" or "the case", they mean case ID {case_context}."""
+        system_prompt = _build_system_prompt(case_context)
 
         async def generate_sse_events() -> AsyncGenerator[str, None]:
             """Generate SSE events from Claude's streaming response."""
@@ -320,7 +346,8 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
 
                     # Track tool calls from this iteration
                     iteration_tool_calls: list[ToolCall] = []
-                    iteration_text = ""
+                    # Text deltas for this iteration, joined once at message_stop
+                    iteration_parts: list[str] = []
 
                     try:
                         # Log the request before sending
@@ -343,8 +370,8 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
                             if event_type == StreamEventType.TEXT.value:
                                 # Send text delta to client
                                 content = event.get("content", "")
-                                iteration_text += content
-                                yield f"data: {json.dumps({'type': 'text', 'content': content})}\n\n"
+                                iteration_parts.append(content)
+                                yield _sse_text(content)
                                 await asyncio.sleep(0)  # Flush to client
 
                             elif event_type == StreamEventType.TOOL_USE.value:
@@ -352,7 +379,7 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
 
                                 if subtype == "start":
                                     # Tool use starting - send tool_start event
-                                    yield f"data: {json.dumps({'type': 'tool_start', 'id': event.get('id'), 'name': event.get('name')})}\n\n"
+                                    yield _sse({'type': 'tool_start', 'id': event.get('id'), 'name': event.get('name')})
                                     await asyncio.sleep(0)  # Flush to client
 
                                 elif subtype == "done":
@@ -379,6 +406,7 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
                             elif event_type == "message_stop":
                                 # Message complete - check stop reason
                                 stop_reason = event.get("stop_reason")
+                                iteration_text = "".join(iteration_parts)
 
                                 # Accumulate usage data from this iteration
                                 usage = event.get("usage")
@@ -404,7 +432,8 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
                                     tool_results: list[ToolResult] = []
                                     for tc in iteration_tool_calls:
                                         start_time = time.time()
-                                        result = execute_tool(tc)
+                                        # Tools run sync DB queries; keep them off the event loop
+                                        result = await asyncio.to_thread(execute_tool, tc)
                                         duration_ms = int((time.time() - start_time) * 1000)
 
                                         tool_results.append(result)
@@ -421,7 +450,7 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
                                         )
 
                                         # Send tool_result event
-                                        yield f"data: {json.dumps({'type': 'tool_result', 'id': tc.id, 'name': tc.name, 'result': result.content, 'is_error': result.is_error, 'duration_ms': duration_ms})}\n\n"
+                                        yield _sse({'type': 'tool_result', 'id': tc.id, 'name': tc.name, 'result': result.content, 'is_error': result.is_error, 'duration_ms': duration_ms})
                                         await asyncio.sleep(0)  # Flush to client
 
                                     # Add tool results to history
@@ -474,17 +503,17 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
                                                 'tool_calls': all_tool_calls,
                                             }
                                         }
-                                        yield f"data: {json.dumps(usage_data)}\n\n"
+                                        yield _sse(usage_data)
                                         await asyncio.sleep(0)  # Flush to client
 
                                     # Send done event
-                                    yield f"data: {json.dumps({'type': 'done', 'conversation_id': conversation_id, 'tool_calls': all_tool_calls if all_tool_calls else None})}\n\n"
+                                    yield _sse({'type': 'done', 'conversation_id': conversation_id, 'tool_calls': all_tool_calls if all_tool_calls else None})
                                     await asyncio.sleep(0)  # Flush to client
                                     return
 
                     except Exception as e:
                         _logger.exception(f"Error in stream iteration: {e}")
-                        yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                        yield _sse({'type': 'error', 'message': str(e)})
                         await asyncio.sleep(0)  # Flush to client
                         return
 
@@ -511,15 +540,15 @@ The user is currently viewing case ID: {case_context}. When they ask about "this
                             'tool_calls': all_tool_calls,
                         }
                     }
-                    yield f"data: {json.dumps(usage_data)}\n\n"
+                    yield _sse(usage_data)
                     await asyncio.sleep(0)  # Flush to client
 
-                yield f"data: {json.dumps({'type': 'done', 'conversation_id': conversation_id, 'tool_calls': all_tool_calls if all_tool_calls else None})}\n\n"
+                yield _sse({'type': 'done', 'conversation_id': conversation_id, 'tool_calls': all_tool_calls if all_tool_calls else None})
                 await asyncio.sleep(0)  # Flush to client
 
             except Exception as e:
                 _logger.exception(f"Error in SSE generation: {e}")
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                yield _sse({'type': 'error', 'message': str(e)})
 
         return StreamingResponse(
             generate_sse_events(),
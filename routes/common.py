@@ -4,8 +4,15 @@ Common utilities for route modules.
 Shared constants, error helpers, and path configurations.
 """
 
+import time
+import asyncio
+import hashlib
+import threading
 from pathlib import Path
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel, ValidationError
+import database as db
 
 # Static directories for both frontends
 STATIC_DIR = Path(__file__).parent.parent / "static"  # Legacy vanilla JS
@@ -14,6 +21,92 @@ REACT_DIST_DIR = Path(__file__).parent.parent / "frontend" / "dist"  # React bui
 REACT_ASSETS_DIR = REACT_DIST_DIR / "assets"
 
 DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# Data responses: the browser must revalidate (cheap 304 via ETag) every time,
+# since the SPA refetches right after its own writes and must not get a
+# pre-write copy from the HTTP cache
+REVALIDATE = "private, no-cache"
+
+# Longest a long-poll request (?wait=N) is held open, and how often it
+# rechecks the in-process data version while held
+MAX_LONG_POLL_WAIT = 30
+LONG_POLL_INTERVAL = 0.25
+
+# Most recent ETag sent per (path, query string), tagged with the data version
+# it was computed at: {key: (version, expires_at, etag)}
+_sent_etags = {}
+_sent_etags_lock = threading.Lock()
+MAX_SENT_ETAGS = 1024
+
+
+class JSONResponse(Response):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    Same compact output as Starlette's JSONResponse, with dates/UUIDs handled
+    natively and anything else unknown falling back to str() (as the MCP tool
+    serializer does).
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+class InsertBatcher:
+    """Coalesce concurrent single-row inserts into one multi-row INSERT.
+
+    Group commit: an insert submitted while a batch is being written waits
+    and goes out with the next batch, so under load N inserts cost one round
+    trip and one COMMIT, while a lone insert is written at once. Each caller
+    still gets its own row back (or its own error) only after it is committed.
+
+    `insert_many(rows)` must return results in input order. If a batch fails
+    (e.g. one row has a bad case_id), its rows are retried one by one with
+    `insert_one(*row)` so only the bad row's caller sees the error.
+    """
+
+    def __init__(self, insert_many, insert_one, max_batch: int = 100):
+        self.insert_many = insert_many
+        self.insert_one = insert_one
+        self.max_batch = max_batch
+        self._pending = []
+        self._draining = False
+        self._task = None  # keeps the drain task referenced while it runs
+
+    async def submit(self, *row):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((row, future))
+        if not self._draining:
+            self._draining = True
+            self._task = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        try:
+            while self._pending:
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                try:
+                    results = await asyncio.to_thread(self.insert_many, [row for row, _ in batch])
+                except Exception:
+                    results = None
+                if results is not None:
+                    for (_, future), result in zip(batch, results):
+                        if not future.done():
+                            future.set_result(result)
+                    continue
+                for row, future in batch:
+                    try:
+                        result = await asyncio.to_thread(self.insert_one, *row)
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+        finally:
+            self._draining = False
 
 
 def api_error(message: str, code: str, status_code: int = 400):
@@ -22,3 +115,95 @@ def api_error(message: str, code: str, status_code: int = 400):
         {"success": False, "error": {"message": message, "code": code}},
         status_code=status_code
     )
+
+
+def parse_query(model: type[BaseModel], request):
+    """Validate a request's query string against `model` in one pass.
+
+    Returns (query, None), or (None, error response) with a 400 naming each
+    bad parameter. Empty values count as absent, except `cursor`, where an
+    empty value means "first page".
+    """
+    params = {k: v for k, v in request.query_params.items() if v != "" or k == "cursor"}
+    try:
+        return model.model_validate(params), None
+    except ValidationError as e:
+        message = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+        return None, api_error(message, "VALIDATION_ERROR", 400)
+
+
+def _etag_key(request) -> tuple:
+    return (request.url.path, request.url.query)
+
+
+def not_modified(request, version: int, cache_control: str = REVALIDATE):
+    """Return a 304 if the client's ETag is still current, before any DB work.
+
+    `version` is db.data_version() read at the start of the handler. If the
+    ETag this URL last sent was computed at that same version (no write has
+    committed since, and it is younger than READ_CACHE_TTL) and the client
+    presents it, the body can't have changed. Returns None otherwise.
+    """
+    client_etag = request.headers.get("if-none-match")
+    if not client_etag:
+        return None
+    sent = _sent_etags.get(_etag_key(request))
+    if sent is None or sent[0] != version or sent[1] <= time.monotonic():
+        return None
+    if sent[2] != client_etag:
+        return None
+    return Response(status_code=304, headers={"ETag": client_etag, "Cache-Control": cache_control})
+
+
+async def wait_until_modified(request, wait: float, cache_control: str = REVALIDATE):
+    """Long-poll: hold a request whose client copy is current until it goes stale.
+
+    Returns the 304 to send if nothing changed within `wait` seconds (capped
+    at MAX_LONG_POLL_WAIT), or None as soon as the client's ETag is no
+    longer current, e.g. a write committed in this or another worker, and
+    the handler should rebuild the response. While held the request only
+    compares the data version; it runs no queries and holds no connection.
+    """
+    deadline = time.monotonic() + min(wait, MAX_LONG_POLL_WAIT)
+    while True:
+        unchanged = not_modified(request, db.data_version(), cache_control)
+        if unchanged is None or time.monotonic() >= deadline:
+            return unchanged
+        await asyncio.sleep(LONG_POLL_INTERVAL)
+
+
+def conditional_json_response(request, content, version: int = None) -> Response:
+    """JSON response with a content-hash ETag; 304 if the client's copy matches.
+
+    Cache-Control: no-cache makes the browser revalidate on every poll, so it
+    never shows stale data after a write but skips the body when unchanged.
+    Pass the data version read before loading `content` to let not_modified()
+    answer the next matching poll without querying.
+    """
+    return conditional_body_response(request, JSONResponse(content).body, version)
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag (quoted content hash) for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def conditional_body_response(request, body: bytes, version: int = None,
+                              cache_control: str = REVALIDATE, etag: str = None) -> Response:
+    """conditional_json_response() for a body that is already JSON-encoded.
+
+    Pass `etag` (from body_etag) when the body is reused across requests so
+    it isn't rehashed each time.
+    """
+    if etag is None:
+        etag = body_etag(body)
+    if version is not None:
+        with _sent_etags_lock:
+            key = _etag_key(request)
+            if key not in _sent_etags and len(_sent_etags) >= MAX_SENT_ETAGS:
+                del _sent_etags[next(iter(_sent_etags))]
+            _sent_etags[key] = (version, time.monotonic() + db.READ_CACHE_TTL, etag)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=JSONResponse.media_type, headers=headers)
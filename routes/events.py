@@ -5,10 +5,25 @@ Handles event (calendar items: hearings, depositions, filing deadlines) CRUD ope
 """
 
 import asyncio
-from fastapi.responses import JSONResponse
+from typing import Optional
+from pydantic import BaseModel, Field
 import database as db
 import auth
-from .common import api_error, DEFAULT_PAGE_SIZE
+from .common import (
+    api_error, conditional_json_response, not_modified, parse_query,
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, JSONResponse
+)
+
+
+class EventListQuery(BaseModel):
+    """Query parameters of GET /api/v1/events."""
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(0, ge=0)
+    include_past: bool = False
+    past_days: int = Field(14, ge=0)
+    cursor: Optional[str] = None
+    count_only: bool = False
+    include_total: bool = False
 
 
 def register_event_routes(mcp):
@@ -16,26 +31,35 @@ def register_event_routes(mcp):
 
     @mcp.custom_route("/api/v1/events", methods=["GET"])
     async def api_list_events(request):
-        """List events with optional filtering and pagination."""
+        """List events with optional filtering and pagination.
+
+        Pass ?cursor= (empty for the first page, then each response's
+        next_cursor) for keyset paging; otherwise limit/offset with has_more,
+        plus a total only when ?include_total=1 (it costs a COUNT query).
+        """
         if err := auth.require_auth(request):
             return err
-        limit = request.query_params.get("limit")
-        offset = request.query_params.get("offset", "0")
-        include_past = request.query_params.get("include_past", "false").lower() == "true"
-        past_days = request.query_params.get("past_days")
-
-        limit = int(limit) if limit else DEFAULT_PAGE_SIZE
-        offset = int(offset)
-        past_days = int(past_days) if past_days else 14
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
+        q, err = parse_query(EventListQuery, request)
+        if err:
+            return err
 
-        result = await asyncio.to_thread(
-            db.get_upcoming_events,
-            limit=limit,
-            offset=offset,
-            include_past=include_past,
-            past_days=past_days
-        )
-        return JSONResponse(result)
+        try:
+            result = await asyncio.to_thread(
+                db.get_upcoming_events,
+                limit=q.limit,
+                offset=q.offset,
+                include_past=q.include_past,
+                past_days=q.past_days,
+                count_only=q.count_only,
+                after=q.cursor,
+                include_total=q.include_total
+            )
+        except db.ValidationError as e:
+            return api_error(str(e), "VALIDATION_ERROR", 400)
+        return conditional_json_response(request, result, version)
 
     @mcp.custom_route("/api/v1/events", methods=["POST"])
     async def api_create_event(request):
@@ -5,10 +5,12 @@ Handles note CRUD operations for cases.
 """
 
 import asyncio
-from fastapi.responses import JSONResponse
 import database as db
 import auth
-from .common import api_error
+from .common import api_error, InsertBatcher, JSONResponse
+
+# Concurrent creates share one INSERT and COMMIT
+_note_inserts = InsertBatcher(db.add_notes, db.add_note)
 
 
 def register_note_routes(mcp):
@@ -20,7 +22,7 @@ def register_note_routes(mcp):
         if err := auth.require_auth(request):
             return err
         data = await request.json()
-        result = await asyncio.to_thread(db.add_note, data["case_id"], data["content"])
+        result = await _note_inserts.submit(data["case_id"], data["content"])
         return JSONResponse({"success": True, "note": result})
 
     @mcp.custom_route("/api/v1/notes/{note_id}", methods=["DELETE"])
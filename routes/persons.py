@@ -5,10 +5,27 @@ Handles person CRUD and case-person assignment operations.
 """
 
 import asyncio
-from fastapi.responses import JSONResponse
+from typing import Optional
+from pydantic import BaseModel, Field
 import database as db
 import auth
-from .common import api_error
+from .common import (
+    api_error, conditional_json_response, not_modified, parse_query,
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, JSONResponse
+)
+
+
+class PersonListQuery(BaseModel):
+    """Query parameters of GET /api/v1/persons."""
+    name: Optional[str] = None
+    type: Optional[str] = None
+    organization: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    case_id: Optional[int] = None
+    archived: bool = False
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(0, ge=0)
 
 
 def register_person_routes(mcp):
@@ -19,29 +36,26 @@ def register_person_routes(mcp):
         """List/search persons with optional filters."""
         if err := auth.require_auth(request):
             return err
-        name = request.query_params.get("name")
-        person_type = request.query_params.get("type")
-        organization = request.query_params.get("organization")
-        email = request.query_params.get("email")
-        phone = request.query_params.get("phone")
-        case_id = request.query_params.get("case_id")
-        include_archived = request.query_params.get("archived", "false").lower() == "true"
-        limit = int(request.query_params.get("limit", 50))
-        offset = int(request.query_params.get("offset", 0))
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
+        q, err = parse_query(PersonListQuery, request)
+        if err:
+            return err
 
         result = await asyncio.to_thread(
             db.search_persons,
-            name=name,
-            person_type=person_type,
-            organization=organization,
-            email=email,
-            phone=phone,
-            case_id=int(case_id) if case_id else None,
-            archived=include_archived,
-            limit=limit,
-            offset=offset
+            name=q.name,
+            person_type=q.type,
+            organization=q.organization,
+            email=q.email,
+            phone=q.phone,
+            case_id=q.case_id,
+            archived=q.archived,
+            limit=q.limit,
+            offset=q.offset
         )
-        return JSONResponse(result)
+        return conditional_json_response(request, result, version)
 
     @mcp.custom_route("/api/v1/persons", methods=["POST"])
     async def api_create_person(request):
@@ -126,13 +140,16 @@ def register_person_routes(mcp):
         """List persons assigned to a case."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         case_id = int(request.path_params["case_id"])
         person_type = request.query_params.get("type")
         role = request.query_params.get("role")
         side = request.query_params.get("side")
 
         persons = await asyncio.to_thread(db.get_case_persons, case_id, person_type, role, side)
-        return JSONResponse({"success": True, "persons": persons, "total": len(persons)})
+        return conditional_json_response(request, {"success": True, "persons": persons, "total": len(persons)}, version)
 
     @mcp.custom_route("/api/v1/cases/{case_id}/persons", methods=["POST"])
     async def api_assign_person_to_case(request):
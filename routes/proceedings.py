@@ -6,10 +6,9 @@ including multi-judge support via judges.
 """
 
 import asyncio
-from fastapi.responses import JSONResponse
 import database as db
 import auth
-from .common import api_error
+from .common import api_error, conditional_json_response, not_modified, JSONResponse
 
 
 def register_proceeding_routes(mcp):
@@ -20,9 +19,12 @@ def register_proceeding_routes(mcp):
         """List all proceedings for a case."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         case_id = int(request.path_params["case_id"])
         proceedings = await asyncio.to_thread(db.get_proceedings, case_id)
-        return JSONResponse({"proceedings": proceedings, "total": len(proceedings)})
+        return conditional_json_response(request, {"proceedings": proceedings, "total": len(proceedings)}, version)
 
     @mcp.custom_route("/api/v1/cases/{case_id}/proceedings", methods=["POST"])
     async def api_create_proceeding(request):
@@ -89,9 +91,12 @@ def register_proceeding_routes(mcp):
         """List all judges for a proceeding."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         proceeding_id = int(request.path_params["proceeding_id"])
         judges = await asyncio.to_thread(db.get_judges, proceeding_id)
-        return JSONResponse({"judges": judges, "total": len(judges)})
+        return conditional_json_response(request, {"judges": judges, "total": len(judges)}, version)
 
     @mcp.custom_route("/api/v1/proceedings/{proceeding_id}/judges", methods=["POST"])
     async def api_add_proceeding_judge(request):
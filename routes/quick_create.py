@@ -8,17 +8,19 @@ Uses Claude (haiku) to parse the user's text and call the appropriate MCP tool.
 import os
 import json
 import logging
+import asyncio
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from fastapi.responses import JSONResponse
 
 import auth
-from .common import api_error
+from .common import api_error, JSONResponse
 from services.chat import ChatClient, ToolCall, execute_tool
 
 # Set up logging
 _logger = logging.getLogger("routes.quick_create")
 
+PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+
 
 # Tool definition for add_task (minimal, just what we need)
 TASK_TOOL = {
@@ -84,8 +86,7 @@ EVENT_TOOL = {
 
 def _get_current_datetime() -> tuple[str, str]:
     """Get current date and time in Pacific timezone."""
-    pacific = ZoneInfo("America/Los_Angeles")
-    now = datetime.now(pacific)
+    now = datetime.now(PACIFIC_TZ)
     current_date = now.strftime("%A, %B %d, %Y")
     current_time = now.strftime("%I:%M %p")
     return current_date, current_time
@@ -196,7 +197,7 @@ def register_quick_create_routes(mcp):
             if "case_id" not in tool_call.arguments:
                 tool_call.arguments["case_id"] = case_id
 
-            result = execute_tool(tool_call)
+            result = await asyncio.to_thread(execute_tool, tool_call)
 
             if result.is_error:
                 _logger.error(f"Tool execution failed: {result.content}")
@@ -296,7 +297,7 @@ def register_quick_create_routes(mcp):
             if "case_id" not in tool_call.arguments:
                 tool_call.arguments["case_id"] = case_id
 
-            result = execute_tool(tool_call)
+            result = await asyncio.to_thread(execute_tool, tool_call)
 
             if result.is_error:
                 _logger.error(f"Tool execution failed: {result.content}")
@@ -4,9 +4,185 @@ Static file serving routes.
 Handles serving of React app assets, legacy static files, and SPA routing.
 """
 
-from fastapi.responses import HTMLResponse, FileResponse
+import gzip
+import hashlib
+import stat
+
+from fastapi.responses import FileResponse, HTMLResponse, Response
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
 from .common import STATIC_DIR, TEMPLATES_DIR, REACT_DIST_DIR, REACT_ASSETS_DIR
 
+# Text assets that may have a precompressed .gz sibling (built by the Dockerfile),
+# with the Content-Type to send for the decompressed file
+PRECOMPRESSED_MEDIA_TYPES = {
+    ".js": "text/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".svg": "image/svg+xml",
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json",
+}
+
+# Cap on remembered "no .gz sibling" paths per immutable directory
+MAX_NO_GZ_PATHS = 4096
+
+# Files up to this size are kept in memory after the first read; larger
+# ones are streamed from disk every time
+MAX_CACHED_FILE_SIZE = 256 * 1024
+
+# Vite emits content-hashed asset names, so they never change in place
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Legacy static files keep fixed names; revalidate via ETag/Last-Modified
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a precompressed `<file>.gz` when the client accepts gzip.
+
+    StaticFiles already handles path traversal, ETag/Last-Modified
+    revalidation (304) and streams the file without reading it into memory.
+    Each file's response headers (and, for small files, its bytes) are kept
+    in memory, keyed by path and rebuilt only when its mtime changes, so a
+    hit costs the stat StaticFiles already does: no content-type guess,
+    header formatting or open/read.
+
+    With `immutable=True` (content-hashed build output) the files never change
+    while the process runs, so whether a path has a .gz sibling is remembered
+    and paths without one skip the extra stat.
+    """
+
+    def __init__(self, *, cache_control: str, immutable: bool = False, **kwargs):
+        super().__init__(check_dir=False, **kwargs)
+        self.cache_control = cache_control
+        self._no_gz = set() if immutable else None
+        # full path -> (mtime_ns, response headers, bytes or None if too large)
+        self._files = {}
+
+    async def get_response(self, path: str, scope):
+        response = None
+        suffix = path[path.rfind("."):]
+        if (suffix in PRECOMPRESSED_MEDIA_TYPES
+                and b"gzip" in _header(scope, b"accept-encoding")
+                and not (self._no_gz is not None and path in self._no_gz)):
+            try:
+                response = await super().get_response(path + ".gz", scope)
+            except HTTPException:
+                response = None
+            if response is not None and response.status_code == 404:
+                response = None
+            if response is None:
+                # Bounded, since request paths are client-controlled
+                if self._no_gz is not None and len(self._no_gz) < MAX_NO_GZ_PATHS:
+                    self._no_gz.add(path)
+            else:
+                response.headers["Content-Type"] = PRECOMPRESSED_MEDIA_TYPES[suffix]
+                response.headers["Content-Encoding"] = "gzip"
+        if response is None:
+            response = await super().get_response(path, scope)
+        if suffix in PRECOMPRESSED_MEDIA_TYPES:
+            response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+    def lookup_path(self, path: str):
+        # StaticFiles runs this in a worker thread, so the file is (re)read
+        # here rather than on the event loop in file_response()
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            entry = self._files.get(full_path)
+            if entry is None or entry[0] != stat_result.st_mtime_ns:
+                # Content-Type, ETag, Last-Modified and Content-Length, derived once per file version
+                headers = dict(FileResponse(full_path, stat_result=stat_result).headers)
+                body = None
+                if stat_result.st_size <= MAX_CACHED_FILE_SIZE:
+                    with open(full_path, "rb") as f:
+                        body = f.read()
+                self._files[full_path] = (stat_result.st_mtime_ns, headers, body)
+        return full_path, stat_result
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        entry = self._files.get(full_path)
+        if entry is None or entry[0] != stat_result.st_mtime_ns:
+            return super().file_response(full_path, stat_result, scope, status_code)
+        _, headers, body = entry
+        if self.is_not_modified(Headers(headers), Headers(scope=scope)):
+            return NotModifiedResponse(Headers(headers))
+        if body is None or _header(scope, b"range"):
+            return FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        return Response(body, status_code=status_code, headers=headers)
+
+
+def _header(scope, name: bytes) -> bytes:
+    """Return a raw request header value from an ASGI scope (b"" if absent)."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return b""
+
+
+class CachedPage:
+    """An HTML shell held in memory as bytes, with its headers prebuilt.
+
+    The file is re-read only when its mtime changes (e.g. after a frontend
+    rebuild), so a hit costs one stat() instead of stat + open + read. A
+    gzipped copy is made at the same time, so clients that accept gzip get
+    it without the compression middleware redoing the work per request.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._mtime_ns = None
+        self.body = b""
+        self.gzip_body = b""
+        self.headers = {}
+
+    def _load(self) -> bool:
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime_ns != self._mtime_ns:
+            body = self.path.read_bytes()
+            self.headers = {
+                "Cache-Control": "no-cache",
+                "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+                "Vary": "Accept-Encoding",
+            }
+            self.gzip_body = gzip.compress(body, compresslevel=9)
+            self.body = body
+            self._mtime_ns = mtime_ns
+        return True
+
+    def response(self, request) -> Response | None:
+        """Return the page (or a 304), or None if the file doesn't exist."""
+        if not self._load():
+            return None
+        if request.headers.get("if-none-match") == self.headers["ETag"]:
+            return Response(status_code=304, headers=self.headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(self.gzip_body, media_type="text/html",
+                            headers={**self.headers, "Content-Encoding": "gzip"})
+        return Response(self.body, media_type="text/html", headers=self.headers)
+
+
+_react_index = CachedPage(REACT_DIST_DIR / "index.html")
+_legacy_index = CachedPage(TEMPLATES_DIR / "index.html")
+
+_react_assets = PrecompressedStaticFiles(directory=REACT_ASSETS_DIR, cache_control=IMMUTABLE_CACHE_CONTROL,
+                                        immutable=True)
+_legacy_static = PrecompressedStaticFiles(directory=STATIC_DIR, cache_control=REVALIDATE_CACHE_CONTROL)
+# Root of the React build, for un-hashed files such as vite.svg
+_react_root = PrecompressedStaticFiles(directory=REACT_DIST_DIR, cache_control=REVALIDATE_CACHE_CONTROL)
+
+
+async def _serve_from(static_files: PrecompressedStaticFiles, request, filename: str = None):
+    """Serve `filename` (default: the route's filename param) from a StaticFiles directory, or a plain 404."""
+    try:
+        return await static_files.get_response(filename or request.path_params["filename"], request.scope)
+    except HTTPException:
+        return HTMLResponse("Not found", status_code=404)
+
 
 def register_static_routes(mcp):
     """Register static file serving routes."""
@@ -15,69 +191,33 @@ def register_static_routes(mcp):
     @mcp.custom_route("/assets/{filename:path}", methods=["GET"])
     async def serve_react_assets(request):
         """Serve React app assets (JS, CSS)."""
-        filename = request.path_params["filename"]
-        file_path = REACT_ASSETS_DIR / filename
-        if file_path.exists() and file_path.is_file():
-            content_types = {
-                ".css": "text/css",
-                ".js": "application/javascript",
-                ".png": "image/png",
-                ".jpg": "image/jpeg",
-                ".svg": "image/svg+xml",
-                ".woff": "font/woff",
-                ".woff2": "font/woff2",
-            }
-            content_type = content_types.get(file_path.suffix, "application/octet-stream")
-            return FileResponse(file_path, media_type=content_type)
-        return HTMLResponse("Not found", status_code=404)
+        return await _serve_from(_react_assets, request)
 
     # Root-level React assets (like vite.svg)
     @mcp.custom_route("/vite.svg", methods=["GET"])
     async def serve_vite_svg(request):
         """Serve vite.svg from React dist."""
-        file_path = REACT_DIST_DIR / "vite.svg"
-        if file_path.exists():
-            return FileResponse(file_path, media_type="image/svg+xml")
-        return HTMLResponse("Not found", status_code=404)
+        return await _serve_from(_react_root, request, "vite.svg")
 
     # Legacy vanilla JS frontend
     @mcp.custom_route("/legacy", methods=["GET"])
     async def legacy_dashboard(request):
         """Serve the legacy vanilla JS dashboard."""
-        html_path = TEMPLATES_DIR / "index.html"
-        if html_path.exists():
-            return FileResponse(html_path, media_type="text/html")
-        return HTMLResponse("Legacy template not found", status_code=404)
+        return _legacy_index.response(request) or HTMLResponse("Legacy template not found", status_code=404)
 
     @mcp.custom_route("/static/{filename:path}", methods=["GET"])
     async def serve_static(request):
         """Serve static files for legacy frontend (CSS, JS, images)."""
-        filename = request.path_params["filename"]
-        file_path = STATIC_DIR / filename
-        if file_path.exists() and file_path.is_file():
-            content_types = {
-                ".css": "text/css",
-                ".js": "application/javascript",
-                ".png": "image/png",
-                ".jpg": "image/jpeg",
-                ".svg": "image/svg+xml"
-            }
-            content_type = content_types.get(file_path.suffix, "application/octet-stream")
-            return FileResponse(file_path, media_type=content_type)
-        return HTMLResponse("Not found", status_code=404)
+        return await _serve_from(_legacy_static, request)
 
     # SPA catch-all routes - must be registered last
     @mcp.custom_route("/", methods=["GET"])
     async def serve_react_app_root(request):
         """Serve React app for root path."""
-        html_path = REACT_DIST_DIR / "index.html"
-        if html_path.exists():
-            return FileResponse(html_path, media_type="text/html")
         # Fallback to legacy
-        html_path = TEMPLATES_DIR / "index.html"
-        if html_path.exists():
-            return FileResponse(html_path, media_type="text/html")
-        return HTMLResponse("No frontend found", status_code=404)
+        return (_react_index.response(request)
+                or _legacy_index.response(request)
+                or HTMLResponse("No frontend found", status_code=404))
 
     @mcp.custom_route("/{path:path}", methods=["GET"])
     async def serve_react_app_catchall(request):
@@ -87,7 +227,4 @@ def register_static_routes(mcp):
         if path.startswith("api/"):
             return HTMLResponse("Not found", status_code=404)
         # Serve React app
-        html_path = REACT_DIST_DIR / "index.html"
-        if html_path.exists():
-            return FileResponse(html_path, media_type="text/html")
-        return HTMLResponse("Not found", status_code=404)
+        return _react_index.response(request) or HTMLResponse("Not found", status_code=404)
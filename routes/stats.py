@@ -4,50 +4,166 @@ Statistics and constants routes.
 Provides dashboard stats and system constants for the frontend.
 """
 
+import time
 import asyncio
-from fastapi.responses import JSONResponse
+import logging
+import psycopg2
+from psycopg2.pool import PoolError
+from pydantic import BaseModel, Field
 import database as db
 import auth
-from .common import api_error
+from .common import (
+    api_error, conditional_json_response, conditional_body_response, body_etag, not_modified,
+    parse_query, wait_until_modified, MAX_LONG_POLL_WAIT, JSONResponse
+)
+
+
+_logger = logging.getLogger("routes.stats")
+
+# Rows per list on the dashboard's first load (matches the SPA's page size)
+DASHBOARD_LIST_SIZE = 10
+
+# Browsers may reuse /constants for this long without asking (matches the
+# SPA's default React Query staleTime, so it is never staler than the SPA
+# would already allow)
+CONSTANTS_CACHE_CONTROL = "private, max-age=60"
+
+# Encoded /constants body and its ETag for the data version it was built at:
+# (version, expires_at, body, etag). Rebuilt only after a write or LOOKUP_CACHE_TTL.
+_constants_body = None
+
+# Last dashboard stats successfully loaded, served (with X-Stale: true) if the
+# database is unreachable so the dashboard degrades instead of erroring
+_last_stats = None
+
+
+async def _load_constants() -> dict:
+    """Build the /constants payload, fetching DB values in parallel."""
+    person_types, jurisdictions = await asyncio.gather(
+        asyncio.to_thread(db.get_person_types),
+        asyncio.to_thread(db.get_jurisdictions)
+    )
+    return {
+        "case_statuses": db.CASE_STATUSES,
+        "task_statuses": db.TASK_STATUSES,
+        "activity_types": db.ACTIVITY_TYPES,
+        "person_types": [pt["name"] for pt in person_types],
+        "person_sides": db.PERSON_SIDES,
+        "jurisdictions": jurisdictions
+    }
+
+
+class StatsQuery(BaseModel):
+    """Query parameters of GET /api/v1/stats."""
+    # Seconds to hold a request whose If-None-Match is current before the 304
+    wait: float = Field(0, ge=0, le=MAX_LONG_POLL_WAIT)
 
 
 def register_stats_routes(mcp):
     """Register statistics and constants routes."""
 
+    @mcp.custom_route("/healthz", methods=["GET"])
+    async def healthz(request):
+        """Readiness check: the server is up and the database answers."""
+        try:
+            await asyncio.to_thread(db.ping)
+        except Exception as e:
+            return api_error(f"Database unavailable: {e}", "DB_UNAVAILABLE", 503)
+        return JSONResponse({"status": "ok"})
+
     @mcp.custom_route("/api/v1/stats", methods=["GET"])
     async def api_stats(request):
-        """Get dashboard statistics."""
+        """Get dashboard statistics.
+
+        With ?wait=N and a current If-None-Match, the request is held until
+        the data changes (then answered with fresh stats) or N seconds pass
+        (then 304), so a polling dashboard makes one request per change
+        instead of one per interval.
+        """
+        if err := auth.require_auth(request):
+            return err
+        q, err = parse_query(StatsQuery, request)
+        if err:
+            return err
+        if q.wait:
+            if unchanged := await wait_until_modified(request, q.wait):
+                return unchanged
+        global _last_stats
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
+        try:
+            stats = await asyncio.to_thread(db.get_dashboard_stats)
+        except (psycopg2.OperationalError, PoolError) as e:
+            # Only connectivity failures fall back; any other error is a bug and surfaces
+            if _last_stats is None:
+                raise
+            _logger.warning(f"Dashboard stats unavailable, serving last good copy: {e}")
+            return JSONResponse(_last_stats, headers={"Cache-Control": "no-store", "X-Stale": "true"})
+        _last_stats = stats
+        return conditional_json_response(request, stats, version)
+
+    @mcp.custom_route("/api/v1/cache-stats", methods=["GET"])
+    async def api_cache_stats(request):
+        """Get hit/miss counters for the in-process read caches (for tuning TTLs)."""
         if err := auth.require_auth(request):
             return err
-        stats = await asyncio.to_thread(db.get_dashboard_stats)
-        return JSONResponse(stats)
+        return JSONResponse({"success": True, "caches": db.cache_stats()})
 
     @mcp.custom_route("/api/v1/constants", methods=["GET"])
     async def api_constants(request):
         """Get system constants (statuses, person types, jurisdictions, etc.)."""
         if err := auth.require_auth(request):
             return err
-        # Fetch DB values in parallel
-        person_types, jurisdictions = await asyncio.gather(
-            asyncio.to_thread(db.get_person_types),
-            asyncio.to_thread(db.get_jurisdictions)
+        global _constants_body
+        version = db.data_version()
+        if unchanged := not_modified(request, version, CONSTANTS_CACHE_CONTROL):
+            return unchanged
+        cached = _constants_body
+        if cached is None or cached[0] != version or cached[1] <= time.monotonic():
+            body = JSONResponse(await _load_constants()).body
+            cached = (version, time.monotonic() + db.LOOKUP_CACHE_TTL, body, body_etag(body))
+            _constants_body = cached
+        return conditional_body_response(request, cached[2], version, CONSTANTS_CACHE_CONTROL,
+                                         etag=cached[3])
+
+    @mcp.custom_route("/api/v1/dashboard", methods=["GET"])
+    async def api_dashboard(request):
+        """Get everything the dashboard shows on first load in one response.
+
+        Same payloads as /stats, /tasks (open, first page), /events
+        (upcoming, first page) and /constants, fetched in parallel.
+        """
+        if err := auth.require_auth(request):
+            return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
+        stats, tasks, events, constants = await asyncio.gather(
+            asyncio.to_thread(db.get_dashboard_stats),
+            asyncio.to_thread(db.get_tasks, exclude_status="Done", limit=DASHBOARD_LIST_SIZE,
+                              include_total=False),
+            asyncio.to_thread(db.get_upcoming_events, limit=DASHBOARD_LIST_SIZE,
+                              include_past=False, past_days=14, include_total=False),
+            _load_constants()
         )
-        return JSONResponse({
-            "case_statuses": db.CASE_STATUSES,
-            "task_statuses": db.TASK_STATUSES,
-            "activity_types": db.ACTIVITY_TYPES,
-            "person_types": [pt["name"] for pt in person_types],
-            "person_sides": db.PERSON_SIDES,
-            "jurisdictions": jurisdictions
-        })
+        return conditional_json_response(request, {
+            "stats": stats,
+            "tasks": tasks,
+            "events": events,
+            "constants": constants
+        }, version)
 
     @mcp.custom_route("/api/v1/jurisdictions", methods=["GET"])
     async def api_list_jurisdictions(request):
         """List all jurisdictions."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         jurisdictions = await asyncio.to_thread(db.get_jurisdictions)
-        return JSONResponse({"success": True, "jurisdictions": jurisdictions, "total": len(jurisdictions)})
+        return conditional_json_response(request, {"success": True, "jurisdictions": jurisdictions, "total": len(jurisdictions)}, version)
 
     @mcp.custom_route("/api/v1/jurisdictions", methods=["POST"])
     async def api_create_jurisdiction(request):
@@ -97,8 +213,11 @@ def register_stats_routes(mcp):
         """List all expertise types."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         types = await asyncio.to_thread(db.get_expertise_types)
-        return JSONResponse({"success": True, "expertise_types": types, "total": len(types)})
+        return conditional_json_response(request, {"success": True, "expertise_types": types, "total": len(types)}, version)
 
     @mcp.custom_route("/api/v1/expertise-types", methods=["POST"])
     async def api_create_expertise_type(request):
@@ -114,8 +233,11 @@ def register_stats_routes(mcp):
         """List all person types."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         types = await asyncio.to_thread(db.get_person_types)
-        return JSONResponse({"success": True, "person_types": types, "total": len(types)})
+        return conditional_json_response(request, {"success": True, "person_types": types, "total": len(types)}, version)
 
     @mcp.custom_route("/api/v1/person-types", methods=["POST"])
     async def api_create_person_type(request):
@@ -5,10 +5,29 @@ Handles task CRUD operations and reordering.
 """
 
 import asyncio
-from fastapi.responses import JSONResponse
+from typing import Optional
+from pydantic import BaseModel, Field
 import database as db
 import auth
-from .common import api_error, DEFAULT_PAGE_SIZE
+from .common import (
+    api_error, conditional_json_response, not_modified, parse_query,
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, JSONResponse
+)
+
+
+class TaskListQuery(BaseModel):
+    """Query parameters of GET /api/v1/tasks."""
+    case_id: Optional[int] = None
+    status: Optional[str] = None
+    exclude_status: Optional[str] = None
+    urgency: Optional[int] = None
+    due_date_from: Optional[str] = None
+    due_date_to: Optional[str] = None
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(0, ge=0)
+    cursor: Optional[str] = None
+    count_only: bool = False
+    include_total: bool = False
 
 
 def register_task_routes(mcp):
@@ -16,32 +35,39 @@ def register_task_routes(mcp):
 
     @mcp.custom_route("/api/v1/tasks", methods=["GET"])
     async def api_list_tasks(request):
-        """List tasks with optional filtering and pagination."""
+        """List tasks with optional filtering and pagination.
+
+        Pass ?cursor= (empty for the first page, then each response's
+        next_cursor) for keyset paging; otherwise limit/offset with has_more,
+        plus a total only when ?include_total=1 (it costs a COUNT query).
+        """
         if err := auth.require_auth(request):
             return err
-        case_id = request.query_params.get("case_id")
-        status = request.query_params.get("status")
-        exclude_status = request.query_params.get("exclude_status")
-        urgency = request.query_params.get("urgency")
-        due_date_from = request.query_params.get("due_date_from")
-        due_date_to = request.query_params.get("due_date_to")
-        limit = request.query_params.get("limit")
-        offset = request.query_params.get("offset", "0")
-        limit = int(limit) if limit else DEFAULT_PAGE_SIZE
-        offset = int(offset)
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
+        q, err = parse_query(TaskListQuery, request)
+        if err:
+            return err
 
-        result = await asyncio.to_thread(
-            db.get_tasks,
-            case_id=int(case_id) if case_id else None,
-            status_filter=status,
-            exclude_status=exclude_status,
-            urgency_filter=int(urgency) if urgency else None,
-            due_date_from=due_date_from,
-            due_date_to=due_date_to,
-            limit=limit,
-            offset=offset
-        )
-        return JSONResponse(result)
+        try:
+            result = await asyncio.to_thread(
+                db.get_tasks,
+                case_id=q.case_id,
+                status_filter=q.status,
+                exclude_status=q.exclude_status,
+                urgency_filter=q.urgency,
+                due_date_from=q.due_date_from,
+                due_date_to=q.due_date_to,
+                limit=q.limit,
+                offset=q.offset,
+                count_only=q.count_only,
+                after=q.cursor,
+                include_total=q.include_total
+            )
+        except db.ValidationError as e:
+            return api_error(str(e), "VALIDATION_ERROR", 400)
+        return conditional_json_response(request, result, version)
 
     @mcp.custom_route("/api/v1/tasks", methods=["POST"])
     async def api_create_task(request):
@@ -114,9 +140,12 @@ def register_task_routes(mcp):
         """Get all tasks in the daily docket, grouped by category."""
         if err := auth.require_auth(request):
             return err
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
         exclude_done = request.query_params.get("exclude_done", "true").lower() == "true"
         result = await asyncio.to_thread(db.get_docket_tasks, exclude_done=exclude_done)
-        return JSONResponse(result)
+        return conditional_json_response(request, result, version)
 
     @mcp.custom_route("/api/v1/docket/{task_id}", methods=["PUT"])
     async def api_update_docket(request):
@@ -8,17 +8,29 @@ No session authentication required - uses token-based validation.
 import os
 import asyncio
 import logging
-from fastapi.responses import JSONResponse
+from typing import Optional
+
+from pydantic import BaseModel, Field
 
 import auth
 import database as db
-from .common import api_error
+from .common import (
+    api_error, conditional_json_response, not_modified, parse_query, MAX_PAGE_SIZE, JSONResponse
+)
 
 
 # Webhook secrets from environment variables
 WEBHOOK_SECRET_COURTLISTENER = os.environ.get("WEBHOOK_SECRET_COURTLISTENER", "")
 
 
+class WebhookListQuery(BaseModel):
+    """Query parameters of GET /api/v1/webhooks."""
+    source: Optional[str] = None
+    status: Optional[str] = None
+    limit: int = Field(100, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(0, ge=0)
+
+
 def register_webhook_routes(mcp):
     """Register webhook receiver routes."""
 
@@ -27,20 +39,21 @@ def register_webhook_routes(mcp):
         """List all webhook logs with optional filtering."""
         if err := auth.require_auth(request):
             return err
-
-        source = request.query_params.get("source")
-        status = request.query_params.get("status")
-        limit = int(request.query_params.get("limit", "100"))
-        offset = int(request.query_params.get("offset", "0"))
+        version = db.data_version()
+        if unchanged := not_modified(request, version):
+            return unchanged
+        q, err = parse_query(WebhookListQuery, request)
+        if err:
+            return err
 
         webhooks = await asyncio.to_thread(
             db.get_webhook_logs,
-            source=source,
-            processing_status=status,
-            limit=limit,
-            offset=offset,
+            source=q.source,
+            processing_status=q.status,
+            limit=q.limit,
+            offset=q.offset,
         )
-        return JSONResponse({"webhooks": webhooks})
+        return conditional_json_response(request, {"webhooks": webhooks}, version)
 
     @mcp.custom_route("/api/v1/webhooks/{webhook_id}", methods=["GET"])
     async def get_webhook(request):
@@ -107,13 +120,6 @@ def register_webhook_routes(mcp):
             return api_error("Invalid JSON payload", "INVALID_PAYLOAD", 400)
 
         try:
-            # Check for duplicate if idempotency key provided
-            if idempotency_key:
-                exists = await asyncio.to_thread(db.idempotency_key_exists, idempotency_key)
-                if exists:
-                    # Return 200 OK for duplicates (idempotent behavior)
-                    return JSONResponse({"success": True, "duplicate": True})
-
             # Extract event type from payload if available
             # CourtListener webhooks have a "webhook" key with metadata
             event_type = None
@@ -136,7 +142,8 @@ def register_webhook_routes(mcp):
             # 4. Mark webhook as "completed" or "failed" based on processing result
             # 5. Consider background job queue vs synchronous processing
 
-            # Store the webhook for later processing
+            # Store the webhook for later processing (a repeated idempotency key
+            # is rejected by the INSERT itself and comes back as None)
             result = await asyncio.to_thread(
                 db.create_webhook_log,
                 source="courtlistener",
@@ -161,6 +161,7 @@ CREATE TABLE judges (
 
 -- Indexes for better query performance
 CREATE INDEX idx_cases_status ON cases(status);
+CREATE INDEX idx_cases_name_id ON cases(case_name, id);
 CREATE INDEX idx_persons_name ON persons(name);
 CREATE INDEX idx_persons_type ON persons(person_type);
 CREATE INDEX idx_persons_archived ON persons(archived);
@@ -168,13 +169,25 @@ CREATE INDEX idx_persons_attributes ON persons USING GIN (attributes);
 CREATE INDEX idx_case_persons_case_id ON case_persons(case_id);
 CREATE INDEX idx_case_persons_person_id ON case_persons(person_id);
 CREATE INDEX idx_case_persons_role ON case_persons(role);
-CREATE INDEX idx_tasks_case_id ON tasks(case_id);
+CREATE INDEX idx_tasks_case_status ON tasks(case_id, status);
 CREATE INDEX idx_tasks_status ON tasks(status);
 CREATE INDEX idx_tasks_sort_order ON tasks(sort_order);
-CREATE INDEX idx_events_case_id ON events(case_id);
-CREATE INDEX idx_events_date ON events(date);
-CREATE INDEX idx_activities_case_id ON activities(case_id);
+CREATE INDEX idx_events_case_date ON events(case_id, date);
+CREATE INDEX idx_events_date_id ON events(date, id);
+CREATE INDEX idx_activities_case_minutes ON activities(case_id) INCLUDE (minutes);
 CREATE INDEX idx_notes_case_id ON notes(case_id);
 CREATE INDEX idx_proceedings_case_id ON proceedings(case_id);
 CREATE INDEX idx_judges_proceeding_id ON judges(proceeding_id);
 CREATE INDEX idx_judges_person_id ON judges(person_id);
+
+-- Trigram indexes for ILIKE substring search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_cases_case_name_trgm ON cases USING GIN (case_name gin_trgm_ops);
+CREATE INDEX idx_cases_case_summary_trgm ON cases USING GIN (case_summary gin_trgm_ops);
+CREATE INDEX idx_cases_case_numbers_trgm ON cases USING GIN ((case_numbers::text) gin_trgm_ops);
+CREATE INDEX idx_persons_name_trgm ON persons USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_persons_organization_trgm ON persons USING GIN (organization gin_trgm_ops);
+CREATE INDEX idx_persons_emails_trgm ON persons USING GIN ((emails::text) gin_trgm_ops);
+CREATE INDEX idx_persons_phones_trgm ON persons USING GIN ((phones::text) gin_trgm_ops);
+CREATE INDEX idx_events_description_trgm ON events USING GIN (description gin_trgm_ops);
+CREATE INDEX idx_tasks_description_trgm ON tasks USING GIN (description gin_trgm_ops);
@@ -14,6 +14,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 def _is_production() -> bool:
     """Detect if running in production environment."""
@@ -44,6 +46,16 @@ def _ensure_log_dir():
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _write_entry(entry: dict):
+    """Append a single entry to the JSONL log.
+
+    orjson handles datetimes/UUIDs natively, so tool arguments and results
+    can be logged without a serialize_row() pre-pass.
+    """
+    with open(LOG_FILE, "ab") as f:
+        f.write(orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+
+
 def _estimate_tokens(text: str) -> int:
     """Rough token estimate (~4 chars per token for English)."""
     if not text:
@@ -114,8 +126,7 @@ def log_request(
         "tools": tools,
     }
 
-    with open(LOG_FILE, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _write_entry(entry)
 
 
 def log_response(
@@ -148,8 +159,7 @@ def log_response(
         "tool_calls": tool_calls,
     }
 
-    with open(LOG_FILE, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _write_entry(entry)
 
 
 def log_tool_execution(
@@ -181,8 +191,7 @@ def log_tool_execution(
         "result": result[:2000] + "..." if len(result) > 2000 else result,  # Truncate large results
     }
 
-    with open(LOG_FILE, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _write_entry(entry)
 
 
 def log_conversation_summary(
@@ -206,8 +215,7 @@ def log_conversation_summary(
         "total_duration_ms": total_duration_ms,
     }
 
-    with open(LOG_FILE, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _write_entry(entry)
 
 
 def get_tool_summary() -> dict:
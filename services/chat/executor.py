@@ -5,11 +5,12 @@ This module executes tools by calling the MCP tool functions directly,
 ensuring consistent behavior between the MCP server and chat feature.
 """
 
-import json
 import logging
 import time
 from typing import Any
 
+import orjson
+
 from services.chat.types import ToolCall, ToolResult
 from services.chat.tools import get_mcp_instance, BLACKLIST
 
@@ -54,6 +55,11 @@ class ChatContext:
 _context = ChatContext()
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to a JSON string (orjson, str() fallback)."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def _truncate_result(result: Any, tool_name: str) -> tuple[str, bool]:
     """Truncate large results intelligently.
 
@@ -64,7 +70,7 @@ def _truncate_result(result: Any, tool_name: str) -> tuple[str, bool]:
     Returns:
         Tuple of (json_string, was_truncated)
     """
-    json_str = json.dumps(result, default=str)
+    json_str = _dumps(result)
 
     if len(json_str) <= MAX_RESULT_CHARS:
         return json_str, False
@@ -74,16 +80,16 @@ def _truncate_result(result: Any, tool_name: str) -> tuple[str, bool]:
         total_count = len(result)
         for take in [10, 5, 3, 1]:
             truncated = result[:take]
-            truncated_json = json.dumps({
+            truncated_json = _dumps({
                 "items": truncated,
                 "truncated": True,
                 "showing": take,
                 "total": total_count,
                 "note": f"Showing first {take} of {total_count} items"
-            }, default=str)
+            })
             if len(truncated_json) <= MAX_RESULT_CHARS:
                 return truncated_json, True
-        return json.dumps({
+        return _dumps({
             "truncated": True,
             "total": total_count,
             "note": f"Result too large. Contains {total_count} items."
@@ -99,13 +105,13 @@ def _truncate_result(result: Any, tool_name: str) -> tuple[str, bool]:
                     truncated_result['truncated'] = True
                     truncated_result['showing'] = take
                     truncated_result['total_items'] = total_count
-                    truncated_json = json.dumps(truncated_result, default=str)
+                    truncated_json = _dumps(truncated_result)
                     if len(truncated_json) <= MAX_RESULT_CHARS:
                         return truncated_json, True
 
     # Fallback: simple character truncation
     truncated_json = json_str[:MAX_RESULT_CHARS - 100]
-    return json.dumps({
+    return _dumps({
         "partial_result": truncated_json,
         "truncated": True,
         "note": "Result truncated due to size"
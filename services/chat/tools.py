@@ -5,6 +5,7 @@ This module dynamically generates tool definitions from the registered MCP tools
 ensuring the chat feature always has access to the same tools as the MCP server.
 """
 
+from functools import lru_cache
 from typing import Any
 from fastmcp import FastMCP
 from tools import register_tools
@@ -56,16 +57,9 @@ def _clean_schema(schema: dict[str, Any]) -> dict[str, Any]:
     return cleaned
 
 
-def get_tool_definitions() -> list[dict[str, Any]]:
-    """Generate tool definitions from MCP tools for Claude API.
-
-    Returns tool definitions in Claude's expected format, automatically
-    derived from the registered MCP tools. Internal parameters like
-    'context' are filtered out.
-
-    Returns:
-        List of tool definitions with name, description, and input_schema.
-    """
+@lru_cache(maxsize=1)
+def _build_tool_definitions() -> tuple[dict[str, Any], ...]:
+    """Build the cleaned tool definitions once; tools are fixed after import."""
     definitions = []
 
     for tool in _mcp._tool_manager._tools.values():
@@ -81,7 +75,21 @@ def get_tool_definitions() -> list[dict[str, Any]]:
             "input_schema": cleaned_schema,
         })
 
-    return definitions
+    return tuple(definitions)
+
+
+def get_tool_definitions() -> list[dict[str, Any]]:
+    """Generate tool definitions from MCP tools for Claude API.
+
+    Returns tool definitions in Claude's expected format, automatically
+    derived from the registered MCP tools. Internal parameters like
+    'context' are filtered out. The definitions are built once and shared
+    across requests; callers must not mutate the dicts.
+
+    Returns:
+        List of tool definitions with name, description, and input_schema.
+    """
+    return list(_build_tool_definitions())
 
 
 def get_tool_names() -> list[str]:
@@ -31,6 +31,15 @@ const API = {
 let constants = { case_statuses: [], task_statuses: [], contact_roles: [] };
 let currentView = 'dashboard';
 
+// Date formatters, built once instead of per rendered row
+const DATE_FORMAT = new Intl.DateTimeFormat('en-US', {
+    weekday: 'short', month: 'short', day: 'numeric', year: 'numeric'
+});
+const DATE_TIME_FORMAT = new Intl.DateTimeFormat('en-US', {
+    weekday: 'short', month: 'short', day: 'numeric', year: 'numeric',
+    hour: 'numeric', minute: '2-digit'
+});
+
 // Human-readable date formatting
 function formatDate(dateStr) {
     if (!dateStr) return null;
@@ -39,8 +48,7 @@ function formatDate(dateStr) {
     const diffTime = date - now;
     const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
 
-    const options = { weekday: 'short', month: 'short', day: 'numeric', year: 'numeric' };
-    const formatted = date.toLocaleDateString('en-US', options);
+    const formatted = DATE_FORMAT.format(date);
 
     // Add relative indicator for upcoming dates
     if (diffDays === 0) return `${formatted} (Today)`;
@@ -54,11 +62,18 @@ function formatDate(dateStr) {
 
 function formatDateTime(dateStr) {
     if (!dateStr) return null;
-    const date = new Date(dateStr);
-    return date.toLocaleDateString('en-US', {
-        weekday: 'short', month: 'short', day: 'numeric', year: 'numeric',
-        hour: 'numeric', minute: '2-digit'
-    });
+    return DATE_TIME_FORMAT.format(new Date(dateStr));
+}
+
+// HTML escaping for API data interpolated into innerHTML templates
+const HTML_ESCAPES = Object.freeze({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+});
+const HTML_ESCAPE_RE = /[&<>"']/g;
+
+function escapeHtml(value) {
+    if (value == null) return '';
+    return String(value).replace(HTML_ESCAPE_RE, ch => HTML_ESCAPES[ch]);
 }
 
 // Toast notifications
@@ -90,23 +105,26 @@ function navigate(view, params = {}) {
 }
 
 // Status badge colors
+const STATUS_COLORS = Object.freeze({
+    'Signing Up': 'gray', 'Prospective': 'blue', 'Pre-Filing': 'yellow',
+    'Pleadings': 'blue', 'Discovery': 'green', 'Expert Discovery': 'green',
+    'Pre-trial': 'yellow', 'Trial': 'red', 'Post-Trial': 'purple',
+    'Appeal': 'purple', 'Settl. Pend.': 'purple', 'Stayed': 'gray', 'Closed': 'gray',
+    'Pending': 'yellow', 'Active': 'blue', 'Done': 'green',
+    'Partially Complete': 'yellow', 'Blocked': 'red', 'Awaiting Atty Review': 'purple',
+    'Complete': 'green'
+});
+
+// Urgency badges, indexed by urgency level (1-4)
+const URGENCY_LABELS = Object.freeze(['', 'Low', 'Medium', 'High', 'Urgent']);
+const URGENCY_COLORS = Object.freeze(['', 'green', 'yellow', 'red', 'red']);
+
 function getStatusBadge(status) {
-    const colors = {
-        'Signing Up': 'gray', 'Prospective': 'blue', 'Pre-Filing': 'yellow',
-        'Pleadings': 'blue', 'Discovery': 'green', 'Expert Discovery': 'green',
-        'Pre-trial': 'yellow', 'Trial': 'red', 'Post-Trial': 'purple',
-        'Appeal': 'purple', 'Settl. Pend.': 'purple', 'Stayed': 'gray', 'Closed': 'gray',
-        'Pending': 'yellow', 'Active': 'blue', 'Done': 'green',
-        'Partially Complete': 'yellow', 'Blocked': 'red', 'Awaiting Atty Review': 'purple',
-        'Complete': 'green'
-    };
-    return `<span class="badge badge-${colors[status] || 'gray'}">${status}</span>`;
+    return `<span class="badge badge-${STATUS_COLORS[status] || 'gray'}">${status}</span>`;
 }
 
 function getUrgencyBadge(urgency) {
-    const labels = { 1: 'Low', 2: 'Medium', 3: 'High', 4: 'Urgent' };
-    const colors = { 1: 'green', 2: 'yellow', 3: 'red', 4: 'red' };
-    return `<span class="badge badge-${colors[urgency]}">${labels[urgency]}</span>`;
+    return `<span class="badge badge-${URGENCY_COLORS[urgency]}">${URGENCY_LABELS[urgency]}</span>`;
 }
 
 function getUrgencyClass(urgency) {
@@ -117,9 +135,9 @@ function getUrgencyClass(urgency) {
 async function renderDashboard() {
     const [stats, tasksRes, eventsRes, casesRes] = await Promise.all([
         API.get('/api/v1/stats'),
-        API.get('/api/v1/tasks?status=Pending'),
-        API.get('/api/v1/events'),
-        API.get('/api/v1/cases')
+        API.get('/api/v1/tasks?status=Pending&limit=8'),
+        API.get('/api/v1/events?limit=8'),
+        API.get('/api/v1/cases?limit=6')
     ]);
 
     const content = document.getElementById('main-content');
@@ -130,7 +148,7 @@ async function renderDashboard() {
         </div>
 
         <div class="stats-grid">
-            <div class="stat-card" onclick="navigate('cases')" style="cursor:pointer">
+            <div class="stat-card clickable" onclick="navigate('cases')">
                 <div class="stat-icon blue">
                     <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M22 19a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h5l2 3h9a2 2 0 0 1 2 2z"></path></svg>
                 </div>
@@ -139,7 +157,7 @@ async function renderDashboard() {
                     <div class="stat-label">Active Cases</div>
                 </div>
             </div>
-            <div class="stat-card" onclick="navigate('tasks')" style="cursor:pointer">
+            <div class="stat-card clickable" onclick="navigate('tasks')">
                 <div class="stat-icon yellow">
                     <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M9 11l3 3L22 4"></path><path d="M21 12v7a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h11"></path></svg>
                 </div>
@@ -148,7 +166,7 @@ async function renderDashboard() {
                     <div class="stat-label">Pending Tasks</div>
                 </div>
             </div>
-            <div class="stat-card" onclick="navigate('calendar')" style="cursor:pointer">
+            <div class="stat-card clickable" onclick="navigate('calendar')">
                 <div class="stat-icon green">
                     <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="3" y="4" width="18" height="18" rx="2" ry="2"></rect><line x1="16" y1="2" x2="16" y2="6"></line><line x1="8" y1="2" x2="8" y2="6"></line><line x1="3" y1="10" x2="21" y2="10"></line></svg>
                 </div>
@@ -181,9 +199,9 @@ async function renderDashboard() {
                                 ${tasksRes.tasks.slice(0, 8).map(t => `
                                     <div class="list-item ${getUrgencyClass(t.urgency)}" onclick="navigate('case', {id: ${t.case_id}})">
                                         <div class="list-item-main">
-                                            <div class="list-item-title">${t.description}</div>
+                                            <div class="list-item-title">${escapeHtml(t.description)}</div>
                                             <div class="list-item-meta">
-                                                <span class="meta-case">${t.case_name}</span>
+                                                <span class="meta-case">${escapeHtml(t.case_name)}</span>
                                                 ${t.due_date ? `<span class="meta-date">${formatDate(t.due_date)}</span>` : ''}
                                             </div>
                                         </div>
@@ -208,9 +226,9 @@ async function renderDashboard() {
                                 ${eventsRes.events.slice(0, 8).map(e => `
                                     <div class="list-item ${getUrgencyClass(e.urgency)}" onclick="navigate('case', {id: ${e.case_id}})">
                                         <div class="list-item-main">
-                                            <div class="list-item-title">${e.description}</div>
+                                            <div class="list-item-title">${escapeHtml(e.description)}</div>
                                             <div class="list-item-meta">
-                                                <span class="meta-case">${e.case_name}</span>
+                                                <span class="meta-case">${escapeHtml(e.case_name)}</span>
                                                 <span class="meta-date">${formatDate(e.date)}</span>
                                             </div>
                                         </div>
@@ -234,7 +252,7 @@ async function renderDashboard() {
                         <div class="case-list">
                             ${casesRes.cases.slice(0, 6).map(c => `
                                 <div class="case-list-item" onclick="navigate('case', {id: ${c.id}})">
-                                    <div class="case-list-name">${c.case_name}</div>
+                                    <div class="case-list-name">${escapeHtml(c.case_name)}</div>
                                     <div class="case-list-status">${getStatusBadge(c.status)}</div>
                                 </div>
                             `).join('')}
@@ -270,9 +288,9 @@ async function renderCases() {
 
         <div class="cases-grid">
             ${cases.map(c => `
-                <div class="case-card case-row" data-name="${c.case_name.toLowerCase()}" data-status="${c.status}" onclick="navigate('case', {id: ${c.id}})">
+                <div class="case-card case-row" data-name="${escapeHtml(c.case_name.toLowerCase())}" data-status="${c.status}" onclick="navigate('case', {id: ${c.id}})">
                     <div class="case-card-header">
-                        <h3 class="case-card-title">${c.case_name}</h3>
+                        <h3 class="case-card-title">${escapeHtml(c.case_name)}</h3>
                         <div class="case-card-actions" onclick="event.stopPropagation()">
                             <button class="action-btn" onclick="openCaseModal(${c.id})" title="Edit">
                                 <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="none" stroke="currentColor" stroke-width="2"><path d="M11 4H4a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7"></path><path d="M18.5 2.5a2.121 2.121 0 0 1 3 3L12 15l-4 1 1-4 9.5-9.5z"></path></svg>
@@ -317,7 +335,7 @@ async function renderCaseDetail(caseId) {
                 </button>
                 <div class="case-detail-title-row">
                     <div>
-                        <h1 class="case-detail-title">${caseData.case_name}</h1>
+                        <h1 class="case-detail-title">${escapeHtml(caseData.case_name)}</h1>
                         <div class="case-detail-meta">
                             ${getStatusBadge(caseData.status)}
                         </div>
@@ -329,7 +347,7 @@ async function renderCaseDetail(caseId) {
             ${caseData.case_summary ? `
                 <div class="case-summary">
                     <h4>Summary</h4>
-                    <p>${caseData.case_summary}</p>
+                    <p>${escapeHtml(caseData.case_summary)}</p>
                 </div>
             ` : ''}
 
@@ -363,7 +381,7 @@ async function renderCaseDetail(caseId) {
                         ${caseData.tasks.map(t => `
                             <div class="item-card ${getUrgencyClass(t.urgency)}">
                                 <div class="item-card-main">
-                                    <div class="item-card-title">${t.description}</div>
+                                    <div class="item-card-title">${escapeHtml(t.description)}</div>
                                     <div class="item-card-details">
                                         ${t.due_date ? `<span class="detail-date">${formatDate(t.due_date)}</span>` : '<span class="detail-date no-date">No due date</span>'}
                                         ${getStatusBadge(t.status)}
@@ -397,9 +415,9 @@ async function renderCaseDetail(caseId) {
                                 <div class="item-card-main">
                                     <div class="item-card-title">
                                         ${e.starred ? '<span class="badge badge-starred">★</span>' : ''}
-                                        ${e.description}
+                                        ${escapeHtml(e.description)}
                                     </div>
-                                    ${e.calculation_note ? `<div class="item-card-note">${e.calculation_note}</div>` : ''}
+                                    ${e.calculation_note ? `<div class="item-card-note">${escapeHtml(e.calculation_note)}</div>` : ''}
                                     <div class="item-card-details">
                                         <span class="detail-date">${formatDate(e.date)}</span>
                                     </div>
@@ -427,17 +445,17 @@ async function renderCaseDetail(caseId) {
                     <div class="people-grid">
                         ${caseData.clients.map(c => `
                             <div class="person-card">
-                                <div class="person-avatar">${c.name.charAt(0).toUpperCase()}</div>
+                                <div class="person-avatar">${escapeHtml(c.name.charAt(0).toUpperCase())}</div>
                                 <div class="person-info">
                                     <div class="person-name">
-                                        ${c.name}
+                                        ${escapeHtml(c.name)}
                                         ${c.is_primary ? '<span class="badge badge-blue">Primary</span>' : ''}
                                     </div>
                                     <div class="person-details">
-                                        ${c.phone ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"></path></svg> ${c.phone}</div>` : ''}
-                                        ${c.email ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M4 4h16c1.1 0 2 .9 2 2v12c0 1.1-.9 2-2 2H4c-1.1 0-2-.9-2-2V6c0-1.1.9-2 2-2z"></path><polyline points="22,6 12,13 2,6"></polyline></svg> ${c.email}</div>` : ''}
+                                        ${c.phone ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"></path></svg> ${escapeHtml(c.phone)}</div>` : ''}
+                                        ${c.email ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M4 4h16c1.1 0 2 .9 2 2v12c0 1.1-.9 2-2 2H4c-1.1 0-2-.9-2-2V6c0-1.1.9-2 2-2z"></path><polyline points="22,6 12,13 2,6"></polyline></svg> ${escapeHtml(c.email)}</div>` : ''}
                                         <div class="person-contact-method">
-                                            ${c.contact_directly ? 'Contact directly' : `Contact via ${c.contact_via_name} (${c.contact_via_relationship})`}
+                                            ${c.contact_directly ? 'Contact directly' : `Contact via ${escapeHtml(c.contact_via_name)} (${escapeHtml(c.contact_via_relationship)})`}
                                         </div>
                                     </div>
                                 </div>
@@ -456,16 +474,16 @@ async function renderCaseDetail(caseId) {
                     <div class="people-grid">
                         ${caseData.contacts.map(c => `
                             <div class="person-card">
-                                <div class="person-avatar contact">${c.name.charAt(0).toUpperCase()}</div>
+                                <div class="person-avatar contact">${escapeHtml(c.name.charAt(0).toUpperCase())}</div>
                                 <div class="person-info">
                                     <div class="person-name">
-                                        ${c.name}
+                                        ${escapeHtml(c.name)}
                                         ${getStatusBadge(c.role)}
                                     </div>
-                                    ${c.firm ? `<div class="person-firm">${c.firm}</div>` : ''}
+                                    ${c.firm ? `<div class="person-firm">${escapeHtml(c.firm)}</div>` : ''}
                                     <div class="person-details">
-                                        ${c.phone ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"></path></svg> ${c.phone}</div>` : ''}
-                                        ${c.email ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M4 4h16c1.1 0 2 .9 2 2v12c0 1.1-.9 2-2 2H4c-1.1 0-2-.9-2-2V6c0-1.1.9-2 2-2z"></path><polyline points="22,6 12,13 2,6"></polyline></svg> ${c.email}</div>` : ''}
+                                        ${c.phone ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"></path></svg> ${escapeHtml(c.phone)}</div>` : ''}
+                                        ${c.email ? `<div class="person-detail"><svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" fill="none" stroke="currentColor" stroke-width="2"><path d="M4 4h16c1.1 0 2 .9 2 2v12c0 1.1-.9 2-2 2H4c-1.1 0-2-.9-2-2V6c0-1.1.9-2 2-2z"></path><polyline points="22,6 12,13 2,6"></polyline></svg> ${escapeHtml(c.email)}</div>` : ''}
                                     </div>
                                 </div>
                             </div>
@@ -490,7 +508,7 @@ async function renderCaseDetail(caseId) {
                                         <svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" fill="none" stroke="currentColor" stroke-width="2"><polyline points="3 6 5 6 21 6"></polyline><path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"></path></svg>
                                     </button>
                                 </div>
-                                <div class="note-content">${n.content}</div>
+                                <div class="note-content">${escapeHtml(n.content)}</div>
                             </div>
                         `).join('')}
                     </div>
@@ -537,9 +555,9 @@ async function renderTasks() {
             ${tasks.length ? tasks.map(t => `
                 <div class="list-item ${getUrgencyClass(t.urgency)} task-row" data-status="${t.status}" data-urgency="${t.urgency}">
                     <div class="list-item-main">
-                        <div class="list-item-title">${t.description}</div>
+                        <div class="list-item-title">${escapeHtml(t.description)}</div>
                         <div class="list-item-meta">
-                            <a href="#" class="meta-case" onclick="navigate('case', {id: ${t.case_id}}); return false;">${t.case_name}</a>
+                            <a href="#" class="meta-case" onclick="navigate('case', {id: ${t.case_id}}); return false;">${escapeHtml(t.case_name)}</a>
                             ${t.due_date ? `<span class="meta-date">${formatDate(t.due_date)}</span>` : '<span class="meta-date no-date">No due date</span>'}
                         </div>
                     </div>
@@ -585,10 +603,10 @@ async function renderCalendar() {
             ${events.length ? events.map(e => `
                 <div class="list-item event-row">
                     <div class="list-item-main">
-                        <div class="list-item-title">${e.description}</div>
-                        ${e.calculation_note ? `<div class="list-item-note">${e.calculation_note}</div>` : ''}
+                        <div class="list-item-title">${escapeHtml(e.description)}</div>
+                        ${e.calculation_note ? `<div class="list-item-note">${escapeHtml(e.calculation_note)}</div>` : ''}
                         <div class="list-item-meta">
-                            <a href="#" class="meta-case" onclick="navigate('case', {id: ${e.case_id}}); return false;">${e.case_name}</a>
+                            <a href="#" class="meta-case" onclick="navigate('case', {id: ${e.case_id}}); return false;">${escapeHtml(e.case_name)}</a>
                             <span class="meta-date">${formatDate(e.date)}</span>
                         </div>
                     </div>
@@ -637,7 +655,7 @@ async function openCaseModal(caseId = null) {
                 <input type="hidden" id="case-id" value="${caseId || ''}">
                 <div class="form-group">
                     <label>Case Name *</label>
-                    <input type="text" class="form-control" id="case-name" value="${caseData.case_name || ''}" required>
+                    <input type="text" class="form-control" id="case-name" value="${escapeHtml(caseData.case_name || '')}" required>
                 </div>
                 <div class="form-group">
                     <label>Status</label>
@@ -647,7 +665,7 @@ async function openCaseModal(caseId = null) {
                 </div>
                 <div class="form-group">
                     <label>Summary</label>
-                    <textarea class="form-control" id="case-summary">${caseData.case_summary || ''}</textarea>
+                    <textarea class="form-control" id="case-summary">${escapeHtml(caseData.case_summary || '')}</textarea>
                 </div>
                 <div class="form-row">
                     <div class="form-group">
@@ -733,7 +751,7 @@ async function openTaskModal(caseId, taskId = null) {
                 <input type="hidden" id="task-case-id" value="${caseId}">
                 <div class="form-group">
                     <label>Description *</label>
-                    <textarea class="form-control" id="task-description" required>${taskData.description || ''}</textarea>
+                    <textarea class="form-control" id="task-description" required>${escapeHtml(taskData.description || '')}</textarea>
                 </div>
                 <div class="form-row">
                     <div class="form-group">
@@ -817,7 +835,7 @@ async function openEventModal(caseId, eventId = null) {
                 <input type="hidden" id="event-case-id" value="${caseId}">
                 <div class="form-group">
                     <label>Description *</label>
-                    <textarea class="form-control" id="event-description" required>${eventData.description || ''}</textarea>
+                    <textarea class="form-control" id="event-description" required>${escapeHtml(eventData.description || '')}</textarea>
                 </div>
                 <div class="form-row">
                     <div class="form-group">
@@ -826,7 +844,7 @@ async function openEventModal(caseId, eventId = null) {
                     </div>
                     <div class="form-group">
                         <label>Calculation Note</label>
-                        <input type="text" class="form-control" id="event-calc" value="${eventData.calculation_note || ''}" placeholder="e.g., Filing + 60 days">
+                        <input type="text" class="form-control" id="event-calc" value="${escapeHtml(eventData.calculation_note || '')}" placeholder="e.g., Filing + 60 days">
                     </div>
                 </div>
                 <div class="form-group">
@@ -889,7 +907,7 @@ function openNoteModal(caseId) {
                 <input type="hidden" id="note-case-id" value="${caseId}">
                 <div class="form-group">
                     <label>Note Content *</label>
-                    <textarea class="form-control" id="note-content" required style="min-height: 150px;"></textarea>
+                    <textarea class="form-control note-editor" id="note-content" required></textarea>
                 </div>
             </form>
         </div>
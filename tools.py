@@ -4,7 +4,9 @@ MCP Tools for Legal Case Management
 All MCP tools in one file to encourage keeping the tool count small.
 """
 
-from datetime import datetime
+import asyncio
+import functools
+from datetime import datetime, date as dt_date
 from zoneinfo import ZoneInfo
 from typing import Optional, Literal
 from mcp.server.fastmcp import Context
@@ -31,6 +33,9 @@ ActivityType = Literal[
     "Phone Call", "Email", "Court Appearance", "Deposition", "Other"
 ]
 
+# Timezone for the date/time the assistant is told is "now"
+PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+
 PersonSide = Literal["plaintiff", "defendant", "neutral"]
 Urgency = Literal[1, 2, 3, 4]
 SearchEntity = Literal["cases", "tasks", "events", "persons"]
@@ -68,6 +73,22 @@ COMMON_ROLES = [
     "Witness", "Lien Holder"
 ]
 
+# Error message fragments, built once rather than per failed call
+URGENCY_LABELS = ["1 (Low)", "2 (Medium)", "3 (High)", "4 (Urgent)"]
+
+COMMON_PERSON_TYPES_HINT = f"Common types: {', '.join(COMMON_PERSON_TYPES)}"
+
+NOT_FOUND_SUGGESTIONS = {
+    "Case": "Use search(entity='cases') or list_cases() to find valid case IDs",
+    "Task": "Use get_tasks(case_id=N) to see tasks for a case",
+    "Event": "Use get_events(case_id=N) to see events for a case",
+    "Person": "Use search(entity='persons', query='...') to find the person_id",
+    "Note": "Use get_notes(case_id=N) to see notes for a case",
+    "Activity": "Use get_activities(case_id=N) to see activities for a case",
+    "Jurisdiction": "Use list_jurisdictions() to see available jurisdictions",
+    "Proceeding": "Use get_proceedings(case_id=N) to see proceedings for a case",
+}
+
 
 # =============================================================================
 # Error Helpers
@@ -91,19 +112,9 @@ def validation_error(message: str, valid_values=None, hint=None, suggestion=None
 
 
 def not_found_error(resource: str, hint=None, suggestion=None) -> dict:
-    default_suggestions = {
-        "Case": "Use search(entity='cases') or list_cases() to find valid case IDs",
-        "Task": "Use get_tasks(case_id=N) to see tasks for a case",
-        "Event": "Use get_events(case_id=N) to see events for a case",
-        "Person": "Use search(entity='persons', query='...') to find the person_id",
-        "Note": "Use get_notes(case_id=N) to see notes for a case",
-        "Activity": "Use get_activities(case_id=N) to see activities for a case",
-        "Jurisdiction": "Use list_jurisdictions() to see available jurisdictions",
-        "Proceeding": "Use get_proceedings(case_id=N) to see proceedings for a case",
-    }
     return error_response(
         f"{resource} not found", "NOT_FOUND",
-        hint=hint, suggestion=suggestion or default_suggestions.get(resource)
+        hint=hint, suggestion=suggestion or NOT_FOUND_SUGGESTIONS.get(resource)
     )
 
 
@@ -115,7 +126,7 @@ def invalid_status_error(status: str, status_type: str) -> dict:
 def invalid_urgency_error(urgency) -> dict:
     return validation_error(
         f"Invalid urgency: '{urgency}'",
-        valid_values=["1 (Low)", "2 (Medium)", "3 (High)", "4 (Urgent)"],
+        valid_values=URGENCY_LABELS,
         hint="Urgency must be an integer 1-4"
     )
 
@@ -132,6 +143,34 @@ def invalid_side_error(side: str) -> dict:
     return validation_error(f"Invalid side: '{side}'", valid_values=PERSON_SIDE_LIST)
 
 
+# check_fields() table: kind -> (validator(value, field_name), error builder(value, field_name))
+_FIELD_CHECKS = {
+    "case_status": (lambda v, f: db.validate_case_status(v), lambda v, f: invalid_status_error(v, "case")),
+    "task_status": (lambda v, f: db.validate_task_status(v), lambda v, f: invalid_status_error(v, "task")),
+    "urgency": (lambda v, f: db.validate_urgency(v), lambda v, f: invalid_urgency_error(v)),
+    "date": (db.validate_date_format, invalid_date_format_error),
+    "time": (db.validate_time_format, invalid_time_format_error),
+    "side": (lambda v, f: db.validate_person_side(v), lambda v, f: invalid_side_error(v)),
+}
+
+
+def check_fields(*checks) -> Optional[dict]:
+    """Validate (kind, field_name, value) triples in order.
+
+    Returns the error response for the first invalid value, or None if all
+    pass. None values (not provided) are skipped.
+    """
+    for kind, field_name, value in checks:
+        if value is None:
+            continue
+        validate, error = _FIELD_CHECKS[kind]
+        try:
+            validate(value, field_name)
+        except ValidationError:
+            return error(value, field_name)
+    return None
+
+
 def check_empty_required_field(value, field_name: str):
     if value == "":
         return validation_error(f"{field_name} cannot be empty")
@@ -150,8 +189,45 @@ def judge_role_on_case_error(role: str) -> dict:
 # Tool Registration
 # =============================================================================
 
-def register_tools(mcp):
-    """Register all MCP tools."""
+# Tool objects built by the first register_tools() call. Later servers (the
+# chat feature's metadata instance) reuse them instead of re-introspecting
+# every signature and regenerating every schema.
+_registered_tools: list = []
+
+
+def _in_worker_thread(fn):
+    """Wrap a sync tool function so each call runs in a worker thread."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return wrapper
+
+
+def register_tools(mcp, run_in_thread: bool = False):
+    """Register all MCP tools.
+
+    Schemas are generated once, on the first call; later calls add the
+    already-built tools to `mcp`. With run_in_thread, the server gets copies
+    whose (blocking psycopg2) bodies run via asyncio.to_thread, so one slow
+    tool call doesn't stall the event loop. The chat executor calls tool.fn
+    directly and needs the sync originals.
+    """
+    if not _registered_tools:
+        _define_tools(mcp)
+        _registered_tools.extend(mcp._tool_manager._tools.values())
+        if not run_in_thread:
+            return
+        for tool in _registered_tools:
+            mcp.remove_tool(tool.name)
+
+    for tool in _registered_tools:
+        if run_in_thread:
+            tool = tool.model_copy(update={"fn": _in_worker_thread(tool.fn)})
+        mcp.add_tool(tool)
+
+
+def _define_tools(mcp):
+    """Define every tool on `mcp` with the @mcp.tool() decorator."""
 
     # =========================================================================
     # TIME
@@ -161,14 +237,13 @@ def register_tools(mcp):
     def get_current_time(context: Context) -> dict:
         """Get current date/time in Pacific Time. Call at session start."""
         context.info("Getting current Pacific Time")
-        pacific = ZoneInfo("America/Los_Angeles")
-        now = datetime.now(pacific)
+        now = datetime.now(PACIFIC_TZ)
         return {
             "success": True,
             "date": now.strftime("%A, %B %d, %Y"),
             "time": now.strftime("%I:%M %p"),
             "year": now.year,
-            "iso_date": now.strftime("%Y-%m-%d"),
+            "iso_date": now.date().isoformat(),
             "timezone": "Pacific Time"
         }
 
@@ -217,15 +292,9 @@ def register_tools(mcp):
         short_name: Optional[str] = None
     ) -> dict:
         """Create a new case."""
-        try:
-            db.validate_case_status(status)
-        except ValidationError:
-            return invalid_status_error(status, "case")
-        if date_of_injury:
-            try:
-                db.validate_date_format(date_of_injury, "date_of_injury")
-            except ValidationError:
-                return invalid_date_format_error(date_of_injury, "date_of_injury")
+        if err := check_fields(("case_status", "status", status),
+                               ("date", "date_of_injury", date_of_injury or None)):
+            return err
         case = db.create_case(case_name, status, print_code, case_summary, result, date_of_injury, case_numbers, short_name)
         return {"success": True, "case": case}
 
@@ -243,16 +312,9 @@ def register_tools(mcp):
         case_numbers: Optional[list] = None
     ) -> dict:
         """Update case fields."""
-        if status:
-            try:
-                db.validate_case_status(status)
-            except ValidationError:
-                return invalid_status_error(status, "case")
-        if date_of_injury:
-            try:
-                db.validate_date_format(date_of_injury, "date_of_injury")
-            except ValidationError:
-                return invalid_date_format_error(date_of_injury, "date_of_injury")
+        if err := check_fields(("case_status", "status", status or None),
+                               ("date", "date_of_injury", date_of_injury or None)):
+            return err
         updated = db.update_case(case_id, case_name=case_name, short_name=short_name, status=status,
                                   print_code=print_code, case_summary=case_summary,
                                   result=result, date_of_injury=date_of_injury, case_numbers=case_numbers)
@@ -282,19 +344,10 @@ def register_tools(mcp):
         event_id: Optional[int] = None
     ) -> dict:
         """Add a task to a case. Tasks are internal work (vs events which are calendar items)."""
-        try:
-            db.validate_task_status(status)
-        except ValidationError:
-            return invalid_status_error(status, "task")
-        try:
-            db.validate_urgency(urgency)
-        except ValidationError:
-            return invalid_urgency_error(urgency)
-        if due_date:
-            try:
-                db.validate_date_format(due_date, "due_date")
-            except ValidationError:
-                return invalid_date_format_error(due_date, "due_date")
+        if err := check_fields(("task_status", "status", status),
+                               ("urgency", "urgency", urgency),
+                               ("date", "due_date", due_date or None)):
+            return err
         result = db.add_task(case_id, description, due_date, status, urgency, event_id)
         if not result:
             return not_found_error("Case")
@@ -322,41 +375,24 @@ def register_tools(mcp):
         completion_date: Optional[str] = None
     ) -> dict:
         """Update a task. Pass '' to clear optional date fields."""
+        if description == "":
+            return validation_error("description cannot be empty")
+        if err := check_fields(("task_status", "status", status),
+                               ("urgency", "urgency", urgency),
+                               ("date", "due_date", due_date or None),
+                               ("date", "completion_date", completion_date or None)):
+            return err
         kwargs = {}
         if description is not None:
-            if description == "":
-                return validation_error("description cannot be empty")
             kwargs['description'] = description
         if status is not None:
-            try:
-                db.validate_task_status(status)
-            except ValidationError:
-                return invalid_status_error(status, "task")
             kwargs['status'] = status
         if urgency is not None:
-            try:
-                db.validate_urgency(urgency)
-            except ValidationError:
-                return invalid_urgency_error(urgency)
             kwargs['urgency'] = urgency
         if due_date is not None:
-            if due_date == "":
-                kwargs['due_date'] = None
-            else:
-                try:
-                    db.validate_date_format(due_date, "due_date")
-                except ValidationError:
-                    return invalid_date_format_error(due_date, "due_date")
-                kwargs['due_date'] = due_date
+            kwargs['due_date'] = due_date or None
         if completion_date is not None:
-            if completion_date == "":
-                kwargs['completion_date'] = None
-            else:
-                try:
-                    db.validate_date_format(completion_date, "completion_date")
-                except ValidationError:
-                    return invalid_date_format_error(completion_date, "completion_date")
-                kwargs['completion_date'] = completion_date
+            kwargs['completion_date'] = completion_date or None
         if not kwargs:
             return validation_error("No fields to update")
         result = db.update_task_full(task_id, **kwargs)
@@ -374,10 +410,8 @@ def register_tools(mcp):
     @mcp.tool()
     def bulk_update_tasks(context: Context, task_ids: list, status: TaskStatus) -> dict:
         """Update multiple tasks to the same status."""
-        try:
-            db.validate_task_status(status)
-        except ValidationError:
-            return invalid_status_error(status, "task")
+        if err := check_fields(("task_status", "status", status)):
+            return err
         result = db.bulk_update_tasks(task_ids, status)
         return {"success": True, "updated": result["updated"]}
 
@@ -398,15 +432,8 @@ def register_tools(mcp):
         starred: bool = False
     ) -> dict:
         """Add an event (deadline, hearing, deposition) to a case."""
-        try:
-            db.validate_date_format(date, "date")
-        except ValidationError:
-            return invalid_date_format_error(date, "date")
-        if time:
-            try:
-                db.validate_time_format(time, "time")
-            except ValidationError:
-                return invalid_time_format_error(time, "time")
+        if err := check_fields(("date", "date", date), ("time", "time", time or None)):
+            return err
         result = db.add_event(case_id, date, description, document_link, calculation_note, time, location, starred)
         if not result:
             return not_found_error("Case")
@@ -416,10 +443,11 @@ def register_tools(mcp):
     def get_events(context: Context, case_id: Optional[int] = None) -> dict:
         """Get upcoming events, optionally filtered by case."""
         result = db.get_upcoming_events()
+        events = result["events"]
         if case_id:
-            result["events"] = [e for e in result["events"] if e["case_id"] == case_id]
-            result["total"] = len(result["events"])
-        return {"events": result["events"], "total": result["total"]}
+            events = [e for e in events if e["case_id"] == case_id]
+            return {"events": events, "total": len(events)}
+        return {"events": events, "total": result["total"]}
 
     @mcp.tool()
     def update_event(
@@ -434,28 +462,19 @@ def register_tools(mcp):
         starred: Optional[bool] = None
     ) -> dict:
         """Update an event. Pass '' to clear optional fields."""
+        if date == "":
+            return validation_error("date cannot be empty")
+        if description == "":
+            return validation_error("description cannot be empty")
+        if err := check_fields(("date", "date", date), ("time", "time", time or None)):
+            return err
         kwargs = {}
         if date is not None:
-            if date == "":
-                return validation_error("date cannot be empty")
-            try:
-                db.validate_date_format(date, "date")
-            except ValidationError:
-                return invalid_date_format_error(date, "date")
             kwargs['date'] = date
         if description is not None:
-            if description == "":
-                return validation_error("description cannot be empty")
             kwargs['description'] = description
         if time is not None:
-            if time == "":
-                kwargs['time'] = None
-            else:
-                try:
-                    db.validate_time_format(time, "time")
-                except ValidationError:
-                    return invalid_time_format_error(time, "time")
-                kwargs['time'] = time
+            kwargs['time'] = time or None
         if location is not None:
             kwargs['location'] = location if location != "" else None
         if document_link is not None:
@@ -506,7 +525,7 @@ def register_tools(mcp):
         try:
             db.validate_person_type(person_type)
         except ValidationError as e:
-            return validation_error(str(e), hint=f"Common types: {', '.join(COMMON_PERSON_TYPES)}")
+            return validation_error(str(e), hint=COMMON_PERSON_TYPES_HINT)
 
         if person_id:
             result = db.update_person(person_id, name=name, person_type=person_type, phones=phones,
@@ -544,16 +563,9 @@ def register_tools(mcp):
         """Link a person to a case with a role. Note: judges go on proceedings, not cases."""
         if role in ["Judge", "Magistrate Judge"]:
             return judge_role_on_case_error(role)
-        if side:
-            try:
-                db.validate_person_side(side)
-            except ValidationError:
-                return invalid_side_error(side)
-        if assigned_date:
-            try:
-                db.validate_date_format(assigned_date, "assigned_date")
-            except ValidationError:
-                return invalid_date_format_error(assigned_date, "assigned_date")
+        if err := check_fields(("side", "side", side or None),
+                               ("date", "assigned_date", assigned_date or None)):
+            return err
         result = db.assign_person_to_case(case_id=case_id, person_id=person_id, role=role, side=side,
                                            case_attributes=case_attributes, case_notes=case_notes,
                                            is_primary=is_primary, contact_via_person_id=contact_via_person_id,
@@ -617,6 +629,12 @@ def register_tools(mcp):
         result = db.get_activities(case_id)
         return {"success": True, "activities": result["activities"], "total": result["total"]}
 
+    @mcp.tool()
+    def get_activity_summary(context: Context, case_id: Optional[int] = None) -> dict:
+        """Get time totals: activity count and minutes logged per case, optionally for one case."""
+        result = db.get_activity_summary(case_id)
+        return {"success": True, "cases": result["cases"], "total_minutes": result["total_minutes"]}
+
     @mcp.tool()
     def log_activity(
         context: Context,
@@ -629,13 +647,9 @@ def register_tools(mcp):
         """Log a time/activity entry to a case."""
         if activity_type not in ACTIVITY_TYPE_LIST:
             return validation_error(f"Invalid activity_type: '{activity_type}'", valid_values=ACTIVITY_TYPE_LIST)
-        if date:
-            try:
-                db.validate_date_format(date, "date")
-            except ValidationError:
-                return invalid_date_format_error(date, "date")
+        if err := check_fields(("date", "date", date or None)):
+            return err
         if not date:
-            from datetime import date as dt_date
             date = dt_date.today().isoformat()
         result = db.add_activity(case_id, description, activity_type, date, minutes)
         if not result:
@@ -849,27 +863,17 @@ def register_tools(mcp):
         if entity == "cases":
             if not any([query, status]):
                 return validation_error("Provide query or status for case search")
-            if status:
-                try:
-                    db.validate_case_status(status)
-                except ValidationError:
-                    return invalid_status_error(status, "case")
+            if err := check_fields(("case_status", "status", status or None)):
+                return err
             cases = db.search_cases(query, None, None, status)
             return {"success": True, "entity": "cases", "results": cases, "total": len(cases)}
 
         elif entity == "tasks":
             if not any([query, case_id, status, urgency]):
                 return validation_error("Provide at least one filter for task search")
-            if status:
-                try:
-                    db.validate_task_status(status)
-                except ValidationError:
-                    return invalid_status_error(status, "task")
-            if urgency:
-                try:
-                    db.validate_urgency(urgency)
-                except ValidationError:
-                    return invalid_urgency_error(urgency)
+            if err := check_fields(("task_status", "status", status or None),
+                                   ("urgency", "urgency", urgency or None)):
+                return err
             tasks = db.search_tasks(query, case_id, status, urgency)
             return {"success": True, "entity": "tasks", "results": tasks, "total": len(tasks)}
 